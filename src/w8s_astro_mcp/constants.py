@@ -32,6 +32,10 @@ _PLANET_PAIRS: list[tuple[int, str]] = [
 PLANET_IDS:   list[int] = [p[0] for p in _PLANET_PAIRS]
 PLANET_NAMES: list[str] = [p[1] for p in _PLANET_PAIRS]
 
+# House keys in display order. Chart dicts key houses by these strings
+# ("1".."12"); iterating this tuple avoids sorting with int() per render.
+HOUSE_KEYS: tuple[str, ...] = tuple(str(n) for n in range(1, 13))
+
 # Maps full house system names to single-letter codes used by swe.houses().
 # Single-letter codes pass through unchanged (looked up as their own key).
 HOUSE_SYSTEM_CODES: dict[str, str] = {
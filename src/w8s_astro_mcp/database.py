@@ -11,6 +11,7 @@ Database location: ~/.w8s-astro-mcp/astro.db
 from pathlib import Path
 from typing import Generator
 from contextlib import contextmanager
+from weakref import WeakKeyDictionary
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
@@ -26,6 +27,22 @@ class DatabaseError(Exception):
     pass
 
 
+# Per-connection prepared-statement cache size for the sqlite3 driver.
+# SQLAlchemy renders identical SQL text for repeated queries, so the hot
+# helpers re-use a prepared statement instead of re-parsing it.
+SQLITE_STATEMENT_CACHE_SIZE = 256
+
+# One sessionmaker per engine, reused by every get_session() call.
+_session_factories: "WeakKeyDictionary[Engine, sessionmaker]" = WeakKeyDictionary()
+
+
+def _set_sqlite_pragma(dbapi_conn, connection_record):
+    """Enable foreign key constraints (disabled by default in SQLite)."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 def get_database_path() -> Path:
     """
     Get the path to the SQLite database file.
@@ -62,15 +79,13 @@ def create_db_engine(db_path: Path | None = None, echo: bool = False) -> Engine:
         # SQLite-specific optimizations
         connect_args={
             "check_same_thread": False,  # Allow multi-threaded access
+            "cached_statements": SQLITE_STATEMENT_CACHE_SIZE,
         },
     )
     
-    # Enable foreign key constraints (disabled by default in SQLite)
-    @event.listens_for(Engine, "connect")
-    def set_sqlite_pragma(dbapi_conn, connection_record):
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+    # Registered on this engine only: a listener on the Engine class would be
+    # added again (and run again per connection) on every create_db_engine().
+    event.listen(engine, "connect", _set_sqlite_pragma)
     
     return engine
 
@@ -95,11 +110,30 @@ def create_tables(engine: Engine) -> None:
         ConnectionPlanet, ConnectionHouse, ConnectionPoint,
     )
     Base.metadata.create_all(engine)
+    _add_missing_columns(engine)
+
+
+# Nullable columns added to existing tables after their first release.
+# create_all() never alters an existing table, so create_tables() adds these
+# to older databases itself: (table, column, SQL type).
+ADDED_COLUMNS = (
+    ("connection_charts", "rendered_text", "TEXT"),
+)
+
+
+def _add_missing_columns(engine: Engine) -> None:
+    """Add any ADDED_COLUMNS an existing database predates. Idempotent."""
+    with engine.begin() as conn:
+        for table, column, sql_type in ADDED_COLUMNS:
+            rows = conn.exec_driver_sql(f"PRAGMA table_info({table})").fetchall()
+            # No rows: table missing (nothing to upgrade); row[1] is the column name
+            if rows and column not in {row[1] for row in rows}:
+                conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {sql_type}")
 
 
 def get_session_factory(engine: Engine) -> sessionmaker:
     """
-    Create a session factory for the given engine.
+    Get the session factory for the given engine, creating it on first use.
     
     Args:
         engine: SQLAlchemy engine instance
@@ -107,7 +141,10 @@ def get_session_factory(engine: Engine) -> sessionmaker:
     Returns:
         Sessionmaker instance for creating sessions
     """
-    return sessionmaker(bind=engine, expire_on_commit=False)
+    factory = _session_factories.get(engine)
+    if factory is None:
+        factory = _session_factories[engine] = sessionmaker(bind=engine, expire_on_commit=False)
+    return factory
 
 
 @contextmanager
@@ -10,12 +10,14 @@ Design decisions:
   definition, not just metadata. The Davison chart IS cast for this moment/location.
 - ON DELETE CASCADE — removing a connection removes its charts (and child rows cascade)
 - chart_type is constrained to 'composite' or 'davison' at application layer
+- rendered_text caches the markdown position sections shown on a cache hit; it
+  is cleared whenever positions are saved or the chart is invalidated
 """
 
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import String, Float, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Text, Float, Boolean, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from w8s_astro_mcp.database import Base
@@ -61,6 +63,10 @@ class ConnectionChart(Base):
     calculation_method: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     ephemeris_version: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
+    # Rendered planet/house/point sections, filled on first cached read.
+    # Null means "render from connection_planets/houses/points".
+    rendered_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
     # Constraints
     __table_args__ = (
         # One composite and one Davison chart per connection
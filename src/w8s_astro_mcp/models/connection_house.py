@@ -18,6 +18,7 @@ from sqlalchemy import String, Float, Integer, DateTime, ForeignKey, Index, Uniq
 from sqlalchemy.orm import Mapped, mapped_column
 
 from w8s_astro_mcp.database import Base
+from w8s_astro_mcp.utils.position_utils import format_position
 
 
 class ConnectionHouse(Base):
@@ -105,4 +106,4 @@ class ConnectionHouse(Base):
     @property
     def formatted_position(self) -> str:
         """Human-readable position string (e.g., '15°24'36\" Taurus')."""
-        return f"{self.degree}°{self.minutes}'{int(self.seconds)}\" {self.sign}"
+        return format_position(self.degree, self.minutes, self.seconds, self.sign)
@@ -18,6 +18,7 @@ from sqlalchemy import String, Float, Integer, Boolean, DateTime, ForeignKey, In
 from sqlalchemy.orm import Mapped, mapped_column
 
 from w8s_astro_mcp.database import Base
+from w8s_astro_mcp.utils.position_utils import format_position
 
 
 class ConnectionPlanet(Base):
@@ -103,4 +104,4 @@ class ConnectionPlanet(Base):
     @property
     def formatted_position(self) -> str:
         """Human-readable position string (e.g., '15°24'36\" Taurus')."""
-        return f"{self.degree}°{self.minutes}'{int(self.seconds)}\" {self.sign}"
+        return format_position(self.degree, self.minutes, self.seconds, self.sign)
@@ -23,7 +23,7 @@ class HouseSystem(Base):
     Reference table for house calculation systems.
     
     Each row represents a different mathematical method for calculating houses.
-    The 'code' field matches the parameter passed to swetest -house flag.
+    The 'code' field matches the hsys byte passed to swe.houses().
     """
     
     __tablename__ = "house_systems"
@@ -31,7 +31,7 @@ class HouseSystem(Base):
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
     
-    # Swetest parameter code (e.g., "P" for Placidus, "W" for Whole Sign)
+    # Swiss Ephemeris house system code (e.g., "P" for Placidus, "W" for Whole Sign)
     code: Mapped[str] = mapped_column(String(1), unique=True, nullable=False, index=True)
     
     # Display name
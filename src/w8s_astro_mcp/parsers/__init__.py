@@ -1 +1 @@
-"""Parsers for swetest and other ephemeris data."""
+"""Parsers for ephemeris data."""
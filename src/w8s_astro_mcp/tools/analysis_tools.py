@@ -1,7 +1,13 @@
 """Analysis tools for astrological calculations."""
 
+import bisect
+import functools
 from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
+
+from ..constants import HOUSE_KEYS
+
 
 class AnalysisError(Exception):
     """Raised when analysis fails."""
@@ -37,6 +43,31 @@ ASPECTS = {
     "sesquiquadrate": {"angle": 135, "orb": 2}
 }
 
+# ASPECTS as parallel tuples (same order) for identify_aspect, plus float64
+# arrays of the same values for the vectorized compare_charts kernel
+_ASPECT_NAMES = tuple(ASPECTS)
+_ASPECT_ANGLES = tuple(a["angle"] for a in ASPECTS.values())
+_ASPECT_ORBS = tuple(a["orb"] for a in ASPECTS.values())
+_ASPECT_ANGLE_ARRAY = np.array(_ASPECT_ANGLES, dtype=np.float64)
+_ASPECT_ORB_ARRAY = np.array(_ASPECT_ORBS, dtype=np.float64)
+_ASPECT_TITLES = {name: name.title() for name in ASPECTS}
+
+# (angle, orb, name) sorted by angle, for identify_aspect's bisect lookup.
+# Below _DISJOINT_ORB_LIMIT no two scaled orb windows touch.
+_SORTED_ASPECTS = tuple(sorted(zip(_ASPECT_ANGLES, _ASPECT_ORBS, _ASPECT_NAMES)))
+_SORTED_ANGLES = tuple(a[0] for a in _SORTED_ASPECTS)
+_DISJOINT_ORB_LIMIT = min(
+    (a2[0] - a1[0]) / (a1[1] + a2[1])
+    for a1, a2 in zip(_SORTED_ASPECTS, _SORTED_ASPECTS[1:])
+)
+
+_HOUSE_KEY_SET = frozenset(HOUSE_KEYS)
+
+# Sign name -> index (Aries = 0) and each sign's starting longitude, for
+# converting body dicts into parallel degree/sign arrays
+_SIGN_INDEX = {sign: i for i, sign in enumerate(SIGN_POSITIONS)}
+_SIGN_OFFSETS = np.array(list(SIGN_POSITIONS.values()), dtype=np.float64)
+
 
 def get_absolute_position(degree: float, sign: str) -> float:
     """
@@ -69,11 +100,9 @@ def calculate_aspect_angle(pos1: float, pos2: float) -> float:
     Returns:
         Shortest angle in degrees (0-180)
     """
-    diff = abs(pos1 - pos2)
-    # Find shortest distance around circle
-    if diff > 180:
-        diff = 360 - diff
-    return diff
+    # Shortest distance around the circle, without a wrap branch
+    diff = (pos1 - pos2) % 360.0
+    return 180.0 - abs(diff - 180.0)
 
 
 def identify_aspect(angle: float, orb_multiplier: float = 1.0) -> Optional[Dict[str, Any]]:
@@ -88,9 +117,17 @@ def identify_aspect(angle: float, orb_multiplier: float = 1.0) -> Optional[Dict[
         Dict with aspect info or None if no aspect found
         Contains: name, exact_angle, actual_angle, orb, orb_used
     """
-    for aspect_name, aspect_data in ASPECTS.items():
-        exact_angle = aspect_data["angle"]
-        orb = aspect_data["orb"] * orb_multiplier
+    if orb_multiplier < _DISJOINT_ORB_LIMIT:
+        # Orb windows cannot overlap, so only the two aspects bracketing the
+        # angle can match — and at most one of them will.
+        i = bisect.bisect_left(_SORTED_ANGLES, angle)
+        candidates = _SORTED_ASPECTS[max(i - 1, 0):i + 1]
+    else:
+        # Wide orbs may overlap; the first match in ASPECTS order wins.
+        candidates = zip(_ASPECT_ANGLES, _ASPECT_ORBS, _ASPECT_NAMES)
+    
+    for exact_angle, base_orb, aspect_name in candidates:
+        orb = base_orb * orb_multiplier
         
         diff = abs(angle - exact_angle)
         if diff <= orb:
@@ -106,11 +143,134 @@ def identify_aspect(angle: float, orb_multiplier: float = 1.0) -> Optional[Dict[
     return None
 
 
+@functools.lru_cache(maxsize=16)
+def _scaled_orbs(orb_multiplier: float) -> np.ndarray:
+    """Return the read-only orb vector scaled by orb_multiplier (callers use a few values)."""
+    orbs = _ASPECT_ORB_ARRAY * orb_multiplier
+    orbs.flags.writeable = False
+    return orbs
+
+
+@functools.lru_cache(maxsize=16)
+def _aspect_possible(orb_multiplier: float) -> np.ndarray:
+    """
+    Return a 181-entry table: True at d if any scaled orb window meets [d, d+1].
+
+    An angle whose int() bucket is False cannot form any aspect.
+    """
+    buckets = np.arange(181.0)[:, None]
+    orbs = _scaled_orbs(orb_multiplier)
+    table = (
+        (_ASPECT_ANGLE_ARRAY - orbs <= buckets + 1.0)
+        & (_ASPECT_ANGLE_ARRAY + orbs >= buckets)
+    ).any(axis=1)
+    table.flags.writeable = False
+    return table
+
+
+def _match_angles(
+    angles: np.ndarray, orb_multiplier: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Test a flat array of shortest angles against every aspect.
+
+    Returns:
+        (idx, kinds, orbs) — indices of matching angles in ascending order,
+        index into _ASPECT_NAMES (first match in ASPECTS order), and orb.
+    """
+    # Reject angles whose whole-degree bucket no orb window reaches, then
+    # test only the survivors against every aspect.
+    idx = np.flatnonzero(_aspect_possible(orb_multiplier)[angles.astype(np.intp)])
+    orb_diffs = np.abs(angles[idx, None] - _ASPECT_ANGLE_ARRAY)
+    hits = orb_diffs <= _scaled_orbs(orb_multiplier)
+
+    matched = hits.any(axis=-1)
+    idx, hits, orb_diffs = idx[matched], hits[matched], orb_diffs[matched]
+    kinds = hits.argmax(axis=-1)
+    orbs = orb_diffs[np.arange(kinds.size), kinds]
+    return idx, kinds, orbs
+
+
+def _match_aspects(
+    pos1: np.ndarray, pos2: np.ndarray, orb_multiplier: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aspect-matching kernel: test every (pos1[i], pos2[j]) pair at once.
+
+    Uses the same math as calculate_aspect_angle + identify_aspect. argmax
+    picks the first matching aspect in ASPECTS order.
+
+    When both sides hold the same positions (a chart compared with itself)
+    the angle matrix is symmetric, so only the upper triangle is tested and
+    matches are mirrored into the lower one.
+
+    Returns:
+        (angles, pair_i, pair_j, kinds, orbs) — the full N×M shortest-angle
+        matrix, then parallel arrays for matching pairs in row-major order:
+        indices into pos1/pos2, index into _ASPECT_NAMES, and orb.
+    """
+    n = pos1.size
+    if pos2 is pos1 or (pos2.size == n and np.array_equal(pos1, pos2)):
+        iu, ju = np.triu_indices(n)
+        upper = 180.0 - np.abs((pos1[iu] - pos1[ju]) % 360.0 - 180.0)
+        angles = np.empty((n, n))
+        angles[iu, ju] = upper
+        angles[ju, iu] = upper
+
+        idx, kinds, orbs = _match_angles(upper, orb_multiplier)
+        i, j = iu[idx], ju[idx]
+        off = i != j
+        pair_i = np.concatenate((i, j[off]))
+        pair_j = np.concatenate((j, i[off]))
+        order = np.lexsort((pair_j, pair_i))
+        kinds = np.concatenate((kinds, kinds[off]))[order]
+        orbs = np.concatenate((orbs, orbs[off]))[order]
+        return angles, pair_i[order], pair_j[order], kinds, orbs
+
+    angles = 180.0 - np.abs((pos1[:, None] - pos2[None, :]) % 360.0 - 180.0)
+    idx, kinds, orbs = _match_angles(angles.ravel(), orb_multiplier)
+    pair_i, pair_j = np.divmod(idx, pos2.size)
+    return angles, pair_i, pair_j, kinds, orbs
+
+
+def _positioned_bodies(bodies: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Return (name, position) for each body with degree + sign.
+
+    position is the {"degree", "sign", "absolute"} dict compare_charts
+    reports. It is built once per body and shared by every aspect that body
+    forms, rather than rebuilt per aspect.
+
+    Charts from EphemerisEngine already carry "absolute_position"; it is
+    reused as-is. Otherwise get_absolute_position's lookup is inlined so
+    compare_charts makes no per-body function call.
+
+    Raises:
+        AnalysisError: If a sign is not recognized
+    """
+    sign_positions = SIGN_POSITIONS
+    positioned = []
+    for name, data in bodies.items():
+        if "degree" not in data or "sign" not in data:
+            continue
+        absolute = data.get("absolute_position")
+        if absolute is None:
+            try:
+                absolute = sign_positions[data["sign"]] + data["degree"]
+            except KeyError:
+                raise AnalysisError(f"Unknown zodiac sign: {data['sign']}") from None
+        positioned.append(
+            (name, {"degree": data["degree"], "sign": data["sign"], "absolute": absolute})
+        )
+    return positioned
+
+
 def compare_charts(
     chart1: Dict[str, Any],
     chart2: Dict[str, Any],
     orb_multiplier: float = 1.0,
-    planets_only: bool = True
+    planets_only: bool = True,
+    summary_only: bool = False
 ) -> Dict[str, Any]:
     """
     Calculate aspects between two charts (synastry or transits).
@@ -120,6 +280,8 @@ def compare_charts(
         chart2: Second chart data (transit or natal)
         orb_multiplier: Multiplier for aspect orbs (default 1.0)
         planets_only: If True, only compare planets (default True)
+        summary_only: If True, only count aspects; "aspects" is left empty
+            and no per-aspect dicts are built (default False)
     
     Returns:
         Dictionary containing:
@@ -139,6 +301,7 @@ def compare_charts(
         }
     """
     aspects = []
+    total_aspects = 0
     
     # Get bodies to compare
     chart1_bodies = {}
@@ -157,48 +320,36 @@ def compare_charts(
         if "points" in chart2:
             chart2_bodies.update(chart2["points"])
     
-    # Calculate all aspects
-    for body1_name, body1_data in chart1_bodies.items():
-        if "degree" not in body1_data or "sign" not in body1_data:
-            continue
-            
-        pos1 = get_absolute_position(body1_data["degree"], body1_data["sign"])
-        
-        for body2_name, body2_data in chart2_bodies.items():
-            if "degree" not in body2_data or "sign" not in body2_data:
-                continue
-            
-            pos2 = get_absolute_position(body2_data["degree"], body2_data["sign"])
-            
-            # Calculate angle
-            angle = calculate_aspect_angle(pos1, pos2)
-            
-            # Check if it forms an aspect
-            aspect_info = identify_aspect(angle, orb_multiplier)
-            
-            if aspect_info:
-                aspects.append({
-                    "body1": body1_name,
-                    "body1_position": {
-                        "degree": body1_data["degree"],
-                        "sign": body1_data["sign"],
-                        "absolute": pos1
-                    },
-                    "body2": body2_name,
-                    "body2_position": {
-                        "degree": body2_data["degree"],
-                        "sign": body2_data["sign"],
-                        "absolute": pos2
-                    },
-                    "aspect": aspect_info["name"],
-                    "exact_angle": aspect_info["exact_angle"],
-                    "actual_angle": aspect_info["actual_angle"],
-                    "orb": aspect_info["orb"],
-                    "orb_used": aspect_info["orb_used"]
-                })
-    
-    # Sort by orb (tightest first)
-    aspects.sort(key=lambda x: x["orb"])
+    # Resolve absolute positions once per body
+    bodies1 = _positioned_bodies(chart1_bodies)
+    bodies2 = _positioned_bodies(chart2_bodies) if bodies1 else []
+
+    if bodies2:
+        pos1 = np.fromiter((b[1]["absolute"] for b in bodies1), dtype=np.float64,
+                           count=len(bodies1))
+        pos2 = np.fromiter((b[1]["absolute"] for b in bodies2), dtype=np.float64,
+                           count=len(bodies2))
+        angles, pair_i, pair_j, kinds, orbs = _match_aspects(pos1, pos2, orb_multiplier)
+        total_aspects = int(orbs.size)
+
+    if bodies2 and not summary_only:
+        # Sort by orb (tightest first) before building any result dicts.
+        # A stable sort keeps chart1 x chart2 order among equal orbs.
+        for n in np.argsort(orbs, kind="stable"):
+            i, j, k = pair_i[n], pair_j[n], kinds[n]
+            body1_name, body1_position = bodies1[i]
+            body2_name, body2_position = bodies2[j]
+            aspects.append({
+                "body1": body1_name,
+                "body1_position": body1_position,
+                "body2": body2_name,
+                "body2_position": body2_position,
+                "aspect": _ASPECT_NAMES[k],
+                "exact_angle": _ASPECT_ANGLES[k],
+                "actual_angle": float(angles[i, j]),
+                "orb": float(orbs[n]),
+                "orb_used": _ASPECT_ORBS[k] * orb_multiplier
+            })
     
     return {
         "aspects": aspects,
@@ -207,11 +358,43 @@ def compare_charts(
             "chart2_date": chart2.get("metadata", {}).get("date", "unknown"),
             "orb_multiplier": orb_multiplier,
             "planets_only": planets_only,
-            "total_aspects": len(aspects)
+            "summary_only": summary_only,
+            "total_aspects": total_aspects
         }
     }
 
 
+def _bodies_to_arrays(
+    bodies: Dict[str, Any]
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Split {name: {"degree", "sign"}} into parallel names/degrees/sign-index arrays.
+
+    Bodies without degree + sign are skipped. Absolute positions are then
+    _SIGN_OFFSETS[sign_idx] + degrees in one vector operation.
+
+    Raises:
+        AnalysisError: If a sign is not recognized
+    """
+    names = []
+    degrees = []
+    sign_idx = []
+    for name, data in bodies.items():
+        if "degree" not in data or "sign" not in data:
+            continue
+        try:
+            sign_idx.append(_SIGN_INDEX[data["sign"]])
+        except KeyError:
+            raise AnalysisError(f"Unknown zodiac sign: {data['sign']}") from None
+        names.append(name)
+        degrees.append(data["degree"])
+    return (
+        names,
+        np.array(degrees, dtype=np.float64),
+        np.array(sign_idx, dtype=np.intp),
+    )
+
+
 def find_planets_in_houses(
     planets: Dict[str, Any],
     houses: Dict[str, Any]
@@ -236,82 +419,63 @@ def find_planets_in_houses(
         Otherwise calculates based on cusp positions.
     """
     placements = {}
-    houses_populated = {str(i): [] for i in range(1, 13)}
-    
-    # Convert house cusps to absolute positions
-    house_positions = []
+    # Planets per house, indexed by house_num - 1; keyed by HOUSE_KEYS on return
+    buckets = [[] for _ in HOUSE_KEYS]
     
     # Debug: Check what keys we actually have
     if not houses:
         raise AnalysisError("Houses dictionary is empty")
     
-    for house_num in range(1, 13):
-        house_key = str(house_num)  # Always use string keys
-        
-        if house_key not in houses:
-            # Debug info about available keys
-            available_keys = list(houses.keys())
-            key_types = {type(k).__name__ for k in available_keys}
-            sample_keys = available_keys[:3]
-            raise AnalysisError(
-                f"Missing house cusp for house {house_num}. "
-                f"Available keys (sample): {sample_keys}, "
-                f"Key types: {key_types}, "
-                f"Total houses: {len(available_keys)}"
-            )
-        
+    missing = _HOUSE_KEY_SET.difference(houses.keys())
+    if missing:
+        # Debug info about available keys
+        available_keys = list(houses.keys())
+        key_types = {type(k).__name__ for k in available_keys}
+        sample_keys = available_keys[:3]
+        raise AnalysisError(
+            f"Missing house cusp for house {min(missing, key=int)}. "
+            f"Available keys (sample): {sample_keys}, "
+            f"Key types: {key_types}, "
+            f"Total houses: {len(available_keys)}"
+        )
+    
+    cusp_data = {}
+    for house_num, house_key in enumerate(HOUSE_KEYS, start=1):
         house_data = houses[house_key]
         if "degree" not in house_data or "sign" not in house_data:
             raise AnalysisError(f"Invalid house data for house {house_num}")
-        
-        abs_pos = get_absolute_position(house_data["degree"], house_data["sign"])
-        house_positions.append({
-            "number": house_num,
-            "position": abs_pos,
-            "sign": house_data["sign"]
-        })
+        cusp_data[house_num] = house_data
     
-    # Sort houses by position to handle wrapping
-    house_positions.sort(key=lambda x: x["position"])
+    # Convert cusps and planets to absolute positions (one vector op each)
+    cusp_nums, cusp_degrees, cusp_signs = _bodies_to_arrays(cusp_data)
+    planet_names, planet_degrees, planet_signs = _bodies_to_arrays(planets)
+    cusp_positions = _SIGN_OFFSETS[cusp_signs] + cusp_degrees
+    planet_positions = _SIGN_OFFSETS[planet_signs] + planet_degrees
     
-    # Find which house each planet is in
-    for planet_name, planet_data in planets.items():
-        if "degree" not in planet_data or "sign" not in planet_data:
-            continue
-        
-        planet_pos = get_absolute_position(planet_data["degree"], planet_data["sign"])
-        
-        # Find the house by determining which house cusp is before this planet
-        house_num = None
-        
-        for i, house_info in enumerate(house_positions):
-            next_house = house_positions[(i + 1) % 12]
-            
-            # Handle wrapping at 360/0 degrees
-            if house_info["position"] < next_house["position"]:
-                # Normal case: planet between this cusp and next
-                if house_info["position"] <= planet_pos < next_house["position"]:
-                    house_num = house_info["number"]
-                    break
-            else:
-                # Wrapping case: house crosses 0 degrees
-                if planet_pos >= house_info["position"] or planet_pos < next_house["position"]:
-                    house_num = house_info["number"]
-                    break
-        
-        if house_num is None:
-            # Fallback: assign to first house
-            house_num = 1
-        
+    # Sort houses by position to handle wrapping
+    order = np.argsort(cusp_positions, kind="stable")
+    cusps = cusp_positions[order]
+    cusp_houses = [cusp_nums[i] for i in order]
+
+    # Each planet belongs to the last cusp at or before it. A planet before
+    # the lowest cusp gets index -1, which is the house that wraps through 0°.
+    cusp_idx = np.searchsorted(cusps, planet_positions, side="right") - 1
+
+    houses_with_planets = 0
+    for planet_name, idx in zip(planet_names, cusp_idx.tolist()):
+        house_num = cusp_houses[idx]
         placements[planet_name] = house_num
-        houses_populated[str(house_num)].append(planet_name)
+        bucket = buckets[house_num - 1]
+        if not bucket:
+            houses_with_planets += 1
+        bucket.append(planet_name)
     
     return {
         "placements": placements,
-        "houses_populated": houses_populated,
+        "houses_populated": dict(zip(HOUSE_KEYS, buckets)),
         "metadata": {
             "total_planets": len(placements),
-            "houses_with_planets": sum(1 for planets in houses_populated.values() if planets)
+            "houses_with_planets": houses_with_planets
         }
     }
 
@@ -326,35 +490,39 @@ def format_aspect_report(comparison_result: Dict[str, Any]) -> str:
     Returns:
         Formatted string report
     """
-    report = "# Aspect Analysis\n\n"
-    
     metadata = comparison_result["metadata"]
-    report += f"Chart 1: {metadata['chart1_date']}\n"
-    report += f"Chart 2: {metadata['chart2_date']}\n"
-    report += f"Total Aspects Found: {metadata['total_aspects']}\n"
-    report += f"Orb Multiplier: {metadata['orb_multiplier']}\n\n"
+    parts = [
+        "# Aspect Analysis\n\n",
+        f"Chart 1: {metadata['chart1_date']}\n",
+        f"Chart 2: {metadata['chart2_date']}\n",
+        f"Total Aspects Found: {metadata['total_aspects']}\n",
+        f"Orb Multiplier: {metadata['orb_multiplier']}\n\n",
+    ]
+    
+    if metadata.get("summary_only") and metadata["total_aspects"]:
+        return "".join(parts)
     
     if not comparison_result["aspects"]:
-        report += "No aspects found within orb limits.\n"
-        return report
+        parts.append("No aspects found within orb limits.\n")
+        return "".join(parts)
     
-    report += "## Aspects (sorted by tightness)\n\n"
+    parts.append("## Aspects (sorted by tightness)\n\n")
     
     for aspect in comparison_result["aspects"]:
         body1 = aspect["body1"]
         body2 = aspect["body2"]
-        aspect_name = aspect["aspect"].title()
-        orb = aspect["orb"]
-        
+        aspect_name = _ASPECT_TITLES.get(aspect["aspect"]) or aspect["aspect"].title()
         pos1 = aspect["body1_position"]
         pos2 = aspect["body2_position"]
         
-        report += f"**{body1}** {aspect_name} **{body2}**\n"
-        report += f"  {body1}: {pos1['degree']:.2f}° {pos1['sign']}\n"
-        report += f"  {body2}: {pos2['degree']:.2f}° {pos2['sign']}\n"
-        report += f"  Orb: {orb:.2f}°\n\n"
-    
-    return report
+        parts.append(
+            f"**{body1}** {aspect_name} **{body2}**\n"
+            f"  {body1}: {pos1['degree']:.2f}° {pos1['sign']}\n"
+            f"  {body2}: {pos2['degree']:.2f}° {pos2['sign']}\n"
+            f"  Orb: {aspect['orb']:.2f}°\n\n"
+        )
+    
+    return "".join(parts)
 
 
 def format_house_report(house_result: Dict[str, Any]) -> str:
@@ -367,27 +535,23 @@ def format_house_report(house_result: Dict[str, Any]) -> str:
     Returns:
         Formatted string report
     """
-    report = "# House Placements\n\n"
-    
     metadata = house_result["metadata"]
-    report += f"Total Planets: {metadata['total_planets']}\n"
-    report += f"Houses with Planets: {metadata['houses_with_planets']}\n\n"
-    
-    report += "## By House\n\n"
+    parts = [
+        "# House Placements\n\n",
+        f"Total Planets: {metadata['total_planets']}\n",
+        f"Houses with Planets: {metadata['houses_with_planets']}\n\n",
+        "## By House\n\n",
+    ]
     
     for house_num in range(1, 13):
-        house_key = str(house_num)
-        planets = house_result["houses_populated"][house_key]
-        
-        if planets:
-            planet_list = ", ".join(planets)
-            report += f"**House {house_num}**: {planet_list}\n"
-        else:
-            report += f"**House {house_num}**: (empty)\n"
-    
-    report += "\n## By Planet\n\n"
+        planets = house_result["houses_populated"][str(house_num)]
+        planet_list = ", ".join(planets) if planets else "(empty)"
+        parts.append(f"**House {house_num}**: {planet_list}\n")
     
-    for planet, house_num in sorted(house_result["placements"].items()):
-        report += f"**{planet}**: House {house_num}\n"
+    parts.append("\n## By Planet\n\n")
+    parts.extend(
+        f"**{planet}**: House {house_num}\n"
+        for planet, house_num in sorted(house_result["placements"].items())
+    )
     
-    return report
+    return "".join(parts)
@@ -13,150 +13,154 @@ from mcp.types import Tool, TextContent
 # Tool Definitions
 # ============================================================================
 
-def get_connection_tools() -> list[Tool]:
-    """Return list of connection management tool definitions."""
-    return [
-        Tool(
-            name="create_connection",
-            description=(
-                "Create a new connection between two or more profiles for synastry "
-                "or composite/Davison chart analysis. "
-                "Requires at least 2 profile IDs. "
-                "Use list_profiles to find profile IDs first."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "label": {
-                        "type": "string",
-                        "description": "Name for this connection (e.g., 'Alice & Bob', 'Family Trio')"
-                    },
-                    "profile_ids": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "List of profile IDs to include (minimum 2)",
-                        "minItems": 2
-                    },
-                    "type": {
-                        "type": "string",
-                        "description": "Optional connection type (e.g., 'romantic', 'family', 'business')"
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Optional date the relationship began (YYYY-MM-DD)"
-                    }
+# Tool definitions are immutable MCP metadata: built once at import.
+_CONNECTION_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="create_connection",
+        description=(
+            "Create a new connection between two or more profiles for synastry "
+            "or composite/Davison chart analysis. "
+            "Requires at least 2 profile IDs. "
+            "Use list_profiles to find profile IDs first."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "label": {
+                    "type": "string",
+                    "description": "Name for this connection (e.g., 'Alice & Bob', 'Family Trio')"
+                },
+                "profile_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "List of profile IDs to include (minimum 2)",
+                    "minItems": 2
                 },
-                "required": ["label", "profile_ids"]
-            }
+                "type": {
+                    "type": "string",
+                    "description": "Optional connection type (e.g., 'romantic', 'family', 'business')"
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Optional date the relationship began (YYYY-MM-DD)"
+                }
+            },
+            "required": ["label", "profile_ids"]
+        }
+    ),
+    Tool(
+        name="list_connections",
+        description=(
+            "List all connections with their member names and IDs. "
+            "Use this to find connection IDs before requesting charts."
         ),
-        Tool(
-            name="list_connections",
-            description=(
-                "List all connections with their member names and IDs. "
-                "Use this to find connection IDs before requesting charts."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="add_connection_member",
+        description=(
+            "Add a profile to an existing connection. "
+            "Note: adding a member invalidates any cached charts for this connection."
         ),
-        Tool(
-            name="add_connection_member",
-            description=(
-                "Add a profile to an existing connection. "
-                "Note: adding a member invalidates any cached charts for this connection."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "connection_id": {
-                        "type": "integer",
-                        "description": "Connection ID (from list_connections)"
-                    },
-                    "profile_id": {
-                        "type": "integer",
-                        "description": "Profile ID to add (from list_profiles)"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "connection_id": {
+                    "type": "integer",
+                    "description": "Connection ID (from list_connections)"
                 },
-                "required": ["connection_id", "profile_id"]
-            }
+                "profile_id": {
+                    "type": "integer",
+                    "description": "Profile ID to add (from list_profiles)"
+                }
+            },
+            "required": ["connection_id", "profile_id"]
+        }
+    ),
+    Tool(
+        name="remove_connection_member",
+        description=(
+            "Remove a profile from a connection. "
+            "Connection must retain at least 2 members. "
+            "Note: removing a member invalidates any cached charts."
         ),
-        Tool(
-            name="remove_connection_member",
-            description=(
-                "Remove a profile from a connection. "
-                "Connection must retain at least 2 members. "
-                "Note: removing a member invalidates any cached charts."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "connection_id": {
-                        "type": "integer",
-                        "description": "Connection ID (from list_connections)"
-                    },
-                    "profile_id": {
-                        "type": "integer",
-                        "description": "Profile ID to remove"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "connection_id": {
+                    "type": "integer",
+                    "description": "Connection ID (from list_connections)"
                 },
-                "required": ["connection_id", "profile_id"]
-            }
+                "profile_id": {
+                    "type": "integer",
+                    "description": "Profile ID to remove"
+                }
+            },
+            "required": ["connection_id", "profile_id"]
+        }
+    ),
+    Tool(
+        name="get_connection_chart",
+        description=(
+            "Calculate (or retrieve cached) a composite or Davison chart for a connection.\n\n"
+            "COMPOSITE: Each planet position is the circular mean of all members' natal positions. "
+            "No ephemeris call needed — pure math on cached natal data.\n\n"
+            "DAVISON: A real chart cast for the midpoint datetime and location of all members' births. "
+            "Requires an ephemeris calculation. Birth times are converted to UTC before averaging, "
+            "so timezone data in each profile's birth location is used.\n\n"
+            "Results are cached in the database. Use invalidate=true to force recalculation."
         ),
-        Tool(
-            name="get_connection_chart",
-            description=(
-                "Calculate (or retrieve cached) a composite or Davison chart for a connection.\n\n"
-                "COMPOSITE: Each planet position is the circular mean of all members' natal positions. "
-                "No swetest call needed — pure math on cached natal data.\n\n"
-                "DAVISON: A real chart cast for the midpoint datetime and location of all members' births. "
-                "Requires a swetest call. Birth times are converted to UTC before averaging, "
-                "so timezone data in each profile's birth location is used.\n\n"
-                "Results are cached in the database. Use invalidate=true to force recalculation."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "connection_id": {
-                        "type": "integer",
-                        "description": "Connection ID (from list_connections)"
-                    },
-                    "chart_type": {
-                        "type": "string",
-                        "enum": ["composite", "davison"],
-                        "description": "Type of chart to calculate"
-                    },
-                    "invalidate": {
-                        "type": "boolean",
-                        "description": "Force recalculation even if cached (default: false)"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "connection_id": {
+                    "type": "integer",
+                    "description": "Connection ID (from list_connections)"
                 },
-                "required": ["connection_id", "chart_type"]
-            }
-        ),
-        Tool(
-            name="delete_connection",
-            description=(
-                "Delete a connection and all its cached charts. "
-                "WARNING: Permanent and cannot be undone. "
-                "Does not affect the member profiles themselves."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "connection_id": {
-                        "type": "integer",
-                        "description": "Connection ID to delete"
-                    },
-                    "confirm": {
-                        "type": "boolean",
-                        "description": "Must be true to confirm deletion"
-                    }
+                "chart_type": {
+                    "type": "string",
+                    "enum": ["composite", "davison"],
+                    "description": "Type of chart to calculate"
                 },
-                "required": ["connection_id", "confirm"]
-            }
+                "invalidate": {
+                    "type": "boolean",
+                    "description": "Force recalculation even if cached (default: false)"
+                }
+            },
+            "required": ["connection_id", "chart_type"]
+        }
+    ),
+    Tool(
+        name="delete_connection",
+        description=(
+            "Delete a connection and all its cached charts. "
+            "WARNING: Permanent and cannot be undone. "
+            "Does not affect the member profiles themselves."
         ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "connection_id": {
+                    "type": "integer",
+                    "description": "Connection ID to delete"
+                },
+                "confirm": {
+                    "type": "boolean",
+                    "description": "Must be true to confirm deletion"
+                }
+            },
+            "required": ["connection_id", "confirm"]
+        }
+    ),
+)
+
+
+def get_connection_tools() -> list[Tool]:
+    """Return list of connection management tool definitions."""
+    return list(_CONNECTION_TOOLS)
 
 
 # ============================================================================
@@ -176,15 +180,10 @@ async def handle_create_connection(db_helper, arguments: dict) -> list[TextConte
         if len(profile_ids) < 2:
             return [TextContent(type="text", text="Error: at least 2 profile_ids are required")]
 
-        # Verify all profiles exist
-        missing = []
-        profiles = []
-        for pid in profile_ids:
-            p = db_helper.get_profile_by_id(pid)
-            if not p:
-                missing.append(pid)
-            else:
-                profiles.append(p)
+        # Verify all profiles exist (one query for the whole list)
+        profiles = db_helper.get_profiles_by_ids(profile_ids)
+        found_ids = {p.id for p in profiles}
+        missing = [pid for pid in profile_ids if pid not in found_ids]
         if missing:
             return [TextContent(type="text", text=f"Error: profile(s) not found: {missing}")]
 
@@ -197,16 +196,16 @@ async def handle_create_connection(db_helper, arguments: dict) -> list[TextConte
         )
 
         member_names = ", ".join(p.name for p in profiles)
-        response = f"✓ Connection created!\n\n"
-        response += f"**{connection.label}** (ID: {connection.id})\n"
+        parts = [f"✓ Connection created!\n\n"]
+        parts.append(f"**{connection.label}** (ID: {connection.id})\n")
         if conn_type:
-            response += f"Type: {conn_type}\n"
+            parts.append(f"Type: {conn_type}\n")
         if start_date:
-            response += f"Since: {start_date}\n"
-        response += f"Members: {member_names}\n\n"
-        response += f"Use get_connection_chart with connection_id={connection.id} to calculate a chart."
+            parts.append(f"Since: {start_date}\n")
+        parts.append(f"Members: {member_names}\n\n")
+        parts.append(f"Use get_connection_chart with connection_id={connection.id} to calculate a chart.")
 
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text="".join(parts))]
 
     except Exception as e:
         return [TextContent(type="text", text=f"Error creating connection: {e}")]
@@ -215,7 +214,7 @@ async def handle_create_connection(db_helper, arguments: dict) -> list[TextConte
 async def handle_list_connections(db_helper) -> list[TextContent]:
     """List all connections with member names."""
     try:
-        connections = db_helper.list_all_connections()
+        connections = db_helper.list_connection_summaries()
 
         if not connections:
             return [TextContent(
@@ -223,19 +222,17 @@ async def handle_list_connections(db_helper) -> list[TextContent]:
                 text="No connections found.\n\nUse create_connection to add one."
             )]
 
-        response = "# Connections\n\n"
-        for conn in connections:
-            members = db_helper.get_connection_members(conn)
-            member_names = ", ".join(m.name for m in members)
-            response += f"**{conn.label}** (ID: {conn.id})\n"
+        parts = ["# Connections\n\n"]
+        for conn, member_names in connections:
+            parts.append(f"**{conn.label}** (ID: {conn.id})\n")
             if conn.type:
-                response += f"  Type: {conn.type}\n"
-            response += f"  Members: {member_names}\n"
+                parts.append(f"  Type: {conn.type}\n")
+            parts.append(f"  Members: {member_names}\n")
             if conn.start_date:
-                response += f"  Since: {conn.start_date}\n"
-            response += "\n"
+                parts.append(f"  Since: {conn.start_date}\n")
+            parts.append("\n")
 
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text="".join(parts))]
 
     except Exception as e:
         return [TextContent(type="text", text=f"Error listing connections: {e}")]
@@ -250,16 +247,16 @@ async def handle_add_connection_member(db_helper, arguments: dict) -> list[TextC
         if connection_id is None or profile_id is None:
             return [TextContent(type="text", text="Error: connection_id and profile_id are required")]
 
-        connection = db_helper.get_connection_by_id(connection_id)
+        connection, profile, member_count = db_helper.fetch_connection_mutation_context(
+            connection_id, profile_id
+        )
         if not connection:
             return [TextContent(type="text", text=f"Error: connection {connection_id} not found")]
-
-        profile = db_helper.get_profile_by_id(profile_id)
         if not profile:
             return [TextContent(type="text", text=f"Error: profile {profile_id} not found")]
 
+        # Also invalidates cached charts, in the same transaction
         db_helper.add_connection_member(connection_id, profile_id)
-        db_helper.invalidate_connection_charts(connection_id)
 
         return [TextContent(
             type="text",
@@ -283,25 +280,24 @@ async def handle_remove_connection_member(db_helper, arguments: dict) -> list[Te
         if connection_id is None or profile_id is None:
             return [TextContent(type="text", text="Error: connection_id and profile_id are required")]
 
-        connection = db_helper.get_connection_by_id(connection_id)
+        connection, profile, member_count = db_helper.fetch_connection_mutation_context(
+            connection_id, profile_id
+        )
         if not connection:
             return [TextContent(type="text", text=f"Error: connection {connection_id} not found")]
-
-        profile = db_helper.get_profile_by_id(profile_id)
         if not profile:
             return [TextContent(type="text", text=f"Error: profile {profile_id} not found")]
 
         # Guard: must keep at least 2 members
-        members = db_helper.get_connection_members(connection)
-        if len(members) <= 2:
+        if member_count <= 2:
             return [TextContent(
                 type="text",
                 text=f"Error: cannot remove {profile.name} — a connection must have at least 2 members.\n\n"
                      "Use delete_connection to remove the whole connection instead."
             )]
 
+        # Also invalidates cached charts, in the same transaction
         db_helper.remove_connection_member(connection_id, profile_id)
-        db_helper.invalidate_connection_charts(connection_id)
 
         return [TextContent(
             type="text",
@@ -315,7 +311,7 @@ async def handle_remove_connection_member(db_helper, arguments: dict) -> list[Te
         return [TextContent(type="text", text=f"Error removing member: {e}")]
 
 
-async def handle_get_connection_chart(db_helper, swetest, arguments: dict) -> list[TextContent]:
+async def handle_get_connection_chart(db_helper, ephemeris_engine, arguments: dict) -> list[TextContent]:
     """Calculate or retrieve a composite/Davison chart for a connection."""
     try:
         connection_id = arguments.get("connection_id")
@@ -325,13 +321,12 @@ async def handle_get_connection_chart(db_helper, swetest, arguments: dict) -> li
         if connection_id is None or not chart_type:
             return [TextContent(type="text", text="Error: connection_id and chart_type are required")]
 
-        connection = db_helper.get_connection_by_id(connection_id)
+        # One query: connection plus its valid cached chart, if any
+        connection, cached = db_helper.get_connection_with_cached_chart(connection_id, chart_type)
         if not connection:
             return [TextContent(type="text", text=f"Error: connection {connection_id} not found")]
 
-        # Check cache
-        cached = db_helper.get_connection_chart(connection_id, chart_type)
-        if cached and cached.is_valid and not invalidate:
+        if cached and not invalidate:
             return _format_cached_chart(connection, cached, db_helper)
 
         # Need to calculate — gather member natal data
@@ -347,10 +342,11 @@ async def handle_get_connection_chart(db_helper, swetest, arguments: dict) -> li
         )
 
         if chart_type == "composite":
-            # Pull natal chart data for each member
+            # Pull natal chart data for every member in one batch
+            bulk = db_helper.get_natal_chart_data_bulk(members)
             natal_charts = []
             for member in members:
-                chart_data = db_helper.get_natal_chart_data(member)
+                chart_data = bulk.get(member.id)
                 if not chart_data or not chart_data.get("planets"):
                     return [TextContent(
                         type="text",
@@ -372,17 +368,18 @@ async def handle_get_connection_chart(db_helper, swetest, arguments: dict) -> li
             return _format_chart_result(connection, chart, positions, members, "Composite")
 
         elif chart_type == "davison":
-            if swetest is None:
+            if ephemeris_engine is None:
                 return [TextContent(
                     type="text",
-                    text="Error: swetest is not available. "
-                         "Run check_swetest_installation for setup instructions."
+                    text="Error: ephemeris engine is not available. "
+                         "Run check_ephemeris for setup instructions."
                 )]
 
             # Get birth locations for timezone-aware midpoint calc
+            locations = db_helper.get_birth_locations_bulk(members)
             birth_locations = []
             for member in members:
-                loc = db_helper.get_birth_location(member)
+                loc = locations.get(member.id)
                 if not loc:
                     return [TextContent(
                         type="text",
@@ -393,8 +390,8 @@ async def handle_get_connection_chart(db_helper, swetest, arguments: dict) -> li
 
             midpoint = calculate_davison_midpoint(members, birth_locations)
 
-            # Cast real chart at midpoint via swetest
-            raw = swetest.get_transits(
+            # Cast real chart at midpoint via the ephemeris engine
+            raw = ephemeris_engine.get_chart(
                 latitude=midpoint["latitude"],
                 longitude=midpoint["longitude"],
                 date_str=midpoint["date"],
@@ -456,79 +453,95 @@ async def handle_delete_connection(db_helper, arguments: dict) -> list[TextConte
 # ============================================================================
 
 def _format_chart_result(connection, chart, positions, members, chart_label, midpoint=None):
-    """Format a freshly-calculated chart for display."""
+    """Format a freshly-calculated chart for display.
+
+    Houses are listed in dict order: calculate_composite_positions() and
+    EphemerisEngine.get_chart() both emit them in house-number order.
+    """
     member_names = ", ".join(m.name for m in members)
-    response = f"# {chart_label} Chart — {connection.label}\n\n"
-    response += f"Members: {member_names}\n"
+    parts = [f"# {chart_label} Chart — {connection.label}\n\n"]
+    parts.append(f"Members: {member_names}\n")
     if midpoint:
-        response += f"Midpoint: {midpoint['date']} {midpoint['time']} UTC\n"
-        response += f"Location: {midpoint['latitude']:.4f}, {midpoint['longitude']:.4f}\n"
-    response += f"Calculated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')} UTC\n\n"
+        parts.append(f"Midpoint: {midpoint['date']} {midpoint['time']} UTC\n")
+        parts.append(f"Location: {midpoint['latitude']:.4f}, {midpoint['longitude']:.4f}\n")
+    parts.append(f"Calculated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')} UTC\n\n")
 
     planets = positions.get("planets", {})
     if planets:
-        response += "## Planets\n"
+        parts.append("## Planets\n")
         for name, data in planets.items():
             pos = _fmt_with_sign(data)
-            response += f"- **{name}**: {pos}\n"
-        response += "\n"
+            parts.append(f"- **{name}**: {pos}\n")
+        parts.append("\n")
 
     houses = positions.get("houses", {})
     if houses:
-        response += "## Houses\n"
-        for num in sorted(houses.keys(), key=lambda x: int(x)):
-            data = houses[num]
+        parts.append("## Houses\n")
+        for num, data in houses.items():
             pos = _fmt_with_sign(data)
-            response += f"- House {num}: {pos}\n"
-        response += "\n"
+            parts.append(f"- House {num}: {pos}\n")
+        parts.append("\n")
 
     points = positions.get("points", {})
     if points:
-        response += "## Angles\n"
+        parts.append("## Angles\n")
         for name, data in points.items():
             pos = _fmt_with_sign(data)
-            response += f"- **{name}**: {pos}\n"
+            parts.append(f"- **{name}**: {pos}\n")
 
-    return [TextContent(type="text", text=response)]
+    return [TextContent(type="text", text="".join(parts))]
 
 
 def _format_cached_chart(connection, cached_chart, db_helper):
     """Format a cached chart for display."""
-    response = f"# {cached_chart.chart_type.title()} Chart — {connection.label} (cached)\n\n"
+    parts = [f"# {cached_chart.chart_type.title()} Chart — {connection.label} (cached)\n\n"]
     if cached_chart.davison_date:
-        response += f"Midpoint: {cached_chart.davison_date} {cached_chart.davison_time} UTC\n"
-        response += f"Location: {cached_chart.davison_latitude:.4f}, {cached_chart.davison_longitude:.4f}\n"
-    response += f"Calculated: {cached_chart.calculated_at}\n\n"
+        parts.append(f"Midpoint: {cached_chart.davison_date} {cached_chart.davison_time} UTC\n")
+        parts.append(f"Location: {cached_chart.davison_latitude:.4f}, {cached_chart.davison_longitude:.4f}\n")
+    parts.append(f"Calculated: {cached_chart.calculated_at}\n\n")
 
-    planets = db_helper.get_connection_planets(cached_chart.id)
-    if planets:
-        response += "## Planets\n"
-        for p in planets:
-            response += f"- **{p.planet}**: {p.formatted_position}\n"
-        response += "\n"
+    body = cached_chart.rendered_text
+    if body is None:
+        body = _render_chart_rows(db_helper.get_connection_chart_rows(cached_chart.id))
+        db_helper.set_connection_chart_rendered_text(cached_chart.id, body)
+    parts.append(body)
 
-    houses = db_helper.get_connection_houses(cached_chart.id)
-    if houses:
-        response += "## Houses\n"
-        for h in sorted(houses, key=lambda x: x.house_number):
-            response += f"- House {h.house_number}: {h.formatted_position}\n"
-        response += "\n"
+    return [TextContent(type="text", text="".join(parts))]
 
-    points = db_helper.get_connection_points(cached_chart.id)
-    if points:
-        response += "## Angles\n"
-        for pt in points:
-            response += f"- **{pt.point_type}**: {pt.formatted_position}\n"
 
-    return [TextContent(type="text", text=response)]
+def _render_chart_rows(rows: dict) -> str:
+    """Render get_connection_chart_rows() output as markdown sections."""
+    parts = []
+    if rows["planets"]:
+        parts.append("## Planets\n")
+        for planet, pos in rows["planets"]:
+            parts.append(f"- **{planet}**: {pos}\n")
+        parts.append("\n")
+
+    if rows["houses"]:
+        parts.append("## Houses\n")
+        for num, pos in rows["houses"]:
+            parts.append(f"- House {num}: {pos}\n")
+        parts.append("\n")
+
+    if rows["points"]:
+        parts.append("## Angles\n")
+        for point_type, pos in rows["points"]:
+            parts.append(f"- **{point_type}**: {pos}\n")
+
+    return "".join(parts)
 
 
 def _fmt(data: dict) -> str:
     """Fallback formatter for position data lacking a 'formatted' key."""
-    if "sign" in data and "degree" in data:
-        return f"{data['degree']}\u00b0 {data.get('minutes', 0):02d}' {data['sign']}"
-    if "absolute_position" in data:
-        return f"{data['absolute_position']:.2f}\u00b0"
+    get = data.get
+    sign = get("sign")
+    degree = get("degree")
+    if sign is not None and degree is not None:
+        return f"{degree}\u00b0 {get('minutes', 0):02d}' {sign}"
+    absolute = get("absolute_position")
+    if absolute is not None:
+        return f"{absolute:.2f}\u00b0"
     return str(data)
 
 
@@ -539,13 +552,12 @@ def _fmt_with_sign(data: dict) -> str:
     Composite positions include sign in their 'formatted' string already.
     This function ensures sign is always present regardless of source.
     """
-    formatted = data.get("formatted", "")
-    sign = data.get("sign", "")
-
-    if formatted and sign and sign not in formatted:
-        # EphemerisEngine raw output — append the sign
-        return f"{formatted} {sign}"
+    formatted = data.get("formatted")
     if formatted:
+        sign = data.get("sign")
+        if sign and sign not in formatted:
+            # EphemerisEngine raw output — append the sign
+            return f"{formatted} {sign}"
         # Composite or cached — sign already included
         return formatted
     # Final fallback
@@ -556,31 +568,32 @@ def _fmt_with_sign(data: dict) -> str:
 # Router
 # ============================================================================
 
-CONNECTION_TOOL_NAMES = {
+CONNECTION_TOOL_NAMES = frozenset({
     "create_connection",
     "list_connections",
     "add_connection_member",
     "remove_connection_member",
     "get_connection_chart",
     "delete_connection",
+})
+
+
+# name -> (db_helper, ephemeris_engine, arguments) -> handler coroutine
+_CONNECTION_HANDLERS = {
+    "create_connection": lambda db, eph, args: handle_create_connection(db, args),
+    "list_connections": lambda db, eph, args: handle_list_connections(db),
+    "add_connection_member": lambda db, eph, args: handle_add_connection_member(db, args),
+    "remove_connection_member": lambda db, eph, args: handle_remove_connection_member(db, args),
+    "get_connection_chart": lambda db, eph, args: handle_get_connection_chart(db, eph, args),
+    "delete_connection": lambda db, eph, args: handle_delete_connection(db, args),
 }
 
 
 async def handle_connection_tool(
-    name: str, arguments: Any, db_helper, swetest=None
+    name: str, arguments: Any, db_helper, ephemeris_engine=None
 ) -> list[TextContent]:
     """Route connection tool calls to appropriate handlers."""
-    if name == "create_connection":
-        return await handle_create_connection(db_helper, arguments)
-    elif name == "list_connections":
-        return await handle_list_connections(db_helper)
-    elif name == "add_connection_member":
-        return await handle_add_connection_member(db_helper, arguments)
-    elif name == "remove_connection_member":
-        return await handle_remove_connection_member(db_helper, arguments)
-    elif name == "get_connection_chart":
-        return await handle_get_connection_chart(db_helper, swetest, arguments)
-    elif name == "delete_connection":
-        return await handle_delete_connection(db_helper, arguments)
-    else:
+    handler = _CONNECTION_HANDLERS.get(name)
+    if handler is None:
         return [TextContent(type="text", text=f"Unknown connection tool: {name}")]
+    return await handler(db_helper, ephemeris_engine, arguments)
@@ -6,199 +6,316 @@ no profile required. Useful for historical events, mundane charts,
 and as the foundation for electional astrology scanning.
 """
 
-from typing import Any
+import asyncio
+import atexit
+import functools
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+import numpy as np
 from mcp.types import Tool, TextContent
 
+from ..constants import HOUSE_KEYS
+from ..utils.electional import HOUSE_CRITERIA, chart_at, score_batch, score_chart
+
+# Julian Day of the J2000.0 epoch (2000-01-01 12:00 UT)
+_J2000 = datetime(2000, 1, 1, 12)
+_J2000_JD = 2451545.0
+
+
+def _julian_day(dt: datetime) -> float:
+    """Convert a naive UT datetime to a Julian Day number."""
+    return _J2000_JD + (dt - _J2000) / timedelta(days=1)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_engine(engine_cls):
+    """Return the event tools' shared ephemeris engine, built on first use.
+
+    Handlers import EphemerisEngine lazily and pass the class in, so it is
+    part of the cache key. Engine calls are synchronous and run on the event
+    loop thread, so two calls never interleave inside the library's global
+    state. A sharded scan awaits its workers, letting other handlers run in
+    between, but the workers are separate processes with their own state.
+    """
+    return engine_cls()
+
+
+# Finished electional scans, keyed on the engine and every argument that
+# shapes the result. Positions are deterministic, so entries never go stale.
+ELECTIONAL_CACHE_MAXSIZE = 128
+_electional_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Large scans have their planet positions computed across worker processes.
+# Each shard has at least _PARALLEL_SCAN_MIN_STEPS steps, so only scans of
+# two shards or more are split, and at most _SCAN_MAX_WORKERS workers run
+# however many cores the host has.
+_PARALLEL_SCAN_MIN_STEPS = 2000
+_SCAN_MAX_WORKERS = 4
+
+
+# Worker pool for large scans: started on first use, discarded if it breaks.
+_scan_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_scan_pool() -> ProcessPoolExecutor:
+    """Return the worker pool for large scans, starting it if needed.
+
+    Each worker has its own copy of the library's global state. Spawned
+    rather than forked, since the server process runs other threads.
+    """
+    global _scan_pool
+    if _scan_pool is None:
+        _scan_pool = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, _SCAN_MAX_WORKERS),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _scan_pool
+
+
+@atexit.register
+def _shutdown_scan_pool() -> None:
+    """Stop the scan workers; the next large scan starts a fresh pool."""
+    global _scan_pool
+    pool, _scan_pool = _scan_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def _scan_planets(engine, jds: np.ndarray) -> dict:
+    """Planet batch for a scan grid, sharded across CPU cores when large.
+
+    Sharded scans also keep the event loop free while they run. If the
+    pool has broken, the scan falls back to the in-process batch.
+    """
+    workers = min(os.cpu_count() or 1, jds.size // _PARALLEL_SCAN_MIN_STEPS, _SCAN_MAX_WORKERS)
+    if workers < 2:
+        return engine.get_planets_batch(jds=jds)
+
+    from ..utils.ephemeris import planets_batch_worker
+
+    loop = asyncio.get_running_loop()
+    pool = _get_scan_pool()
+    try:
+        shards = await asyncio.gather(*(
+            loop.run_in_executor(pool, planets_batch_worker, engine.ephe_path, chunk)
+            for chunk in np.array_split(jds, workers)
+        ))
+    except BrokenProcessPool:
+        # A worker died. Replace the pool for later scans and finish this
+        # one in process rather than failing the call.
+        _shutdown_scan_pool()
+        return engine.get_planets_batch(jds=jds)
+    return {key: np.concatenate([shard[key] for shard in shards]) for key in shards[0]}
+
 
 # ============================================================================
 # Tool Definitions
 # ============================================================================
 
-def get_event_tools() -> list[Tool]:
-    """Return list of event chart tool definitions."""
-    return [
-        Tool(
-            name="cast_event_chart",
-            description=(
-                "Cast an astrological chart for any date, time, and location. "
-                "No profile required — useful for historical events, mundane astrology, "
-                "and electional work.\n\n"
-                "If 'label' is provided, the chart is saved to the database and can be "
-                "referenced later via compare_charts using 'event:<label>'.\n\n"
-                "If 'label' is omitted, the chart is calculated and returned but not saved."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "date": {
-                        "type": "string",
-                        "description": "Date in YYYY-MM-DD format"
-                    },
-                    "time": {
-                        "type": "string",
-                        "description": "Time in HH:MM format (local time at the given location)"
-                    },
-                    "latitude": {
-                        "type": "number",
-                        "description": "Latitude in decimal degrees"
-                    },
-                    "longitude": {
-                        "type": "number",
-                        "description": "Longitude in decimal degrees"
-                    },
-                    "timezone": {
-                        "type": "string",
-                        "description": "IANA timezone name (e.g., 'America/Chicago')"
-                    },
-                    "location_name": {
-                        "type": "string",
-                        "description": "Human-readable location name (e.g., 'Chicago, IL')"
-                    },
-                    "label": {
-                        "type": "string",
-                        "description": (
-                            "Optional unique name to save this chart for later reference. "
-                            "If omitted, chart is calculated but not saved. "
-                            "Must be unique among all saved event charts."
-                        )
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Optional notes about this event"
-                    },
-                    "profile_id": {
-                        "type": "integer",
-                        "description": "Optional profile ID to associate this event with a person"
-                    }
+# Tool definitions are immutable MCP metadata: built once at import.
+_EVENT_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="cast_event_chart",
+        description=(
+            "Cast an astrological chart for any date, time, and location. "
+            "No profile required — useful for historical events, mundane astrology, "
+            "and electional work.\n\n"
+            "If 'label' is provided, the chart is saved to the database and can be "
+            "referenced later via compare_charts using 'event:<label>'.\n\n"
+            "If 'label' is omitted, the chart is calculated and returned but not saved."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "description": "Date in YYYY-MM-DD format"
                 },
-                "required": ["date", "time", "latitude", "longitude", "timezone", "location_name"]
-            }
+                "time": {
+                    "type": "string",
+                    "description": "Time in HH:MM format (local time at the given location)"
+                },
+                "latitude": {
+                    "type": "number",
+                    "description": "Latitude in decimal degrees"
+                },
+                "longitude": {
+                    "type": "number",
+                    "description": "Longitude in decimal degrees"
+                },
+                "timezone": {
+                    "type": "string",
+                    "description": "IANA timezone name (e.g., 'America/Chicago')"
+                },
+                "location_name": {
+                    "type": "string",
+                    "description": "Human-readable location name (e.g., 'Chicago, IL')"
+                },
+                "label": {
+                    "type": "string",
+                    "description": (
+                        "Optional unique name to save this chart for later reference. "
+                        "If omitted, chart is calculated but not saved. "
+                        "Must be unique among all saved event charts."
+                    )
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Optional notes about this event"
+                },
+                "profile_id": {
+                    "type": "integer",
+                    "description": "Optional profile ID to associate this event with a person"
+                }
+            },
+            "required": ["date", "time", "latitude", "longitude", "timezone", "location_name"]
+        }
+    ),
+    Tool(
+        name="list_event_charts",
+        description=(
+            "List all saved event charts. "
+            "Shows label, date/time, location, and optional description. "
+            "Saved charts can be used in compare_charts via 'event:<label>'."
         ),
-        Tool(
-            name="list_event_charts",
-            description=(
-                "List all saved event charts. "
-                "Shows label, date/time, location, and optional description. "
-                "Saved charts can be used in compare_charts via 'event:<label>'."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "profile_id": {
-                        "type": "integer",
-                        "description": "Optional: filter to events associated with a specific profile"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "profile_id": {
+                    "type": "integer",
+                    "description": "Optional: filter to events associated with a specific profile"
                 }
             }
+        }
+    ),
+    Tool(
+        name="delete_event_chart",
+        description=(
+            "Delete a saved event chart by label. "
+            "WARNING: Permanent and cannot be undone."
         ),
-        Tool(
-            name="delete_event_chart",
-            description=(
-                "Delete a saved event chart by label. "
-                "WARNING: Permanent and cannot be undone."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "label": {
-                        "type": "string",
-                        "description": "Label of the event chart to delete"
-                    },
-                    "confirm": {
-                        "type": "boolean",
-                        "description": "Must be true to confirm deletion"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "label": {
+                    "type": "string",
+                    "description": "Label of the event chart to delete"
                 },
-                "required": ["label", "confirm"]
-            }
+                "confirm": {
+                    "type": "boolean",
+                    "description": "Must be true to confirm deletion"
+                }
+            },
+            "required": ["label", "confirm"]
+        }
+    ),
+    Tool(
+        name="find_electional_windows",
+        description=(
+            "Scan a time window and return candidate moments that satisfy "
+            "electional astrology criteria. Useful for finding auspicious times "
+            "to start a project, sign a contract, hold an event, etc.\n\n"
+            "Scans at a configurable interval (default 60 minutes) and scores "
+            "each moment against the requested criteria. Returns candidates ranked "
+            "by score (most criteria met first), then by tightness.\n\n"
+            "Maximum window: 90 days. Maximum interval: 360 minutes (6 hours). "
+            "Minimum interval: 15 minutes.\n\n"
+            "Available criteria:\n"
+            "- moon_not_void: Moon is not void of course\n"
+            "- no_retrograde_inner: Mercury and Venus are direct\n"
+            "- no_retrograde_outer: Mars through Pluto are direct\n"
+            "- no_retrograde_all: All planets are direct\n"
+            "- moon_waxing: Moon is waxing (New to Full)\n"
+            "- moon_waning: Moon is waning (Full to New)\n"
+            "- benefic_angular: Venus or Jupiter in houses 1, 4, 7, or 10\n"
+            "- asc_not_late: Ascendant is not in the last 3° of its sign"
         ),
-        Tool(
-            name="find_electional_windows",
-            description=(
-                "Scan a time window and return candidate moments that satisfy "
-                "electional astrology criteria. Useful for finding auspicious times "
-                "to start a project, sign a contract, hold an event, etc.\n\n"
-                "Scans at a configurable interval (default 60 minutes) and scores "
-                "each moment against the requested criteria. Returns candidates ranked "
-                "by score (most criteria met first), then by tightness.\n\n"
-                "Maximum window: 90 days. Maximum interval: 360 minutes (6 hours). "
-                "Minimum interval: 15 minutes.\n\n"
-                "Available criteria:\n"
-                "- moon_not_void: Moon is not void of course\n"
-                "- no_retrograde_inner: Mercury and Venus are direct\n"
-                "- no_retrograde_outer: Mars through Pluto are direct\n"
-                "- no_retrograde_all: All planets are direct\n"
-                "- moon_waxing: Moon is waxing (New to Full)\n"
-                "- moon_waning: Moon is waning (Full to New)\n"
-                "- benefic_angular: Venus or Jupiter in houses 1, 4, 7, or 10\n"
-                "- asc_not_late: Ascendant is not in the last 3° of its sign"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start of scan window (YYYY-MM-DD)"
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End of scan window (YYYY-MM-DD, max 90 days from start)"
-                    },
-                    "latitude": {
-                        "type": "number",
-                        "description": "Latitude for the charts"
-                    },
-                    "longitude": {
-                        "type": "number",
-                        "description": "Longitude for the charts"
-                    },
-                    "timezone": {
-                        "type": "string",
-                        "description": "IANA timezone for display and local-time interpretation"
-                    },
-                    "location_name": {
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start_date": {
+                    "type": "string",
+                    "description": "Start of scan window (YYYY-MM-DD)"
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End of scan window (YYYY-MM-DD, max 90 days from start)"
+                },
+                "latitude": {
+                    "type": "number",
+                    "description": "Latitude for the charts"
+                },
+                "longitude": {
+                    "type": "number",
+                    "description": "Longitude for the charts"
+                },
+                "timezone": {
+                    "type": "string",
+                    "description": "IANA timezone for display and local-time interpretation"
+                },
+                "location_name": {
+                    "type": "string",
+                    "description": "Human-readable location name"
+                },
+                "criteria": {
+                    "type": "array",
+                    "items": {
                         "type": "string",
-                        "description": "Human-readable location name"
-                    },
-                    "criteria": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": [
-                                "moon_not_void",
-                                "no_retrograde_inner",
-                                "no_retrograde_outer",
-                                "no_retrograde_all",
-                                "moon_waxing",
-                                "moon_waning",
-                                "benefic_angular",
-                                "asc_not_late"
-                            ]
-                        },
-                        "description": "Criteria to evaluate at each interval",
-                        "minItems": 1
+                        "enum": [
+                            "moon_not_void",
+                            "no_retrograde_inner",
+                            "no_retrograde_outer",
+                            "no_retrograde_all",
+                            "moon_waxing",
+                            "moon_waning",
+                            "benefic_angular",
+                            "asc_not_late"
+                        ]
                     },
-                    "interval_minutes": {
-                        "type": "integer",
-                        "description": "Minutes between scan steps (15–360, default 60)",
-                        "minimum": 15,
-                        "maximum": 360
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of candidates to return (default 10)",
-                        "minimum": 1,
-                        "maximum": 50
-                    }
+                    "description": "Criteria to evaluate at each interval",
+                    "minItems": 1
                 },
-                "required": [
-                    "start_date", "end_date",
-                    "latitude", "longitude", "timezone", "location_name",
-                    "criteria"
-                ]
-            }
-        ),
-    ]
+                "interval_minutes": {
+                    "type": "integer",
+                    "description": "Minutes between scan steps (15–360, default 60)",
+                    "minimum": 15,
+                    "maximum": 360
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of candidates to return (default 10)",
+                    "minimum": 1,
+                    "maximum": 50
+                },
+                "min_criteria": {
+                    "type": "integer",
+                    "description": (
+                        "Only return moments meeting at least this many criteria "
+                        "(default 1). Set it to the number of criteria to require "
+                        "full matches."
+                    ),
+                    "minimum": 1
+                }
+            },
+            "required": [
+                "start_date", "end_date",
+                "latitude", "longitude", "timezone", "location_name",
+                "criteria"
+            ]
+        }
+    ),
+)
+
+
+def get_event_tools() -> list[Tool]:
+    """Return list of event chart tool definitions."""
+    return list(_EVENT_TOOLS)
 
 
 # ============================================================================
@@ -224,7 +341,7 @@ async def handle_cast_event_chart(db_helper, arguments: dict) -> list[TextConten
 
     from ..utils.ephemeris import EphemerisEngine, EphemerisError
     try:
-        engine = EphemerisEngine()
+        engine = _get_engine(EphemerisEngine)
         chart = engine.get_chart(
             latitude=latitude,
             longitude=longitude,
@@ -268,8 +385,10 @@ async def handle_cast_event_chart(db_helper, arguments: dict) -> list[TextConten
     # Houses
     if houses:
         lines.append("## House Cusps")
-        for num in sorted(houses.keys(), key=lambda x: int(x)):
-            pos = houses[num]
+        for num in HOUSE_KEYS:
+            pos = houses.get(num)
+            if pos is None:
+                continue
             lines.append(f"- **House {num}**: {pos.get('degree', 0):.2f}° {pos.get('sign', '')}")
         lines.append("")
 
@@ -349,10 +468,61 @@ async def handle_delete_event_chart(db_helper, arguments: dict) -> list[TextCont
     return [TextContent(type="text", text=f"✓ Event chart \"{label}\" deleted")]
 
 
+async def _find_candidates(
+    engine,
+    criteria: list[str],
+    latitude: float,
+    longitude: float,
+    start_dt: datetime,
+    end_dt: datetime,
+    interval_minutes: int,
+    min_criteria: int,
+    max_results: int,
+) -> tuple:
+    """Scan a window and return its best (score, datetime, met, details) rows.
+
+    Every step is computed in one batched ephemeris pass and scored
+    column-wise; only the reported rows become chart dicts.
+
+    Raises:
+        EphemerisError: If the ephemeris calculation fails.
+    """
+    step = timedelta(minutes=interval_minutes)
+    step_count = (end_dt - start_dt) // step + 1
+    jds = _julian_day(start_dt) + np.arange(step_count) * (interval_minutes / 1440.0)
+
+    # Planet positions depend only on time; house cusps are the only
+    # location-dependent part and are skipped unless a criterion uses them.
+    batch = await _scan_planets(engine, jds)
+    if HOUSE_CRITERIA.intersection(criteria):
+        batch.update(engine.get_houses_batch(
+            jds=jds,
+            latitude=latitude,
+            longitude=longitude,
+        ))
+
+    masks = score_batch(batch, criteria, min_met=min_criteria)
+    scores = np.count_nonzero([masks[c] for c in criteria], axis=0)
+    hits = np.flatnonzero(scores >= min_criteria)
+    if not hits.size:
+        return ()
+
+    # Rank by score desc, then by datetime asc. One integer key per step;
+    # only the best max_results are selected (O(n)) and then sorted.
+    keys = (len(criteria) - scores[hits]) * step_count + hits
+    k = min(max_results, keys.size)
+    best = np.argpartition(keys, k - 1)[:k]
+    top = hits[best[np.argsort(keys[best])]]
+
+    candidates = []
+    for i in top.tolist():
+        met, details = score_chart(chart_at(batch, i), criteria)
+        candidates.append((len(met), start_dt + i * step, tuple(met), details))
+    return tuple(candidates)
+
+
 async def handle_find_electional_windows(db_helper, arguments: dict) -> list[TextContent]:
     """Scan a time window for moments satisfying electional criteria."""
-    from datetime import datetime, timedelta
-
     start_date = arguments.get("start_date", "").strip()
     end_date = arguments.get("end_date", "").strip()
     latitude = arguments.get("latitude")
@@ -362,6 +532,7 @@ async def handle_find_electional_windows(db_helper, arguments: dict) -> list[Tex
     criteria = arguments.get("criteria", [])
     interval_minutes = int(arguments.get("interval_minutes", 60))
     max_results = int(arguments.get("max_results", 10))
+    min_criteria = int(arguments.get("min_criteria", 1))
 
     # Validate before importing heavy ephemeris module
     if not start_date or not end_date:
@@ -373,6 +544,7 @@ async def handle_find_electional_windows(db_helper, arguments: dict) -> list[Tex
 
     interval_minutes = max(15, min(360, interval_minutes))
     max_results = max(1, min(50, max_results))
+    min_criteria = max(1, min(len(criteria), min_criteria))
 
     try:
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
@@ -387,28 +559,26 @@ async def handle_find_electional_windows(db_helper, arguments: dict) -> list[Tex
         return [TextContent(type="text", text="Error: end_date must be after start_date")]
 
     from ..utils.ephemeris import EphemerisEngine, EphemerisError
-    from ..utils.electional import score_chart
-    engine = EphemerisEngine()
-    candidates = []
-    current = start_dt
-    step = timedelta(minutes=interval_minutes)
-
-    while current <= end_dt:
-        date_str = current.strftime("%Y-%m-%d")
-        time_str = current.strftime("%H:%M")
+    engine = _get_engine(EphemerisEngine)
+
+    key = (
+        engine, tuple(criteria), round(latitude, 4), round(longitude, 4),
+        start_dt, end_dt, interval_minutes, min_criteria, max_results,
+    )
+    candidates = _electional_cache.get(key)
+    if candidates is None:
         try:
-            chart = engine.get_chart(
-                latitude=latitude,
-                longitude=longitude,
-                date_str=date_str,
-                time_str=time_str,
+            candidates = await _find_candidates(
+                engine, criteria, latitude, longitude,
+                start_dt, end_dt, interval_minutes, min_criteria, max_results,
             )
-            met, details = score_chart(chart, criteria)
-            if met:
-                candidates.append((len(met), current, met, details))
-        except EphemerisError:
-            pass  # Skip bad timestamps silently
-        current += step
+        except EphemerisError as e:
+            return [TextContent(type="text", text=f"Error calculating charts: {e}")]
+        _electional_cache[key] = candidates
+        if len(_electional_cache) > ELECTIONAL_CACHE_MAXSIZE:
+            _electional_cache.popitem(last=False)
+    else:
+        _electional_cache.move_to_end(key)
 
     if not candidates:
         return [TextContent(
@@ -419,10 +589,6 @@ async def handle_find_electional_windows(db_helper, arguments: dict) -> list[Tex
             )
         )]
 
-    # Sort by score desc, then by datetime asc
-    candidates.sort(key=lambda x: (-x[0], x[1]))
-    candidates = candidates[:max_results]
-
     lines = [
         f"# Electional Windows: {start_date} – {end_date}",
         f"**Location:** {location_name}",
@@ -448,25 +614,27 @@ async def handle_find_electional_windows(db_helper, arguments: dict) -> list[Tex
 # Tool name registry + dispatcher
 # ============================================================================
 
-EVENT_TOOL_NAMES = {
+EVENT_TOOL_NAMES = frozenset({
     "cast_event_chart",
     "list_event_charts",
     "delete_event_chart",
     "find_electional_windows",
+})
+
+
+_EVENT_HANDLERS = {
+    "cast_event_chart": handle_cast_event_chart,
+    "list_event_charts": handle_list_event_charts,
+    "delete_event_chart": handle_delete_event_chart,
+    "find_electional_windows": handle_find_electional_windows,
 }
 
 
 async def handle_event_tool(
-    name: str, arguments: dict, db_helper, swetest=None
+    name: str, arguments: dict, db_helper
 ) -> list[TextContent]:
     """Route event tool calls to the appropriate handler."""
-    if name == "cast_event_chart":
-        return await handle_cast_event_chart(db_helper, arguments)
-    elif name == "list_event_charts":
-        return await handle_list_event_charts(db_helper, arguments)
-    elif name == "delete_event_chart":
-        return await handle_delete_event_chart(db_helper, arguments)
-    elif name == "find_electional_windows":
-        return await handle_find_electional_windows(db_helper, arguments)
-    else:
+    handler = _EVENT_HANDLERS.get(name)
+    if handler is None:
         return [TextContent(type="text", text=f"Unknown event tool: {name}")]
+    return await handler(db_helper, arguments)
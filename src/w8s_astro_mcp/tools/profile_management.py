@@ -12,200 +12,226 @@ from mcp.types import Tool, TextContent
 # Tool Definitions
 # ============================================================================
 
-def get_profile_management_tools() -> list[Tool]:
-    """Return list of profile management tool definitions."""
-    return [
-        Tool(
-            name="list_profiles",
-            description=(
-                "List all astrological profiles in the database. "
-                "Shows profile names, birth dates, and which is currently active. "
-                "Use this to see all available profiles before creating, updating, or switching."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            }
+# Tool definitions are immutable MCP metadata: built once at import.
+_PROFILE_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="list_profiles",
+        description=(
+            "List all astrological profiles in the database. "
+            "Shows profile names, birth dates, and which is currently active. "
+            "Use this to see all available profiles before creating, updating, or switching."
         ),
-        Tool(
-            name="create_profile",
-            description=(
-                "Create a new astrological profile (for friends, family, synastry analysis, etc.). "
-                "After creating, ask user if this should be their current profile. "
-                "IMPORTANT: Ask for information conversationally:\n"
-                "1. Ask: 'What's their name?'\n"
-                "2. Ask: 'What's their birthday?' (get YYYY-MM-DD)\n"
-                "3. Ask: 'Do you know what time they were born? (If not, we can use 12:00)'\n"
-                "4. Ask: 'Where were they born?' (get city, state/country)\n"
-                "Then look up coordinates and confirm before saving."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Person's name (e.g., 'Sarah Johnson')"
-                    },
-                    "birth_date": {
-                        "type": "string",
-                        "description": "Birth date in YYYY-MM-DD format"
-                    },
-                    "birth_time": {
-                        "type": "string",
-                        "description": "Birth time in HH:MM format (24-hour)"
-                    },
-                    "birth_location_name": {
-                        "type": "string",
-                        "description": "Location name (e.g., 'New York, NY')"
-                    },
-                    "birth_latitude": {
-                        "type": "number",
-                        "description": "Latitude in decimal degrees"
-                    },
-                    "birth_longitude": {
-                        "type": "number",
-                        "description": "Longitude in decimal degrees"
-                    },
-                    "birth_timezone": {
-                        "type": "string",
-                        "description": "Timezone (e.g., 'America/New_York')"
-                    }
-                },
-                "required": ["name", "birth_date", "birth_time", "birth_location_name",
-                           "birth_latitude", "birth_longitude", "birth_timezone"]
-            }
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        }
+    ),
+    Tool(
+        name="create_profile",
+        description=(
+            "Create a new astrological profile (for friends, family, synastry analysis, etc.). "
+            "After creating, ask user if this should be their current profile. "
+            "IMPORTANT: Ask for information conversationally:\n"
+            "1. Ask: 'What's their name?'\n"
+            "2. Ask: 'What's their birthday?' (get YYYY-MM-DD)\n"
+            "3. Ask: 'Do you know what time they were born? (If not, we can use 12:00)'\n"
+            "4. Ask: 'Where were they born?' (get city, state/country)\n"
+            "Then look up coordinates and confirm before saving."
         ),
-        Tool(
-            name="update_profile",
-            description=(
-                "Update a profile field (name, birth date, birth time, etc.). "
-                "Use with caution - changing birth data invalidates cached natal chart. "
-                "Valid fields: name, birth_date, birth_time"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "profile_id": {
-                        "type": "integer",
-                        "description": "Profile ID to update (get from list_profiles)"
-                    },
-                    "field": {
-                        "type": "string",
-                        "description": "Field to update (name, birth_date, birth_time)",
-                        "enum": ["name", "birth_date", "birth_time"]
-                    },
-                    "value": {
-                        "type": "string",
-                        "description": "New value for the field"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Person's name (e.g., 'Sarah Johnson')"
                 },
-                "required": ["profile_id", "field", "value"]
-            }
-        ),
-        Tool(
-            name="delete_profile",
-            description=(
-                "Delete a profile from the database. "
-                "WARNING: This is permanent and cannot be undone. "
-                "Deletes the profile and all associated natal chart data. "
-                "If this is the owner profile, owner_profile_id will be set to NULL."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "profile_id": {
-                        "type": "integer",
-                        "description": "Profile ID to delete (get from list_profiles)"
-                    },
-                    "confirm": {
-                        "type": "boolean",
-                        "description": "Must be true to confirm deletion"
-                    }
+                "birth_date": {
+                    "type": "string",
+                    "description": "Birth date in YYYY-MM-DD format"
+                },
+                "birth_time": {
+                    "type": "string",
+                    "description": "Birth time in HH:MM format (24-hour)"
+                },
+                "birth_location_name": {
+                    "type": "string",
+                    "description": "Location name (e.g., 'New York, NY')"
+                },
+                "birth_latitude": {
+                    "type": "number",
+                    "description": "Latitude in decimal degrees"
                 },
-                "required": ["profile_id", "confirm"]
-            }
+                "birth_longitude": {
+                    "type": "number",
+                    "description": "Longitude in decimal degrees"
+                },
+                "birth_timezone": {
+                    "type": "string",
+                    "description": "Timezone (e.g., 'America/New_York')"
+                }
+            },
+            "required": ["name", "birth_date", "birth_time", "birth_location_name",
+                       "birth_latitude", "birth_longitude", "birth_timezone"]
+        }
+    ),
+    Tool(
+        name="update_profile",
+        description=(
+            "Update a profile field (name, birth date, birth time, etc.). "
+            "Use with caution - changing birth data invalidates cached natal chart. "
+            "Valid fields: name, birth_date, birth_time"
         ),
-        Tool(
-            name="setup_owner",
-            description=(
-                "Set who you are — the human operating this server. "
-                "This is a one-time setup step, not a session operation. "
-                "The owner profile is the stable identity used as the default for "
-                "get_natal_chart, get_transits, and all other tools when no profile_id is supplied. "
-                "Use list_profiles to find your profile_id."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "profile_id": {
-                        "type": "integer",
-                        "description": "Profile ID to set as owner (get from list_profiles)"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "profile_id": {
+                    "type": "integer",
+                    "description": "Profile ID to update (get from list_profiles)"
+                },
+                "field": {
+                    "type": "string",
+                    "description": "Field to update (name, birth_date, birth_time)",
+                    "enum": ["name", "birth_date", "birth_time"]
                 },
-                "required": ["profile_id"]
-            }
+                "value": {
+                    "type": "string",
+                    "description": "New value for the field"
+                }
+            },
+            "required": ["profile_id", "field", "value"]
+        }
+    ),
+    Tool(
+        name="delete_profile",
+        description=(
+            "Delete a profile from the database. "
+            "WARNING: This is permanent and cannot be undone. "
+            "Deletes the profile and all associated natal chart data. "
+            "If this is the owner profile, owner_profile_id will be set to NULL."
         ),
-        Tool(
-            name="add_location",
-            description=(
-                "Add a saved location (home, office, travel destination, etc.) for a profile. "
-                "Every location must belong to a specific profile."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "profile_id": {
-                        "type": "integer",
-                        "description": "Profile ID this location belongs to (required)"
-                    },
-                    "label": {
-                        "type": "string",
-                        "description": "Location label (e.g., 'Office', 'Vacation Home')"
-                    },
-                    "latitude": {
-                        "type": "number",
-                        "description": "Latitude in decimal degrees"
-                    },
-                    "longitude": {
-                        "type": "number",
-                        "description": "Longitude in decimal degrees"
-                    },
-                    "timezone": {
-                        "type": "string",
-                        "description": "Timezone (e.g., 'America/Los_Angeles')"
-                    },
-                    "set_as_home": {
-                        "type": "boolean",
-                        "description": "Optional: Set as current home location for this profile"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "profile_id": {
+                    "type": "integer",
+                    "description": "Profile ID to delete (get from list_profiles)"
                 },
-                "required": ["profile_id", "label", "latitude", "longitude", "timezone"]
-            }
+                "confirm": {
+                    "type": "boolean",
+                    "description": "Must be true to confirm deletion"
+                }
+            },
+            "required": ["profile_id", "confirm"]
+        }
+    ),
+    Tool(
+        name="setup_owner",
+        description=(
+            "Set who you are — the human operating this server. "
+            "This is a one-time setup step, not a session operation. "
+            "The owner profile is the stable identity used as the default for "
+            "get_natal_chart, get_transits, and all other tools when no profile_id is supplied. "
+            "Use list_profiles to find your profile_id."
         ),
-        Tool(
-            name="remove_location",
-            description=(
-                "Remove a saved location. "
-                "WARNING: Cannot remove locations that are set as birth locations for profiles."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "location_id": {
-                        "type": "integer",
-                        "description": "Location ID to remove (get from view_config)"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "profile_id": {
+                    "type": "integer",
+                    "description": "Profile ID to set as owner (get from list_profiles)"
+                }
+            },
+            "required": ["profile_id"]
+        }
+    ),
+    Tool(
+        name="add_location",
+        description=(
+            "Add a saved location (home, office, travel destination, etc.) for a profile. "
+            "Every location must belong to a specific profile."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "profile_id": {
+                    "type": "integer",
+                    "description": "Profile ID this location belongs to (required)"
+                },
+                "label": {
+                    "type": "string",
+                    "description": "Location label (e.g., 'Office', 'Vacation Home')"
+                },
+                "latitude": {
+                    "type": "number",
+                    "description": "Latitude in decimal degrees"
+                },
+                "longitude": {
+                    "type": "number",
+                    "description": "Longitude in decimal degrees"
+                },
+                "timezone": {
+                    "type": "string",
+                    "description": "Timezone (e.g., 'America/Los_Angeles')"
                 },
-                "required": ["location_id"]
-            }
+                "set_as_home": {
+                    "type": "boolean",
+                    "description": "Optional: Set as current home location for this profile"
+                }
+            },
+            "required": ["profile_id", "label", "latitude", "longitude", "timezone"]
+        }
+    ),
+    Tool(
+        name="remove_location",
+        description=(
+            "Remove a saved location. "
+            "WARNING: Cannot remove locations that are set as birth locations for profiles."
         ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "location_id": {
+                    "type": "integer",
+                    "description": "Location ID to remove (get from view_config)"
+                }
+            },
+            "required": ["location_id"]
+        }
+    ),
+)
+
+
+def get_profile_management_tools() -> list[Tool]:
+    """Return list of profile management tool definitions."""
+    return list(_PROFILE_TOOLS)
 
 
 # ============================================================================
 # Tool Handlers
 # ============================================================================
 
+def _missing(arguments: dict, names: tuple[str, ...]) -> list[str]:
+    """Return the required argument names that are absent or blank.
+
+    Only None and blank strings count as missing, so a 0.0 latitude or
+    longitude is accepted.
+    """
+    missing = []
+    for name in names:
+        value = arguments.get(name)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            missing.append(name)
+    return missing
+
+
+_CREATE_PROFILE_FIELDS = (
+    "name", "birth_date", "birth_time", "birth_location_name",
+    "birth_latitude", "birth_longitude", "birth_timezone",
+)
+_UPDATE_PROFILE_FIELDS = ("profile_id", "field", "value")
+_ADD_LOCATION_FIELDS = ("profile_id", "label", "latitude", "longitude", "timezone")
+
+
 async def handle_list_profiles(db_helper) -> list[TextContent]:
     """List all profiles in database."""
     try:
@@ -225,30 +251,31 @@ async def handle_list_profiles(db_helper) -> list[TextContent]:
             )]
         
         # Format profile list
-        response = "# Astrological Profiles\n\n"
+        lines = ["# Astrological Profiles", ""]
         
         for profile in profiles:
             # Current profile indicator
             indicator = "* " if profile.id == current_id else "  "
             
             # Format line
-            response += f"{indicator}**{profile.name}** (ID: {profile.id})\n"
-            response += f"  Born: {profile.birth_date} at {profile.birth_time}\n"
+            lines.append(f"{indicator}**{profile.name}** (ID: {profile.id})")
+            lines.append(f"  Born: {profile.birth_date} at {profile.birth_time}")
             
             # Birth location if available
             birth_loc = db_helper.get_birth_location(profile)
             if birth_loc:
-                response += f"  Location: {birth_loc.label}\n"
+                lines.append(f"  Location: {birth_loc.label}")
             
-            response += "\n"
+            lines.append("")
         
         # Add legend
         if current_id:
-            response += "* Owner (you)\n"
+            lines.append("* Owner (you)")
         else:
-            response += "No owner profile set. Use setup_owner to configure.\n"
+            lines.append("No owner profile set. Use setup_owner to configure.")
+        lines.append("")
         
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text="\n".join(lines))]
         
     except Exception as e:
         return [TextContent(
@@ -270,8 +297,7 @@ async def handle_create_profile(db_helper, arguments: dict) -> list[TextContent]
         birth_timezone = arguments.get("birth_timezone")
         
         # Validate required fields
-        if not all([name, birth_date, birth_time, birth_location_name, 
-                   birth_latitude, birth_longitude, birth_timezone]):
+        if _missing(arguments, _CREATE_PROFILE_FIELDS):
             return [TextContent(
                 type="text",
                 text="Error: All fields are required (name, birth_date, birth_time, "
@@ -290,16 +316,20 @@ async def handle_create_profile(db_helper, arguments: dict) -> list[TextContent]
         )
         
         # Format success message
-        response = f"✓ Profile created successfully!\n\n"
-        response += f"**{profile.name}** (ID: {profile.id})\n"
-        response += f"Born: {profile.birth_date} at {profile.birth_time}\n"
-        response += f"Location: {birth_location_name}\n"
-        response += f"Coordinates: {birth_latitude}, {birth_longitude}\n"
-        response += f"Timezone: {birth_timezone}\n\n"
-        response += "Would you like to set this as your owner profile (i.e., 'you')?\n"
-        response += f"Use: setup_owner with profile_id={profile.id}"
-        
-        return [TextContent(type="text", text=response)]
+        lines = [
+            "✓ Profile created successfully!",
+            "",
+            f"**{profile.name}** (ID: {profile.id})",
+            f"Born: {profile.birth_date} at {profile.birth_time}",
+            f"Location: {birth_location_name}",
+            f"Coordinates: {birth_latitude}, {birth_longitude}",
+            f"Timezone: {birth_timezone}",
+            "",
+            "Would you like to set this as your owner profile (i.e., 'you')?",
+            f"Use: setup_owner with profile_id={profile.id}",
+        ]
+        
+        return [TextContent(type="text", text="\n".join(lines))]
         
     except Exception as e:
         return [TextContent(
@@ -317,7 +347,7 @@ async def handle_update_profile(db_helper, arguments: dict) -> list[TextContent]
         value = arguments.get("value")
         
         # Validate required fields
-        if not all([profile_id, field, value]):
+        if _missing(arguments, _UPDATE_PROFILE_FIELDS):
             return [TextContent(
                 type="text",
                 text="Error: Missing required fields (profile_id, field, value)"
@@ -327,17 +357,21 @@ async def handle_update_profile(db_helper, arguments: dict) -> list[TextContent]
         profile = db_helper.update_profile_field(profile_id, field, value)
         
         # Format success message
-        response = f"✓ Profile updated successfully!\n\n"
-        response += f"**{profile.name}** (ID: {profile.id})\n"
-        response += f"Updated field: {field}\n"
-        response += f"New value: {value}\n"
+        lines = [
+            "✓ Profile updated successfully!",
+            "",
+            f"**{profile.name}** (ID: {profile.id})",
+            f"Updated field: {field}",
+            f"New value: {value}",
+            "",
+        ]
         
         # If birth data changed, note that natal cache was cleared
         if field in ["birth_date", "birth_time"]:
-            response += f"\n⚠️  Birth data changed - natal chart cache invalidated.\n"
-            response += f"Next time you call get_natal_chart, it will recalculate with the new birth data."
+            lines.append("⚠️  Birth data changed - natal chart cache invalidated.")
+            lines.append("Next time you call get_natal_chart, it will recalculate with the new birth data.")
         
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text="\n".join(lines))]
         
     except ValueError as e:
         # Profile not found or invalid field
@@ -399,16 +433,21 @@ async def handle_delete_profile(db_helper, arguments: dict) -> list[TextContent]
             )]
         
         # Format success message
-        response = f"✓ Profile deleted permanently!\n\n"
-        response += f"Deleted: **{profile_name}** (ID: {profile_id})\n"
-        response += f"Birth date: {birth_date}\n\n"
-        response += f"**All associated data was deleted:**\n"
-        response += f"- Natal chart data (planets, houses, points)\n"
-        response += f"- Locations\n"
-        response += f"- Transit lookups\n\n"
-        response += f"If this was your owner profile, use `setup_owner` to set a new one."
-        
-        return [TextContent(type="text", text=response)]
+        lines = [
+            "✓ Profile deleted permanently!",
+            "",
+            f"Deleted: **{profile_name}** (ID: {profile_id})",
+            f"Birth date: {birth_date}",
+            "",
+            "**All associated data was deleted:**",
+            "- Natal chart data (planets, houses, points)",
+            "- Locations",
+            "- Transit lookups",
+            "",
+            "If this was your owner profile, use `setup_owner` to set a new one.",
+        ]
+        
+        return [TextContent(type="text", text="\n".join(lines))]
         
     except Exception as e:
         return [TextContent(
@@ -466,7 +505,7 @@ async def handle_add_location(db_helper, arguments: dict) -> list[TextContent]:
         set_as_home = arguments.get("set_as_home", False)
         
         # Validate required fields
-        if not all([profile_id, label, latitude, longitude, timezone]):
+        if _missing(arguments, _ADD_LOCATION_FIELDS):
             return [TextContent(
                 type="text",
                 text="Error: Missing required fields (profile_id, label, latitude, longitude, timezone)"
@@ -491,18 +530,22 @@ async def handle_add_location(db_helper, arguments: dict) -> list[TextContent]:
         )
         
         # Format success message
-        response = f"✓ Location added successfully!\n\n"
-        response += f"**{label}** (ID: {location.id})\n"
-        response += f"Profile: {profile.name} (ID: {profile.id})\n"
-        response += f"Coordinates: {latitude}, {longitude}\n"
-        response += f"Timezone: {timezone}\n"
+        lines = [
+            "✓ Location added successfully!",
+            "",
+            f"**{label}** (ID: {location.id})",
+            f"Profile: {profile.name} (ID: {profile.id})",
+            f"Coordinates: {latitude}, {longitude}",
+            f"Timezone: {timezone}",
+            "",
+        ]
         
         if set_as_home:
-            response += f"\n✓ Set as current home location for {profile.name}"
+            lines.append(f"✓ Set as current home location for {profile.name}")
         else:
-            response += f"\nNot set as home. To make this the home location, use add_location with set_as_home=true"
+            lines.append("Not set as home. To make this the home location, use add_location with set_as_home=true")
         
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text="\n".join(lines))]
         
     except ValueError as e:
         # Profile not found error from create_location
@@ -549,11 +592,14 @@ async def handle_remove_location(db_helper, arguments: dict) -> list[TextContent
             )]
         
         # Format success message
-        response = f"✓ Location removed successfully!\n\n"
-        response += f"Deleted: **{location.label}** (ID: {location.id})\n"
-        response += f"Coordinates: {location.latitude}, {location.longitude}"
+        lines = [
+            "✓ Location removed successfully!",
+            "",
+            f"Deleted: **{location.label}** (ID: {location.id})",
+            f"Coordinates: {location.latitude}, {location.longitude}",
+        ]
         
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text="\n".join(lines))]
         
     except ValueError as e:
         # Location is being used as birth location
@@ -572,6 +618,17 @@ async def handle_remove_location(db_helper, arguments: dict) -> list[TextContent
 # Router
 # ============================================================================
 
+PROFILE_TOOL_NAMES = frozenset({
+    "list_profiles",
+    "create_profile",
+    "update_profile",
+    "delete_profile",
+    "setup_owner",
+    "add_location",
+    "remove_location",
+})
+
+
 async def handle_profile_tool(name: str, arguments: Any, db_helper) -> list[TextContent]:
     """Route profile management tool calls to appropriate handlers."""
     
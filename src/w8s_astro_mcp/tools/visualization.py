@@ -3,15 +3,29 @@ Natal Chart Visualization Tool - Cosmic Transit Map Style
 Generates circular natal charts with nebula-inspired colors and metro map clarity.
 """
 
+import hashlib
+import io
+import json
+from collections import OrderedDict
+
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for MCP
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Wedge, Circle
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+# Output resolution: a 14-inch figure at 150 dpi is about 2100 px square
+CHART_DPI = 150
+
+# Rendered images by _render_key(). Each entry is several hundred KB, so keep
+# only the most recent charts.
+RENDER_CACHE_MAXSIZE = 8
+_render_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
 # Zodiac sign data (0° Aries = 0°, going counterclockwise)
 SIGNS = [
     ('Aries', '♈', 0, 'Fire'),
@@ -28,6 +42,9 @@ SIGNS = [
     ('Pisces', '♓', 330, 'Water'),
 ]
 
+# Absolute degree where each sign begins
+SIGN_STARTS = {name: start for name, symbol, start, element in SIGNS}
+
 # Element colors - Nebula inspired
 ELEMENT_COLORS = {
     'Fire': '#FF6B35',      # Bright coral-orange
@@ -73,42 +90,47 @@ PLANET_COLORS = {
 
 def sign_to_absolute_degree(sign_name: str, degree_in_sign: float) -> float:
     """Convert sign + degree to absolute 0-360 degree."""
-    sign_starts = {name: start for name, symbol, start, element in SIGNS}
-    return sign_starts[sign_name] + degree_in_sign
+    return SIGN_STARTS[sign_name] + degree_in_sign
+
+
+def chart_offset(ascendant_degree: float) -> float:
+    """
+    Rotation that puts the Ascendant at 9 o'clock (180° in matplotlib coords).
+    Computed once per chart and passed to every drawing helper.
+    """
+    return (180 - ascendant_degree) % 360
 
 
-def absolute_to_chart_angle(absolute_degree: float, ascendant_degree: float) -> float:
+def absolute_to_chart_angle(absolute_degree: float, offset: float) -> float:
     """
-    Convert absolute zodiac degree to chart angle.
-    Chart has Ascendant at 9 o'clock (180° in matplotlib coords).
+    Convert absolute zodiac degree to chart angle, given chart_offset().
     Zodiac runs counterclockwise.
     """
-    offset = 180 - ascendant_degree
-    angle = (absolute_degree + offset) % 360
-    return angle
+    return (absolute_degree + offset) % 360
 
 
 def draw_star_field(ax, num_stars=150):
     """Draw a subtle star field in the background."""
-    np.random.seed(42)  # Reproducible star positions
+    rng = np.random.RandomState(42)  # Reproducible star positions
     
     # Generate random positions
-    angles = np.random.uniform(0, 2*np.pi, num_stars)
-    radii = np.random.uniform(0.3, 1.15, num_stars)
-    sizes = np.random.uniform(0.5, 3, num_stars)
+    angles = rng.uniform(0, 2*np.pi, num_stars)
+    radii = rng.uniform(0.3, 1.15, num_stars)
+    sizes = rng.uniform(0.5, 3, num_stars)
     
     # Convert to cartesian
     x = radii * np.cos(angles)
     y = radii * np.sin(angles)
     
-    # Draw stars with varying opacity
-    for i in range(num_stars):
-        alpha = np.random.uniform(0.3, 0.9)
-        ax.plot(x[i], y[i], 'o', color='white', markersize=sizes[i], 
-               alpha=alpha, zorder=0)
+    # Draw all stars as one collection with varying opacity
+    # (scatter sizes are areas, so square the marker diameters)
+    colors = np.ones((num_stars, 4))
+    colors[:, 3] = rng.uniform(0.3, 0.9, num_stars)
+    ax.scatter(x, y, s=sizes ** 2, c=colors, marker='o',
+               linewidths=0, zorder=0)
 
 
-def draw_zodiac_wheel(ax, ascendant_degree: float):
+def draw_zodiac_wheel(ax, offset: float):
     """Draw the outer zodiac wheel with element colors."""
     radius_outer = 1.0
     radius_inner = 0.85
@@ -118,8 +140,8 @@ def draw_zodiac_wheel(ax, ascendant_degree: float):
         color = ELEMENT_COLORS[element]
         
         # Convert to chart angles
-        start_angle = absolute_to_chart_angle(start_deg, ascendant_degree)
-        end_angle = absolute_to_chart_angle((start_deg + 30) % 360, ascendant_degree)
+        start_angle = absolute_to_chart_angle(start_deg, offset)
+        end_angle = absolute_to_chart_angle((start_deg + 30) % 360, offset)
         
         # Handle wrapping around 360°
         if end_angle < start_angle:
@@ -138,7 +160,7 @@ def draw_zodiac_wheel(ax, ascendant_degree: float):
             ax.add_patch(wedge)
         
         # Place sign symbol (white for contrast)
-        mid_angle = absolute_to_chart_angle(start_deg + 15, ascendant_degree)
+        mid_angle = absolute_to_chart_angle(start_deg + 15, offset)
         mid_rad = np.radians(mid_angle)
         label_radius = (radius_outer + radius_inner) / 2
         x = label_radius * np.cos(mid_rad)
@@ -147,33 +169,29 @@ def draw_zodiac_wheel(ax, ascendant_degree: float):
                weight='bold', color='white', zorder=3)
 
 
-def draw_degree_markers(ax, ascendant_degree: float):
+def draw_degree_markers(ax, offset: float):
     """Draw degree markers around the outer edge."""
     radius = 1.02
     
-    # Draw markers every 5 degrees
-    for degree in range(0, 360, 5):
-        angle = absolute_to_chart_angle(degree, ascendant_degree)
-        rad = np.radians(angle)
-        
-        # Longer tick every 10 degrees
-        if degree % 10 == 0:
-            inner_r = 0.98
-            linewidth = 1.5
-        else:
-            inner_r = 0.99
-            linewidth = 0.8
-        
-        x_outer = radius * np.cos(rad)
-        y_outer = radius * np.sin(rad)
-        x_inner = inner_r * np.cos(rad)
-        y_inner = inner_r * np.sin(rad)
-        
-        ax.plot([x_inner, x_outer], [y_inner, y_outer], 
-               color=LINES, linewidth=linewidth, alpha=0.6, zorder=2)
+    # Markers every 5 degrees, computed for all 72 at once
+    degrees = np.arange(0, 360, 5)
+    rad = np.radians(absolute_to_chart_angle(degrees, offset))
+    cos_a = np.cos(rad)
+    sin_a = np.sin(rad)
+    
+    # Longer, heavier tick every 10 degrees
+    major = degrees % 10 == 0
+    inner_r = np.where(major, 0.98, 0.99)
+    linewidths = np.where(major, 1.5, 0.8)
+    
+    inner = np.column_stack([inner_r * cos_a, inner_r * sin_a])
+    outer = np.column_stack([radius * cos_a, radius * sin_a])
+    ax.add_collection(LineCollection(
+        np.stack([inner, outer], axis=1),
+        colors=LINES, linewidths=linewidths, alpha=0.6, zorder=2))
 
 
-def draw_houses(ax, houses: Dict[str, Dict], ascendant_degree: float):
+def draw_houses(ax, houses: Dict[str, Dict], offset: float):
     """Draw house divisions."""
     radius = 0.85
     
@@ -185,7 +203,7 @@ def draw_houses(ax, houses: Dict[str, Dict], ascendant_degree: float):
                 houses[house_key]['degree']
             )
             
-            cusp_angle = absolute_to_chart_angle(cusp_absolute, ascendant_degree)
+            cusp_angle = absolute_to_chart_angle(cusp_absolute, offset)
             cusp_rad = np.radians(cusp_angle)
             
             x_inner = 0.3 * np.cos(cusp_rad)
@@ -209,7 +227,7 @@ def draw_houses(ax, houses: Dict[str, Dict], ascendant_degree: float):
                            linewidth=1, alpha=0.9), zorder=4)
 
 
-def draw_planets(ax, planets: Dict[str, Dict], ascendant_degree: float):
+def draw_planets(ax, planets: Dict[str, Dict], offset: float):
     """Draw planets with glowing effect."""
     planet_radius = 0.6
     
@@ -218,7 +236,7 @@ def draw_planets(ax, planets: Dict[str, Dict], ascendant_degree: float):
             continue
             
         absolute_deg = sign_to_absolute_degree(data['sign'], data['degree'])
-        chart_angle = absolute_to_chart_angle(absolute_deg, ascendant_degree)
+        chart_angle = absolute_to_chart_angle(absolute_deg, offset)
         chart_rad = np.radians(chart_angle)
         
         x = planet_radius * np.cos(chart_rad)
@@ -248,6 +266,9 @@ def create_natal_chart(planets: Dict[str, Dict],
     """
     Create a natal chart visualization and save to file.
     
+    Rendered images are kept in memory by chart content, title and format,
+    so drawing the same chart again only writes the stored image.
+    
     Args:
         planets: Dict of planet positions {name: {sign: str, degree: float}}
         houses: Dict of house cusps {house_num: {sign: str, degree: float}}
@@ -260,7 +281,42 @@ def create_natal_chart(planets: Dict[str, Dict],
     """
     if output_path is None:
         output_path = "natal_chart.png"
+    output_path = Path(output_path).expanduser().resolve()
+    image_format = output_path.suffix.lstrip('.').lower() or 'png'
+    
+    key = _render_key(planets, houses, points, chart_title, image_format)
+    image = _render_cache.get(key)
+    if image is None:
+        image = _render_chart(planets, houses, points, chart_title, image_format)
+        _render_cache[key] = image
+        if len(_render_cache) > RENDER_CACHE_MAXSIZE:
+            _render_cache.popitem(last=False)
+    else:
+        _render_cache.move_to_end(key)
     
+    output_path.write_bytes(image)
+    return str(output_path)
+
+
+def _render_key(planets: Dict[str, Dict],
+                houses: Dict[str, Dict],
+                points: Dict[str, Dict],
+                chart_title: str,
+                image_format: str) -> str:
+    """Stable digest of everything that affects the rendered image."""
+    payload = json.dumps(
+        [planets, houses, points, chart_title, image_format],
+        sort_keys=True, default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _render_chart(planets: Dict[str, Dict],
+                  houses: Dict[str, Dict],
+                  points: Dict[str, Dict],
+                  chart_title: str,
+                  image_format: str) -> bytes:
+    """Draw the chart and return the encoded image."""
     # Create figure with dark background
     fig, ax = plt.subplots(1, 1, figsize=(14, 14), facecolor=BACKGROUND)
     ax.set_facecolor(BACKGROUND)
@@ -274,12 +330,14 @@ def create_natal_chart(planets: Dict[str, Dict],
         points['Ascendant']['degree']
     )
     
+    offset = chart_offset(ascendant_absolute)
+    
     # Draw layers from back to front
     draw_star_field(ax, num_stars=150)
-    draw_zodiac_wheel(ax, ascendant_absolute)
-    draw_degree_markers(ax, ascendant_absolute)
-    draw_houses(ax, houses, ascendant_absolute)
-    draw_planets(ax, planets, ascendant_absolute)
+    draw_zodiac_wheel(ax, offset)
+    draw_degree_markers(ax, offset)
+    draw_houses(ax, houses, offset)
+    draw_planets(ax, planets, offset)
     
     # Mark Ascendant with gold line
     asc_angle = 180  # Ascendant at 9 o'clock
@@ -300,7 +358,7 @@ def create_natal_chart(planets: Dict[str, Dict],
         mc_absolute = None
     
     if mc_absolute is not None:
-        mc_angle = absolute_to_chart_angle(mc_absolute, ascendant_absolute)
+        mc_angle = absolute_to_chart_angle(mc_absolute, offset)
         mc_rad = np.radians(mc_angle)
         ax.plot([0, 0.85 * np.cos(mc_rad)], [0, 0.85 * np.sin(mc_rad)],
                color=ACCENT_GOLD, linewidth=3.5, alpha=0.7, 
@@ -324,10 +382,14 @@ def create_natal_chart(planets: Dict[str, Dict],
     
     plt.tight_layout()
     
-    # Save
-    output_path = Path(output_path).expanduser().resolve()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', 
-               facecolor=BACKGROUND, edgecolor='none')
-    plt.close(fig)
+    # Encode
+    # Fast zlib level for PNG: at this size compression dominates save time
+    extra = {'pil_kwargs': {'compress_level': 1}} if image_format == 'png' else {}
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=image_format, dpi=CHART_DPI, bbox_inches='tight', 
+                    facecolor=BACKGROUND, edgecolor='none', **extra)
+    finally:
+        plt.close(fig)
     
-    return str(output_path)
+    return buffer.getvalue()
@@ -11,7 +11,7 @@ COMPOSITE CHART
 DAVISON CHART
   The midpoint datetime (arithmetic mean of birth datetimes expressed as
   Unix timestamps) and midpoint location (arithmetic mean of birth lat/lng)
-  define a real moment in time and space. A real swetest call is made for
+  define a real moment in time and space. A real ephemeris calculation is made for
   that moment, so the Davison chart is a genuine chart, not just averaged
   positions. The midpoint datetime and location are stored in ConnectionChart
   so the chart can be verified and re-cast if needed.
@@ -26,9 +26,12 @@ References:
 
 import math
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Callable, Dict, Any, List, Tuple, Optional
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
+from ..constants import ZODIAC_SIGNS
 from ..models import (
     Profile, Location, HouseSystem,
     NatalPlanet, NatalHouse, NatalPoint,
@@ -36,6 +39,10 @@ from ..models import (
 )
 
 
+# Absolute longitude where each sign begins
+SIGN_OFFSETS = {name: i * 30 for i, name in enumerate(ZODIAC_SIGNS)}
+
+
 # ---------------------------------------------------------------------------
 # Circular mean helper
 # ---------------------------------------------------------------------------
@@ -60,8 +67,11 @@ def circular_mean_degrees(angles: List[float]) -> float:
     if not angles:
         raise ValueError("Cannot compute circular mean of empty list")
 
-    sin_sum = sum(math.sin(math.radians(a)) for a in angles)
-    cos_sum = sum(math.cos(math.radians(a)) for a in angles)
+    sin_sum = cos_sum = 0.0
+    for a in angles:
+        r = math.radians(a)
+        sin_sum += math.sin(r)
+        cos_sum += math.cos(r)
     mean_rad = math.atan2(sin_sum, cos_sum)
     mean_deg = math.degrees(mean_rad) % 360.0
     # Normalize: floating point can produce exactly 360.0 from % 360.0
@@ -80,14 +90,9 @@ def degrees_to_sign_components(absolute_position: float) -> Tuple[str, int, int,
     Returns:
         (sign_name, degree_within_sign, minutes, seconds)
     """
-    SIGN_NAMES = [
-        "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-        "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-    ]
-
     pos = absolute_position % 360.0
     sign_index = int(round(pos, 10) // 30)  # round to 10dp to avoid float boundary errors
-    sign = SIGN_NAMES[sign_index]
+    sign = ZODIAC_SIGNS[sign_index]
 
     within_sign = pos - (sign_index * 30.0)
     degree = int(within_sign)
@@ -128,73 +133,53 @@ def calculate_composite_positions(
     if len(natal_charts) < 2:
         raise ValueError("Composite chart requires at least 2 natal charts")
 
-    result: Dict[str, Any] = {"planets": {}, "houses": {}, "points": {}}
-
-    # --- Planets ---
-    # Collect all planet names present in ALL charts (intersection)
-    all_planet_names = set(natal_charts[0]["planets"].keys())
-    for chart in natal_charts[1:]:
-        all_planet_names &= set(chart["planets"].keys())
-
-    for planet_name in sorted(all_planet_names):
-        positions = []
-        for chart in natal_charts:
-            p = chart["planets"][planet_name]
-            positions.append(p["absolute_position"])
-
-        avg = circular_mean_degrees(positions)
-        sign, degree, minutes, seconds = degrees_to_sign_components(avg)
-        result["planets"][planet_name] = {
-            "absolute_position": avg,
-            "sign": sign,
-            "degree": degree,
-            "minutes": minutes,
-            "seconds": seconds,
-        }
-
-    # --- Houses ---
-    # Use string keys ("1"-"12") to match the rest of the codebase
-    all_house_keys = set(natal_charts[0]["houses"].keys())
-    for chart in natal_charts[1:]:
-        all_house_keys &= set(chart["houses"].keys())
+    return {
+        "planets": _composite_section(natal_charts, "planets", sorted),
+        # String keys ("1"-"12") to match the rest of the codebase, in numeric order
+        "houses": _composite_section(
+            natal_charts, "houses", lambda keys: sorted(keys, key=int)
+        ),
+        # ASC, MC, etc.
+        "points": _composite_section(natal_charts, "points", sorted),
+    }
 
-    for house_key in sorted(all_house_keys, key=lambda x: int(x)):
-        positions = []
-        for chart in natal_charts:
-            h = chart["houses"][house_key]
-            positions.append(h["absolute_position"])
 
-        avg = circular_mean_degrees(positions)
-        sign, degree, minutes, seconds = degrees_to_sign_components(avg)
-        result["houses"][house_key] = {
-            "absolute_position": avg,
-            "sign": sign,
-            "degree": degree,
-            "minutes": minutes,
-            "seconds": seconds,
-        }
+def _composite_section(
+    natal_charts: List[Dict[str, Any]],
+    section: str,
+    order: Callable[[set], List[str]],
+) -> Dict[str, Any]:
+    """Circularly average one section ('planets', 'houses' or 'points').
 
-    # --- Points (ASC, MC, etc.) ---
-    all_point_keys = set(natal_charts[0]["points"].keys())
+    Only names present in every chart are averaged. All of them are reduced
+    at once from a (names, charts) matrix of absolute positions.
+    """
+    # Names present in ALL charts (intersection)
+    names = set(natal_charts[0][section].keys())
     for chart in natal_charts[1:]:
-        all_point_keys &= set(chart["points"].keys())
-
-    for point_key in sorted(all_point_keys):
-        positions = []
-        for chart in natal_charts:
-            pt = chart["points"][point_key]
-            positions.append(pt["absolute_position"])
+        names &= set(chart[section].keys())
+    names = order(names)
+    if not names:
+        return {}
+
+    rad = np.radians([
+        [chart[section][name]["absolute_position"] for chart in natal_charts]
+        for name in names
+    ])
+    means = np.degrees(np.arctan2(np.sin(rad).sum(axis=1), np.cos(rad).sum(axis=1))) % 360.0
+    # Normalize: floating point can produce exactly 360.0 from % 360.0
+    means[means == 360.0] = 0.0
 
-        avg = circular_mean_degrees(positions)
+    result = {}
+    for name, avg in zip(names, means.tolist()):
         sign, degree, minutes, seconds = degrees_to_sign_components(avg)
-        result["points"][point_key] = {
+        result[name] = {
             "absolute_position": avg,
             "sign": sign,
             "degree": degree,
             "minutes": minutes,
             "seconds": seconds,
         }
-
     return result
 
 
@@ -285,12 +270,6 @@ def enrich_natal_chart_for_composite(chart_data: Dict[str, Any]) -> Dict[str, An
     Returns:
         Enriched chart_data with absolute_position guaranteed on each entry
     """
-    SIGN_OFFSETS = {
-        "Aries": 0, "Taurus": 30, "Gemini": 60, "Cancer": 90,
-        "Leo": 120, "Virgo": 150, "Libra": 180, "Scorpio": 210,
-        "Sagittarius": 240, "Capricorn": 270, "Aquarius": 300, "Pisces": 330,
-    }
-
     for planet_name, pdata in chart_data.get("planets", {}).items():
         if "absolute_position" not in pdata:
             offset = SIGN_OFFSETS.get(pdata["sign"], 0)
@@ -4,9 +4,13 @@ Provides high-level database operations for the MCP server.
 """
 
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from sqlalchemy import and_
+
 from ..database import get_database_path, create_db_engine, get_session, get_session_factory
 from ..models import (
     AppSettings, Profile, Location, HouseSystem,
@@ -15,6 +19,19 @@ from ..models import (
 )
 from .transit_logger import save_transit_data_to_db
 
+# SQLite's default limit on bound parameters per statement; IN (...) lookups
+# are chunked to stay under it.
+_SQLITE_MAX_VARIABLES = 999
+
+# Julian Day at 12:00 UT of a date is date.toordinal() + this.
+_ORDINAL_NOON_JD = 1721425.0
+
+
+def _id_chunks(ids: List[int]):
+    """Yield slices of ids small enough for one IN (...) clause."""
+    for start in range(0, len(ids), _SQLITE_MAX_VARIABLES):
+        yield ids[start:start + _SQLITE_MAX_VARIABLES]
+
 
 class DatabaseHelper:
     """Helper class for database operations."""
@@ -48,10 +65,13 @@ class DatabaseHelper:
         Returns None if owner has not been configured yet.
         """
         with get_session(self.engine) as session:
-            settings = session.query(AppSettings).filter_by(id=1).first()
-            if not settings or not settings.owner_profile_id:
-                return None
-            return session.query(Profile).filter_by(id=settings.owner_profile_id).first()
+            # One SELECT: resolve the owner id and load the profile together.
+            return (
+                session.query(Profile)
+                .join(AppSettings, AppSettings.owner_profile_id == Profile.id)
+                .filter(AppSettings.id == 1)
+                .first()
+            )
 
     def set_owner_profile(self, profile_id: int) -> bool:
         """
@@ -79,12 +99,47 @@ class DatabaseHelper:
     def get_profile_by_id(self, profile_id: int) -> Optional[Profile]:
         """Get profile by ID."""
         with get_session(self.engine) as session:
-            return session.query(Profile).filter_by(id=profile_id).first()
+            return session.get(Profile, profile_id)
+    
+    def get_profiles_by_ids(self, profile_ids: List[int]) -> List[Profile]:
+        """
+        Get profiles for several IDs with one IN (...) query per 999 IDs.
+        
+        Returns:
+            Found profiles in the order their IDs first appear in profile_ids;
+            missing IDs are skipped.
+        """
+        unique_ids = list(dict.fromkeys(profile_ids))
+        by_id = {}
+        with get_session(self.engine) as session:
+            for chunk in _id_chunks(unique_ids):
+                for profile in session.query(Profile).filter(Profile.id.in_(chunk)):
+                    by_id[profile.id] = profile
+        return [by_id[pid] for pid in unique_ids if pid in by_id]
     
     def get_birth_location(self, profile: Profile) -> Optional[Location]:
         """Get birth location for a profile."""
         with get_session(self.engine) as session:
-            return session.query(Location).filter_by(id=profile.birth_location_id).first()
+            return session.get(Location, profile.birth_location_id)
+    
+    def get_birth_locations_bulk(self, profiles: List[Profile]) -> Dict[int, Location]:
+        """
+        Get birth locations for several profiles with one IN (...) query.
+        
+        Returns:
+            Dict mapping profile.id -> birth Location; profiles whose
+            location is missing are absent.
+        """
+        location_ids = list({p.birth_location_id for p in profiles})
+        by_id = {}
+        with get_session(self.engine) as session:
+            for chunk in _id_chunks(location_ids):
+                for loc in session.query(Location).filter(Location.id.in_(chunk)):
+                    by_id[loc.id] = loc
+        return {
+            p.id: by_id[p.birth_location_id]
+            for p in profiles if p.birth_location_id in by_id
+        }
     
     def get_current_home_location(self, profile: Profile) -> Optional[Location]:
         """Get current home location for a profile.
@@ -120,69 +175,127 @@ class DatabaseHelper:
         Returns dict with 'planets', 'houses', 'points', 'metadata' keys.
         """
         with get_session(self.engine) as session:
-            # Get planets
             planets_query = session.query(NatalPlanet).filter_by(profile_id=profile.id).all()
-            planets = {}
-            for p in planets_query:
-                planets[p.planet] = {
-                    'sign': p.sign,
-                    'degree': p.absolute_position % 30,  # Degree within sign
-                    'formatted': p.formatted_position,
-                }
-            
-            # Get houses
             houses_query = session.query(NatalHouse).filter_by(
                 profile_id=profile.id,
                 house_system_id=profile.preferred_house_system_id
             ).all()
-            houses = {}
-            for h in houses_query:
-                houses[str(h.house_number)] = {
-                    'sign': h.sign,
-                    'degree': h.absolute_position % 30,
-                    'formatted': h.formatted_position,
-                }
-            
-            # Get points
             points_query = session.query(NatalPoint).filter_by(
                 profile_id=profile.id,
                 house_system_id=profile.preferred_house_system_id
             ).all()
-            points = {}
-            for pt in points_query:
-                points[pt.point_type] = {
-                    'sign': pt.sign,
-                    'degree': pt.absolute_position % 30,
-                    'formatted': pt.formatted_position,
-                }
             
-            # Get birth location
-            birth_loc = session.query(Location).filter_by(id=profile.birth_location_id).first()
+            return self._format_natal_chart(
+                session, profile, profile.preferred_house_system_id,
+                planets_query, houses_query, points_query,
+            )
+
+    def get_natal_chart_data_bulk(self, profiles: List[Profile]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get natal chart data for several profiles with one query per table.
+        
+        Returns:
+            Dict mapping profile.id -> the same dict get_natal_chart_data()
+            returns for that profile.
+        """
+        ids = list(dict.fromkeys(p.id for p in profiles))
+        planets_by = {pid: [] for pid in ids}
+        houses_by = {pid: [] for pid in ids}
+        points_by = {pid: [] for pid in ids}
+        with get_session(self.engine) as session:
+            for chunk in _id_chunks(ids):
+                for model, rows_by in (
+                    (NatalPlanet, planets_by),
+                    (NatalHouse, houses_by),
+                    (NatalPoint, points_by),
+                ):
+                    rows = (
+                        session.query(model)
+                        .filter(model.profile_id.in_(chunk))
+                        .order_by(model.profile_id, model.id)
+                    )
+                    for row in rows:
+                        rows_by[row.profile_id].append(row)
             
-            # Get house system
-            house_system = session.query(HouseSystem).filter_by(
-                id=profile.preferred_house_system_id
-            ).first()
+            # Load birth locations and house systems into the identity map so
+            # _format_natal_chart's session.get() calls don't hit the database.
+            # The identity map is weak-referencing: keep the rows alive here.
+            location_ids = list({p.birth_location_id for p in profiles})
+            preloaded = session.query(HouseSystem).all()
+            for chunk in _id_chunks(location_ids):
+                preloaded += session.query(Location).filter(Location.id.in_(chunk)).all()
             
-            return {
-                'planets': planets,
-                'houses': houses,
-                'points': points,
-                'metadata': {
-                    'date': profile.birth_date,
-                    'time': profile.birth_time,
-                    'latitude': birth_loc.latitude if birth_loc else None,
-                    'longitude': birth_loc.longitude if birth_loc else None,
-                    'house_system': house_system.name if house_system else 'Placidus'
-                }
+            result = {}
+            for profile in profiles:
+                hs_id = profile.preferred_house_system_id
+                result[profile.id] = self._format_natal_chart(
+                    session, profile, hs_id,
+                    planets_by[profile.id],
+                    [h for h in houses_by[profile.id] if h.house_system_id == hs_id],
+                    [pt for pt in points_by[profile.id] if pt.house_system_id == hs_id],
+                )
+            return result
+
+    @staticmethod
+    def _format_natal_chart(
+        session,
+        profile: Profile,
+        house_system_id: Optional[int],
+        planets_rows: List[NatalPlanet],
+        houses_rows: List[NatalHouse],
+        points_rows: List[NatalPoint],
+    ) -> Dict[str, Any]:
+        """Shape natal rows into the chart dict returned by get_natal_chart_data()."""
+        planets = {}
+        for p in planets_rows:
+            planets[p.planet] = {
+                'sign': p.sign,
+                'degree': p.absolute_position % 30,  # Degree within sign
+                'formatted': p.formatted_position,
+            }
+        
+        # String keys ("1"-"12") to match the rest of the codebase
+        houses = {}
+        for h in houses_rows:
+            houses[str(h.house_number)] = {
+                'sign': h.sign,
+                'degree': h.absolute_position % 30,
+                'formatted': h.formatted_position,
             }
+        
+        points = {}
+        for pt in points_rows:
+            points[pt.point_type] = {
+                'sign': pt.sign,
+                'degree': pt.absolute_position % 30,
+                'formatted': pt.formatted_position,
+            }
+        
+        birth_loc = session.get(Location, profile.birth_location_id)
+        house_system = (
+            session.get(HouseSystem, house_system_id)
+            if house_system_id is not None else None
+        )
+        
+        return {
+            'planets': planets,
+            'houses': houses,
+            'points': points,
+            'metadata': {
+                'date': profile.birth_date,
+                'time': profile.birth_time,
+                'latitude': birth_loc.latitude if birth_loc else None,
+                'longitude': birth_loc.longitude if birth_loc else None,
+                'house_system': house_system.name if house_system else 'Placidus'
+            }
+        }
     
     def save_natal_chart(
         self,
         profile: Profile,
         chart_data: Dict[str, Any],
         house_system_id: int,
-    ) -> None:
+    ) -> Dict[str, Any]:
         """
         Persist a calculated natal chart for a profile.
 
@@ -194,11 +307,20 @@ class DatabaseHelper:
             profile:        Profile to save data for.
             chart_data:     Chart dict from EphemerisEngine.get_chart().
             house_system_id: House system used for the calculation.
+
+        Returns:
+            The saved chart in the same format as get_natal_chart_data(),
+            built from the rows just written so no re-read is needed.
         """
         from .natal_saver import save_natal_data_to_db
 
         with get_session(self.engine) as session:
-            save_natal_data_to_db(session, profile, chart_data, house_system_id)
+            planets, houses, points = save_natal_data_to_db(
+                session, profile, chart_data, house_system_id
+            )
+            return self._format_natal_chart(
+                session, profile, house_system_id, planets, houses, points
+            )
 
     def get_transit_history(
         self,
@@ -215,10 +337,14 @@ class DatabaseHelper:
         Filters are all optional and combinable:
         - after/before:  ISO date strings (YYYY-MM-DD) for a date range
         - planet:        e.g. "Mercury" — only return lookups where that planet
-                         appears in the results
+                         appears in the results; each row's planets dict then
+                         holds just that planet
         - sign:          e.g. "Scorpio" — further filter by the planet's sign
         - limit:         max number of lookup rows returned (default 20)
 
+        All filters and the limit are applied in SQL, and planet rows for
+        every returned lookup are fetched in a single IN query.
+
         Returns a list of dicts, newest first, each containing:
             lookup_datetime, location_label, planets (dict of planet→sign/degree)
         """
@@ -245,26 +371,32 @@ class DatabaseHelper:
             query = query.order_by(TransitLookup.lookup_datetime.desc()).limit(limit)
             lookups = query.all()
 
-            results = []
-            for lookup in lookups:
-                # Fetch all planets for this lookup
-                planet_rows = session.query(TransitPlanet).filter_by(
-                    transit_lookup_id=lookup.id
-                ).all()
-                planets_dict = {
-                    p.planet: {
+            # Fetch planets for all lookups at once (only the filtered planet
+            # when one was requested) instead of one query per lookup.
+            planets_by_lookup: Dict[int, Dict[str, Any]] = {
+                lookup.id: {} for lookup in lookups
+            }
+            if lookups:
+                planet_query = session.query(TransitPlanet).filter(
+                    TransitPlanet.transit_lookup_id.in_(planets_by_lookup)
+                )
+                if planet:
+                    planet_query = planet_query.filter(TransitPlanet.planet == planet)
+                for p in planet_query.order_by(TransitPlanet.id):
+                    planets_by_lookup[p.transit_lookup_id][p.planet] = {
                         "sign": p.sign,
                         "degree": round(p.absolute_position % 30, 2),
                         "is_retrograde": p.is_retrograde,
                     }
-                    for p in planet_rows
-                }
+
+            results = []
+            for lookup in lookups:
                 results.append({
                     "lookup_datetime": lookup.lookup_datetime.isoformat(),
                     "location_label": lookup.location_snapshot_label,
                     "latitude": lookup.location_snapshot_latitude,
                     "longitude": lookup.location_snapshot_longitude,
-                    "planets": planets_dict,
+                    "planets": planets_by_lookup[lookup.id],
                 })
 
             return results
@@ -348,7 +480,7 @@ class DatabaseHelper:
         prev_chart = None
 
         for d in dates:
-            chart = engine.get_chart(lat, lng, d.isoformat(), "12:00")
+            chart = engine.get_chart_jd(d.toordinal() + _ORDINAL_NOON_JD, lat, lng)
             if prev_chart is None:
                 prev_chart = chart
                 continue
@@ -801,6 +933,32 @@ class DatabaseHelper:
         with get_session(self.engine) as session:
             return session.query(Connection).order_by(Connection.label).all()
 
+    def list_connection_summaries(self) -> list:
+        """
+        Return (connection, member_names) for every connection in one query.
+        
+        Connections are ordered by label, like list_all_connections.
+        member_names is the members' names joined with ", " in the order they
+        were added ("" when none). Use this when only names are needed; it
+        materializes no Profile objects.
+        """
+        from ..models import Connection, ConnectionMember
+        with get_session(self.engine) as session:
+            rows = (
+                session.query(Connection, Profile.name)
+                .outerjoin(ConnectionMember, ConnectionMember.connection_id == Connection.id)
+                .outerjoin(Profile, Profile.id == ConnectionMember.profile_id)
+                .order_by(Connection.label, Connection.id, ConnectionMember.id)
+                .all()
+            )
+        # The ORDER BY keeps each connection's rows contiguous and its members
+        # in insertion order, which groupby and the join below rely on.
+        # (GROUP_CONCAT's own ORDER BY needs SQLite 3.44+.)
+        return [
+            (conn, ", ".join(name for _, name in group if name is not None))
+            for conn, group in groupby(rows, key=itemgetter(0))
+        ]
+
     def get_connection_by_id(self, connection_id: int):
         """Return a Connection by ID, or None."""
         from ..models import Connection
@@ -819,22 +977,58 @@ class DatabaseHelper:
             )
             return rows
 
+    def fetch_connection_mutation_context(self, connection_id: int, profile_id: int) -> tuple:
+        """
+        Return (connection, profile, member_count) in one round-trip.
+        
+        connection and profile are None when not found. Used by the
+        add/remove member tools to validate before mutating.
+        """
+        from ..models import Connection, ConnectionMember
+        from sqlalchemy import func, literal, select
+        anchor = select(literal(1).label("anchor")).subquery()
+        member_count = (
+            select(func.count(ConnectionMember.id))
+            .where(ConnectionMember.connection_id == connection_id)
+            .scalar_subquery()
+        )
+        with get_session(self.engine) as session:
+            connection, profile, count = (
+                session.query(Connection, Profile, member_count)
+                .select_from(anchor)
+                .outerjoin(Connection, Connection.id == connection_id)
+                .outerjoin(Profile, Profile.id == profile_id)
+                .one()
+            )
+            return connection, profile, count
+
     def add_connection_member(self, connection_id: int, profile_id: int) -> None:
-        """Add a profile to a connection (raises IntegrityError on duplicate)."""
+        """
+        Add a profile to a connection (raises IntegrityError on duplicate).
+        
+        Cached charts for the connection are invalidated in the same
+        transaction.
+        """
         from ..models import ConnectionMember
         with get_session(self.engine) as session:
             session.add(ConnectionMember(connection_id=connection_id, profile_id=profile_id))
+            self._invalidate_connection_charts(session, connection_id)
             session.commit()
 
     def remove_connection_member(self, connection_id: int, profile_id: int) -> None:
-        """Remove a profile from a connection."""
+        """
+        Remove a profile from a connection.
+        
+        Cached charts for the connection are invalidated in the same
+        transaction when a member was actually removed.
+        """
         from ..models import ConnectionMember
         with get_session(self.engine) as session:
-            row = session.query(ConnectionMember).filter_by(
+            removed = session.query(ConnectionMember).filter_by(
                 connection_id=connection_id, profile_id=profile_id
-            ).first()
-            if row:
-                session.delete(row)
+            ).delete()
+            if removed:
+                self._invalidate_connection_charts(session, connection_id)
                 session.commit()
 
     def delete_connection(self, connection_id: int) -> bool:
@@ -856,18 +1050,42 @@ class DatabaseHelper:
                 connection_id=connection_id, chart_type=chart_type
             ).first()
 
+    def get_connection_with_cached_chart(self, connection_id: int, chart_type: str) -> tuple:
+        """
+        Return (connection, valid cached chart) in one query.
+        
+        connection is None when it doesn't exist; the chart is None when
+        there is no cached chart of this type or it has been invalidated.
+        """
+        from ..models import Connection, ConnectionChart
+        with get_session(self.engine) as session:
+            row = (
+                session.query(Connection, ConnectionChart)
+                .outerjoin(ConnectionChart, and_(
+                    ConnectionChart.connection_id == Connection.id,
+                    ConnectionChart.chart_type == chart_type,
+                    ConnectionChart.is_valid.is_(True),
+                ))
+                .filter(Connection.id == connection_id)
+                .first()
+            )
+            return tuple(row) if row else (None, None)
+
     def invalidate_connection_charts(self, connection_id: int) -> None:
         """Mark all charts for a connection as invalid."""
-        from ..models import ConnectionChart
-        from datetime import timezone
         with get_session(self.engine) as session:
-            charts = session.query(ConnectionChart).filter_by(
-                connection_id=connection_id
-            ).all()
-            for chart in charts:
-                chart.is_valid = False
+            self._invalidate_connection_charts(session, connection_id)
             session.commit()
 
+    @staticmethod
+    def _invalidate_connection_charts(session, connection_id: int) -> None:
+        """Invalidate a connection's charts with one UPDATE in the caller's session."""
+        from ..models import ConnectionChart
+        session.query(ConnectionChart).filter_by(connection_id=connection_id).update(
+            {ConnectionChart.is_valid: False, ConnectionChart.rendered_text: None},
+            synchronize_session=False,
+        )
+
     @staticmethod
     def _normalize_position(data: dict) -> dict:
         """
@@ -916,6 +1134,7 @@ class DatabaseHelper:
         Each value is a dict: {name: {absolute_position, sign, degree, minutes, seconds, ...}}
         """
         from datetime import timezone as tz
+        from sqlalchemy import insert
         from ..models import (
             ConnectionChart, ConnectionPlanet, ConnectionHouse,
             ConnectionPoint, HouseSystem, HOUSE_SYSTEM_SEED_DATA,
@@ -932,6 +1151,7 @@ class DatabaseHelper:
                 session.add(chart)
 
             chart.is_valid = True
+            chart.rendered_text = None
             chart.calculated_at = datetime.now(tz.utc)
             chart.calculation_method = calculation_method
             chart.ephemeris_version = "2.10"
@@ -949,13 +1169,12 @@ class DatabaseHelper:
             hs = session.query(HouseSystem).filter_by(code="P").first()
             hs_id = hs.id if hs else None
 
-            # Replace planets
-            session.query(ConnectionPlanet).filter_by(
-                connection_chart_id=chart.id
-            ).delete()
+            # Replace planets, houses and points: one DELETE and one
+            # executemany INSERT per table, all in this transaction.
+            planet_rows = []
             for planet_name, data in positions.get("planets", {}).items():
                 d = self._normalize_position(data)
-                session.add(ConnectionPlanet(
+                planet_rows.append(dict(
                     connection_chart_id=chart.id,
                     planet=planet_name,
                     degree=int(d["degree"]),
@@ -967,13 +1186,10 @@ class DatabaseHelper:
                     calculation_method=calculation_method,
                 ))
 
-            # Replace houses
-            session.query(ConnectionHouse).filter_by(
-                connection_chart_id=chart.id
-            ).delete()
+            house_rows = []
             for house_key, data in positions.get("houses", {}).items():
                 d = self._normalize_position(data)
-                session.add(ConnectionHouse(
+                house_rows.append(dict(
                     connection_chart_id=chart.id,
                     house_system_id=hs_id,
                     house_number=int(house_key),
@@ -985,13 +1201,10 @@ class DatabaseHelper:
                     calculation_method=calculation_method,
                 ))
 
-            # Replace points
-            session.query(ConnectionPoint).filter_by(
-                connection_chart_id=chart.id
-            ).delete()
+            point_rows = []
             for point_type, data in positions.get("points", {}).items():
                 d = self._normalize_position(data)
-                session.add(ConnectionPoint(
+                point_rows.append(dict(
                     connection_chart_id=chart.id,
                     house_system_id=hs_id,
                     point_type=point_type,
@@ -1003,10 +1216,28 @@ class DatabaseHelper:
                     calculation_method=calculation_method,
                 ))
 
+            for model, rows in (
+                (ConnectionPlanet, planet_rows),
+                (ConnectionHouse, house_rows),
+                (ConnectionPoint, point_rows),
+            ):
+                session.query(model).filter_by(connection_chart_id=chart.id).delete()
+                if rows:
+                    session.execute(insert(model), rows)
+
             session.commit()
             session.refresh(chart)
             return chart
 
+    def set_connection_chart_rendered_text(self, connection_chart_id: int, text: str) -> None:
+        """Store the rendered position sections for a cached chart."""
+        from ..models import ConnectionChart
+        with get_session(self.engine) as session:
+            session.query(ConnectionChart).filter_by(id=connection_chart_id).update(
+                {ConnectionChart.rendered_text: text}
+            )
+            session.commit()
+
     def get_connection_planets(self, connection_chart_id: int) -> list:
         """Return ConnectionPlanet rows for a chart."""
         from ..models import ConnectionPlanet
@@ -1031,6 +1262,39 @@ class DatabaseHelper:
                 connection_chart_id=connection_chart_id
             ).order_by(ConnectionPoint.point_type).all()
 
+    def get_connection_chart_rows(self, connection_chart_id: int) -> Dict[str, list]:
+        """
+        Return a chart's planet, house and point rows in one UNION ALL query.
+        
+        Returns:
+            {"planets": [...], "houses": [...], "points": [...]} where each
+            entry is (name, formatted_position) and name is the planet, house
+            number (int) or point type. Order matches get_connection_planets /
+            get_connection_houses / get_connection_points.
+        """
+        from ..models import ConnectionPlanet, ConnectionHouse, ConnectionPoint
+        from sqlalchemy import literal, literal_column, select, union_all
+        from .position_utils import format_position
+        kinds = ("planets", "houses", "points")
+        stmt = union_all(*(
+            select(
+                literal(n).label("kind"), name.label("name"),
+                model.degree, model.minutes, model.seconds, model.sign,
+            ).where(model.connection_chart_id == connection_chart_id)
+            for n, (model, name) in enumerate((
+                (ConnectionPlanet, ConnectionPlanet.planet),
+                (ConnectionHouse, ConnectionHouse.house_number),
+                (ConnectionPoint, ConnectionPoint.point_type),
+            ))
+        )).order_by(literal_column("kind"), literal_column("name"))
+        rows = {kind: [] for kind in kinds}
+        with get_session(self.engine) as session:
+            for kind, name, degree, minutes, seconds, sign in session.execute(stmt):
+                rows[kinds[kind]].append(
+                    (name, format_position(degree, minutes, seconds, sign))
+                )
+        return rows
+
     # =========================================================================
     # Phase 8 — Event Chart Methods
     # =========================================================================
@@ -1069,7 +1333,7 @@ class DatabaseHelper:
             ValueError: If an event with this label already exists.
         """
         from ..models import Event, EventPlanet, EventHouse, EventPoint, HouseSystem
-        from sqlalchemy.orm import Session as _Session
+        from sqlalchemy import insert
 
         # Check for duplicate label before opening write session.
         # We use a raw session (no context manager) so ValueError is not
@@ -1104,9 +1368,12 @@ class DatabaseHelper:
             session.add(event)
             session.flush()
 
+            # Positions go in as one executemany INSERT per table rather
+            # than one ORM object (and statement) per row.
+            planet_rows = []
             for planet_name, pos_data in chart.get("planets", {}).items():
                 norm = self._normalize_position(pos_data)
-                session.add(EventPlanet(
+                planet_rows.append(dict(
                     event_id=event.id,
                     planet=planet_name,
                     degree=norm["degree"],
@@ -1118,9 +1385,10 @@ class DatabaseHelper:
                     is_retrograde=bool(pos_data.get("is_retrograde", False)),
                 ))
 
+            house_rows = []
             for house_num, pos_data in chart.get("houses", {}).items():
                 norm = self._normalize_position(pos_data)
-                session.add(EventHouse(
+                house_rows.append(dict(
                     event_id=event.id,
                     house_number=int(house_num),
                     degree=norm["degree"],
@@ -1130,9 +1398,10 @@ class DatabaseHelper:
                     absolute_position=norm["absolute_position"],
                 ))
 
+            point_rows = []
             for point_type, pos_data in chart.get("points", {}).items():
                 norm = self._normalize_position(pos_data)
-                session.add(EventPoint(
+                point_rows.append(dict(
                     event_id=event.id,
                     point_type=point_type,
                     degree=norm["degree"],
@@ -1142,6 +1411,14 @@ class DatabaseHelper:
                     absolute_position=norm["absolute_position"],
                 ))
 
+            for model, rows in (
+                (EventPlanet, planet_rows),
+                (EventHouse, house_rows),
+                (EventPoint, point_rows),
+            ):
+                if rows:
+                    session.execute(insert(model), rows)
+
             session.commit()
 
     def list_event_charts(self, profile_id: int = None) -> list:
@@ -9,10 +9,20 @@ Usage:
     met, details = score_chart(chart, ["moon_not_void", "no_retrograde_inner"])
     # met: list of criterion names that passed
     # details: dict of criterion -> explanation string (for failures)
+
+Scans evaluate thousands of moments, so score_batch() applies the same
+criteria column-wise to EphemerisEngine.get_planets_batch() arrays (merged
+with get_houses_batch() when a criterion needs houses); only the rows worth
+reporting are turned back into chart dicts with chart_at().
 """
 
+from collections import Counter
 from typing import Optional
 
+import numpy as np
+
+from ..constants import PLANET_NAMES
+
 # Signs in order (0-based index = sign number 0–11)
 SIGNS = [
     "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
@@ -33,6 +43,14 @@ BENEFICS = {"Venus", "Jupiter"}
 # Angular houses
 ANGULAR_HOUSES = {1, 4, 7, 10}
 
+# Criteria that read house cusps or angles; scans skip house calculation
+# when none of these are requested.
+HOUSE_CRITERIA = frozenset({"benefic_angular", "asc_not_late"})
+
+
+# Column of each planet in get_planets_batch() longitude/speed arrays
+PLANET_COLUMN = {name: i for i, name in enumerate(PLANET_NAMES)}
+
 
 def _absolute_position(sign: str, degree: float) -> float:
     """Convert sign + within-sign degree to 0–360° position."""
@@ -40,13 +58,18 @@ def _absolute_position(sign: str, degree: float) -> float:
     return idx * 30.0 + degree
 
 
-def score_chart(chart: dict, criteria: list[str]) -> tuple[list[str], dict[str, str]]:
+def score_chart(
+    chart: dict, criteria: list[str], min_met: int = 0
+) -> tuple[list[str], dict[str, str]]:
     """Evaluate a chart against electional criteria.
 
     Args:
         chart: Dict with 'planets', 'houses', 'points' keys as returned
                by EphemerisEngine.get_chart().
         criteria: List of criterion name strings to evaluate.
+        min_met: Stop as soon as fewer than this many criteria can still
+                 pass. The result then only covers the criteria evaluated
+                 so far. Defaults to 0 (evaluate everything).
 
     Returns:
         Tuple of:
@@ -61,11 +84,13 @@ def score_chart(chart: dict, criteria: list[str]) -> tuple[list[str], dict[str,
     met = []
     details = {}
 
-    for criterion in criteria:
+    for idx, criterion in enumerate(criteria):
         passed, note = _evaluate(criterion, planets, houses, points)
         details[criterion] = note
         if passed:
             met.append(criterion)
+        elif len(met) + len(criteria) - idx - 1 < min_met:
+            break
 
     return met, details
 
@@ -77,33 +102,10 @@ def _evaluate(
     points: dict,
 ) -> tuple[bool, str]:
     """Evaluate a single criterion. Returns (passed, explanation_note)."""
-
-    if criterion == "moon_not_void":
-        return _check_moon_not_void(planets)
-
-    elif criterion == "no_retrograde_inner":
-        return _check_no_retrograde(planets, INNER_PLANETS)
-
-    elif criterion == "no_retrograde_outer":
-        return _check_no_retrograde(planets, OUTER_PLANETS)
-
-    elif criterion == "no_retrograde_all":
-        return _check_no_retrograde(planets, INNER_PLANETS | OUTER_PLANETS)
-
-    elif criterion == "moon_waxing":
-        return _check_moon_phase(planets, waxing=True)
-
-    elif criterion == "moon_waning":
-        return _check_moon_phase(planets, waxing=False)
-
-    elif criterion == "benefic_angular":
-        return _check_benefic_angular(planets)
-
-    elif criterion == "asc_not_late":
-        return _check_asc_not_late(points)
-
-    else:
+    check = _CHECKS.get(criterion)
+    if check is None:
         return False, f"Unknown criterion: {criterion}"
+    return check(planets, points)
 
 
 MAJOR_ASPECT_ANGLES = [0, 60, 90, 120, 180]
@@ -247,3 +249,202 @@ def _check_asc_not_late(points: dict) -> tuple[bool, str]:
         return False, f"ASC at {deg:.1f}° {asc.get('sign', '')} — late degree"
 
     return True, f"ASC at {deg:.1f}° {asc.get('sign', '')}"
+
+
+# Criterion name -> check(planets, points). Names are fixed identifiers, so
+# a lookup replaces walking a chain of string comparisons per evaluation.
+_CHECKS = {
+    "moon_not_void": lambda planets, points: _check_moon_not_void(planets),
+    "no_retrograde_inner": lambda planets, points: _check_no_retrograde(planets, INNER_PLANETS),
+    "no_retrograde_outer": lambda planets, points: _check_no_retrograde(planets, OUTER_PLANETS),
+    "no_retrograde_all": lambda planets, points: _check_no_retrograde(planets, INNER_PLANETS | OUTER_PLANETS),
+    "moon_waxing": lambda planets, points: _check_moon_phase(planets, waxing=True),
+    "moon_waning": lambda planets, points: _check_moon_phase(planets, waxing=False),
+    "benefic_angular": lambda planets, points: _check_benefic_angular(planets),
+    "asc_not_late": lambda planets, points: _check_asc_not_late(points),
+}
+
+
+# ============================================================================
+# Batch evaluation
+# ============================================================================
+
+# Relative cost of each criterion's batch evaluation; score_batch() runs
+# cheap ones first so expensive ones can skip rows that can't qualify.
+_CRITERION_COST = {
+    "asc_not_late": 0,
+    "no_retrograde_inner": 1,
+    "no_retrograde_outer": 1,
+    "no_retrograde_all": 1,
+    "moon_waxing": 1,
+    "moon_waning": 1,
+    "benefic_angular": 2,
+    "moon_not_void": 3,
+}
+
+
+def _columns(names: set) -> list[int]:
+    """Return the batch columns for a set of planet names."""
+    return sorted(PLANET_COLUMN[name] for name in names)
+
+
+def _house_numbers(lons: np.ndarray, cusps: np.ndarray) -> np.ndarray:
+    """Return the 1-based house of each longitude.
+
+    Args:
+        lons: (n, p) planet longitudes.
+        cusps: (n, 12) house cusps for the same rows.
+    """
+    widths = (np.roll(cusps, -1, axis=1) - cusps) % 360.0
+    offsets = (lons[:, :, None] - cusps[:, None, :]) % 360.0
+    return (offsets < widths[:, None, :]).argmax(axis=2) + 1
+
+
+def _sign_info(longitude: float) -> dict:
+    """Sign/degree fields score_chart() reads, for one longitude."""
+    return {
+        "sign": SIGNS[int(longitude // 30)],
+        "degree": longitude % 30.0,
+        "absolute_position": longitude,
+    }
+
+
+def chart_at(batch: dict, index: int) -> dict:
+    """Materialize one row of a chart batch as a chart dict for score_chart().
+
+    Planets carry house_number, placed against the row's house cusps. A
+    planets-only batch (no "cusps") yields empty houses and points.
+    """
+    lons = batch["longitude"][index]
+    planets = {}
+    for name, lon, speed in zip(PLANET_NAMES, lons.tolist(), batch["speed"][index].tolist()):
+        info = _sign_info(lon)
+        info["is_retrograde"] = speed < 0
+        planets[name] = info
+
+    if "cusps" not in batch:
+        return {"planets": planets, "houses": {}, "points": {}}
+
+    cusps = batch["cusps"][index:index + 1]
+    for info, house in zip(planets.values(), _house_numbers(lons[None], cusps)[0].tolist()):
+        info["house_number"] = house
+
+    asc, mc = batch["angles"][index].tolist()
+    return {
+        "planets": planets,
+        "houses": {str(i): _sign_info(c) for i, c in enumerate(cusps[0].tolist(), 1)},
+        "points": {"Ascendant": _sign_info(asc), "MC": _sign_info(mc)},
+    }
+
+
+def score_batch(
+    batch: dict, criteria: list[str], min_met: int = 0
+) -> dict[str, np.ndarray]:
+    """Evaluate every row of a chart batch against electional criteria.
+
+    Vectorized counterpart of score_chart(): with the default min_met, row i
+    of each mask agrees with score_chart(chart_at(batch, i), criteria).
+    Notes are not produced here —
+    score the few rows being reported with score_chart() for those.
+
+    Criteria are evaluated cheapest first. With min_met, later criteria
+    only run on rows that can still reach it; other rows read False for
+    them, so they always total fewer than min_met.
+
+    Args:
+        batch: Arrays as returned by EphemerisEngine.get_planets_batch(),
+               merged with a get_houses_batch() result when a criterion
+               is in HOUSE_CRITERIA.
+        criteria: List of criterion name strings to evaluate.
+        min_met: Minimum number of criteria a row must meet to matter.
+
+    Returns:
+        Dict mapping criterion name -> boolean array, True where it passed.
+    """
+    n = len(batch["longitude"])
+    weights = Counter(criteria)  # a repeated criterion counts each time
+    remaining = len(criteria)
+    counts = np.zeros(n, dtype=np.intp)
+    live = np.ones(n, dtype=bool)
+
+    masks = {}
+    for criterion in sorted(weights, key=lambda c: _CRITERION_COST.get(c, 0)):
+        mask = np.zeros(n, dtype=bool)
+        if live.all():
+            mask[:] = _evaluate_batch(criterion, batch)
+        elif live.any():
+            mask[live] = _evaluate_batch(criterion, {k: v[live] for k, v in batch.items()})
+        masks[criterion] = mask
+
+        weight = weights[criterion]
+        counts += mask * weight
+        remaining -= weight
+        live &= counts + remaining >= min_met
+    return masks
+
+
+def _evaluate_batch(criterion: str, batch: dict) -> np.ndarray:
+    """Evaluate a single criterion for every row. Returns a boolean mask."""
+    check = _BATCH_CHECKS.get(criterion)
+    if check is None:
+        return np.zeros(len(batch["longitude"]), dtype=bool)
+    return check(batch)
+
+
+def _no_retrograde(columns: list[int]):
+    """Batch check that no planet in the given columns is retrograde."""
+    return lambda batch: ~(batch["speed"][:, columns] < 0).any(axis=1)
+
+
+def _batch_benefic_angular(batch: dict) -> np.ndarray:
+    """Column-wise _check_benefic_angular()."""
+    houses = _house_numbers(batch["longitude"][:, _BENEFIC_COLUMNS], batch["cusps"])
+    return np.isin(houses, _ANGULAR_HOUSE_ARRAY).any(axis=1)
+
+
+def _batch_moon_not_void(lons: np.ndarray) -> np.ndarray:
+    """Column-wise _check_moon_not_void(): any applying major aspect in orb."""
+    moon = lons[:, PLANET_COLUMN["Moon"]]
+    # Same sign/degree round trip as the dict path, so results match exactly
+    sign_idx = moon // 30
+    moon_abs = (sign_idx * 30.0 + moon % 30.0)[:, None, None]
+    remaining = (((sign_idx + 1) * 30.0)[:, None, None] - moon_abs) % 360.0
+
+    others = lons[:, _ASPECT_COLUMNS][:, :, None]
+    targets = np.concatenate(
+        ((others + _ASPECT_ANGLE_ARRAY) % 360.0, (others - _ASPECT_ANGLE_ARRAY) % 360.0), axis=2
+    )
+
+    travel = (targets - moon_abs) % 360.0
+    orb_now = np.abs((moon_abs - targets + 180) % 360 - 180)
+    applying = (
+        (travel != 0)
+        & (travel <= remaining + MAJOR_ASPECT_ORB)
+        & (orb_now <= MAJOR_ASPECT_ORB)
+    )
+    return applying.any(axis=(1, 2))
+
+
+def _batch_moon_waxing(lons: np.ndarray) -> np.ndarray:
+    """Column-wise waxing test: Moon less than 180° ahead of the Sun."""
+    diff = (lons[:, PLANET_COLUMN["Moon"]] - lons[:, PLANET_COLUMN["Sun"]]) % 360
+    return diff < 180
+
+
+# Planet columns and constants the batch checks read, resolved once at import
+_ASPECT_COLUMNS = _columns(ASPECT_PLANETS)
+_ASPECT_ANGLE_ARRAY = np.array(MAJOR_ASPECT_ANGLES, dtype=np.float64)
+_BENEFIC_COLUMNS = _columns(BENEFICS)
+_ANGULAR_HOUSE_ARRAY = np.array(sorted(ANGULAR_HOUSES))
+
+# Criterion name -> check(batch) returning a boolean mask
+_BATCH_CHECKS = {
+    "moon_not_void": lambda batch: _batch_moon_not_void(batch["longitude"]),
+    "no_retrograde_inner": _no_retrograde(_columns(INNER_PLANETS)),
+    "no_retrograde_outer": _no_retrograde(_columns(OUTER_PLANETS)),
+    "no_retrograde_all": _no_retrograde(_columns(INNER_PLANETS | OUTER_PLANETS)),
+    "moon_waxing": lambda batch: _batch_moon_waxing(batch["longitude"]),
+    "moon_waning": lambda batch: ~_batch_moon_waxing(batch["longitude"]),
+    "benefic_angular": lambda batch: _batch_benefic_angular(batch),
+    "asc_not_late": lambda batch: batch["angles"][:, 0] % 30.0 < 27.0,
+}
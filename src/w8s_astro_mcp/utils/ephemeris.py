@@ -18,12 +18,47 @@ Precision:
 
 from __future__ import annotations
 
+import functools
+import numpy as np
 import swisseph as swe
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Optional
 
 from ..constants import ZODIAC_SIGNS, PLANET_IDS, PLANET_NAMES, HOUSE_SYSTEM_CODES
 
+# Path last passed to swe.set_ephe_path(). The library keeps this as global
+# state, so engines constructed repeatedly with the same path (event tools
+# build one per call) skip the re-initialization.
+_UNSET: Any = object()
+_active_ephe_path: Any = _UNSET
+
+# Bounded LRU of computed (planets, houses, points) keyed on
+# (jd_ut, latitude, longitude, house system, ephe_path). Shared by every
+# engine instance so short-lived engines (event tools) benefit too.
+CHART_CACHE_MAXSIZE = 4096
+_chart_cache: "OrderedDict[tuple, tuple[dict, dict, dict]]" = OrderedDict()
+
+
+@functools.lru_cache(maxsize=65536)
+def _planet_position(jd: float, planet_id: int, ephe_path: Optional[str]) -> tuple[float, float]:
+    """Return (longitude, longitude speed) for one planet at a Julian Day (UT).
+
+    Geocentric positions do not depend on the observer's location, so this is
+    shared by every chart for the same moment — e.g. repeated or overlapping
+    get_ingresses day scans, or charts for the same time at different places.
+    ephe_path is part of the key because Moshier and .se1 results differ.
+    """
+    # pysweph fork returns (xx, ret_flags, warning_str) — unpack flexibly.
+    # FLG_SPEED is requested explicitly: retrograde status depends on it.
+    xx = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+    return xx[0], xx[3]  # lon, lat, dist, speed_lon, speed_lat, speed_dist
+
+
+def _copy_section(section: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a planets/houses/points dict safe for callers to mutate."""
+    return {key: dict(info) for key, info in section.items()}
+
 
 class EphemerisError(Exception):
     """Raised when an ephemeris calculation fails."""
@@ -49,12 +84,22 @@ class EphemerisEngine:
                        which requires no external files.
         """
         self.ephe_path = ephe_path
-        if ephe_path is not None:
-            swe.set_ephe_path(ephe_path)
-        else:
-            # Explicitly activate Moshier so behavior is predictable
-            # even if the caller later changes the global path.
-            swe.set_ephe_path(None)
+        self._activate()
+
+    def _activate(self) -> None:
+        """Make this engine's ephemeris path the library's active one.
+
+        The path is global to the process, and long-lived engines with
+        different paths (the server's, the event tools') can be interleaved,
+        so every calculation entry point calls this. set_ephe_path closes and
+        re-opens the library's ephemeris files, so it only runs when the path
+        actually changes. A None path explicitly activates Moshier so
+        behavior is predictable.
+        """
+        global _active_ephe_path
+        if _active_ephe_path is _UNSET or _active_ephe_path != self.ephe_path:
+            swe.set_ephe_path(self.ephe_path)
+            _active_ephe_path = self.ephe_path
 
     # ------------------------------------------------------------------
     # Public interface
@@ -97,19 +142,68 @@ class EphemerisEngine:
 
         hour = self._parse_time(time_str)
         jd = self._to_jd(dt.year, dt.month, dt.day, hour)
+        return self._build_chart(
+            jd, latitude, longitude, house_system_code,
+            date_str, f"{time_str}:00" if time_str else "12:00:00",
+        )
+
+    def get_chart_jd(
+        self,
+        jd_ut: float,
+        latitude: float,
+        longitude: float,
+        house_system_code: str = "P",
+    ) -> dict[str, Any]:
+        """Calculate a full chart for a Julian Day (UT).
+
+        Same result as get_chart() for the equivalent date and time, for
+        callers stepping through time that already work in Julian Days —
+        no date/time strings are formatted or parsed per chart.
+
+        Raises:
+            EphemerisError: If the calculation fails.
+        """
+        # Half a minute forward so the truncated minute can't read as :60
+        year, month, day, hour = swe.revjul(jd_ut + 0.5 / 1440)
+        minutes = int(hour * 60)
+        return self._build_chart(
+            jd_ut, latitude, longitude, house_system_code,
+            f"{year:04d}-{month:02d}-{day:02d}", f"{minutes // 60:02d}:{minutes % 60:02d}:00",
+        )
+
+    def _build_chart(
+        self,
+        jd: float,
+        latitude: float,
+        longitude: float,
+        house_system_code: str,
+        date_str: str,
+        time_str: str,
+    ) -> dict[str, Any]:
+        """Return the chart dict for a Julian Day, via the shared chart cache."""
+        self._activate()
         hsys = self._house_system_bytes(house_system_code)
         house_system_name = self._house_system_name(house_system_code)
 
-        planets = self._calc_planets(jd)
-        houses, points = self._calc_houses(jd, latitude, longitude, hsys)
+        key = (round(jd, 6), round(latitude, 4), round(longitude, 4), hsys, self.ephe_path)
+        cached = _chart_cache.get(key)
+        if cached is None:
+            planets = self._calc_planets(jd)
+            houses, points = self._calc_houses(jd, latitude, longitude, hsys)
+            cached = _chart_cache[key] = (planets, houses, points)
+            if len(_chart_cache) > CHART_CACHE_MAXSIZE:
+                _chart_cache.popitem(last=False)
+        else:
+            _chart_cache.move_to_end(key)
+        planets, houses, points = cached
 
         return {
-            "planets": planets,
-            "houses": houses,
-            "points": points,
+            "planets": _copy_section(planets),
+            "houses": _copy_section(houses),
+            "points": _copy_section(points),
             "metadata": {
                 "date": date_str,
-                "time": f"{time_str}:00" if time_str else "12:00:00",
+                "time": time_str,
                 "latitude": latitude,
                 "longitude": longitude,
                 "house_system": house_system_name,
@@ -117,8 +211,92 @@ class EphemerisEngine:
             },
         }
 
-    # Backward-compatible alias used by server.py and callers that still
-    # reference the old SweetestIntegration.get_transits() name.
+    def get_planets_batch(self, jds: np.ndarray) -> dict[str, np.ndarray]:
+        """Calculate planet positions for many moments.
+
+        Used by scans (electional windows) that evaluate thousands of charts
+        and only need a handful of them as full dicts, so results are
+        column-wise instead of one nested dict per chart. Geocentric
+        positions depend only on time, so a scan computes these once for its
+        JD grid whatever the location.
+
+        Args:
+            jds: 1-D array of Julian Days (UT).
+
+        Returns:
+            Dict of float64 arrays, row i describing jds[i]:
+                "jd"         (n,)     — the input Julian Days
+                "longitude"  (n, 10)  — planet ecliptic longitudes, PLANET_NAMES order
+                "speed"      (n, 10)  — planet longitude speeds (negative = retrograde)
+
+        Raises:
+            EphemerisError: If any calculation fails.
+        """
+        self._activate()
+        jds = np.asarray(jds, dtype=np.float64)
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+        lons = np.empty((jds.size, len(PLANET_IDS)), dtype=np.float64)
+        speeds = np.empty((jds.size, len(PLANET_IDS)), dtype=np.float64)
+
+        # Bypasses the per-planet LRU: a scan touches each moment once, and
+        # thousands of one-off entries would only evict reusable ones.
+        calc_ut = swe.calc_ut
+        try:
+            for row, jd in enumerate(jds.tolist()):
+                for col, planet_id in enumerate(PLANET_IDS):
+                    xx = calc_ut(jd, planet_id, flags)[0]
+                    lons[row, col] = xx[0]
+                    speeds[row, col] = xx[3]
+        except Exception as exc:
+            raise EphemerisError(f"Failed to calculate planet batch: {exc}") from exc
+
+        return {"jd": jds, "longitude": lons % 360.0, "speed": speeds}
+
+    def get_houses_batch(
+        self,
+        jds: np.ndarray,
+        latitude: float,
+        longitude: float,
+        house_system_code: str = "P",
+    ) -> dict[str, np.ndarray]:
+        """Calculate house cusps and angles for many moments at one location.
+
+        The location-dependent counterpart of get_planets_batch(); merge the
+        two results for a scan that needs houses.
+
+        Args:
+            jds: 1-D array of Julian Days (UT).
+            latitude: Geographic latitude in decimal degrees.
+            longitude: Geographic longitude in decimal degrees.
+            house_system_code: Single-letter house system code or full name.
+
+        Returns:
+            Dict of float64 arrays, row i describing jds[i]:
+                "cusps"      (n, 12)  — house cusps 1-12
+                "angles"     (n, 2)   — Ascendant, MC
+
+        Raises:
+            EphemerisError: If any calculation fails.
+        """
+        self._activate()
+        jds = np.asarray(jds, dtype=np.float64)
+        hsys = self._house_system_bytes(house_system_code)
+        cusps = np.empty((jds.size, 12), dtype=np.float64)
+        angles = np.empty((jds.size, 2), dtype=np.float64)
+
+        houses = swe.houses
+        try:
+            for row, jd in enumerate(jds.tolist()):
+                house_cusps, ascmc = houses(jd, latitude, longitude, hsys)
+                cusps[row] = house_cusps[1:13]  # index 0 is unused
+                angles[row] = ascmc[:2]
+        except Exception as exc:
+            raise EphemerisError(f"Failed to calculate house batch: {exc}") from exc
+
+        return {"cusps": cusps, "angles": angles % 360.0}
+
+    # Backward-compatible alias for callers that still reference the old
+    # SweetestIntegration.get_transits() name. In-tree code calls get_chart().
     def get_transits(
         self,
         latitude: float,
@@ -130,6 +308,17 @@ class EphemerisEngine:
         """Alias for get_chart(). Provided for backward compatibility."""
         return self.get_chart(latitude, longitude, date_str, time_str, house_system_code)
 
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop all memoized chart and planet positions (shared across engines)."""
+        _chart_cache.clear()
+        _planet_position.cache_clear()
+
+    @staticmethod
+    def cache_info() -> Any:
+        """Return hit/miss statistics for the per-planet position cache."""
+        return _planet_position.cache_info()
+
     def get_mode(self) -> str:
         """Return the active ephemeris mode: 'moshier' or 'sweph'."""
         return "moshier" if self.ephe_path is None else "sweph"
@@ -143,15 +332,10 @@ class EphemerisEngine:
         result = {}
         for planet_id, planet_name in zip(PLANET_IDS, PLANET_NAMES):
             try:
-                # pysweph fork returns (xx, ret_flags, warning_str) — unpack flexibly
-                raw = swe.calc_ut(jd, planet_id)
-                xx = raw[0]  # 6-element tuple: lon, lat, dist, speed_lon, speed_lat, speed_dist
+                longitude, speed = _planet_position(jd, planet_id, self.ephe_path)
             except Exception as exc:
                 raise EphemerisError(f"Failed to calculate {planet_name}: {exc}") from exc
 
-            longitude = xx[0]
-            speed = xx[3]
-
             info = self._longitude_to_sign_info(longitude)
             info["is_retrograde"] = self._is_retrograde(speed)
             result[planet_name] = info
@@ -264,3 +448,13 @@ class EphemerisEngine:
         # Allow full-name lookup via HOUSE_SYSTEM_CODES first
         single = HOUSE_SYSTEM_CODES.get(code.strip(), code.strip())
         return names.get(single.upper(), f"House System {code}")
+
+
+def planets_batch_worker(ephe_path: Optional[str], jds: np.ndarray) -> dict[str, np.ndarray]:
+    """Process-pool entry point: get_planets_batch() on a fresh engine.
+
+    Lives here rather than with the event tools so a spawned worker only has
+    to import this module (numpy and swisseph) to unpickle it, not the MCP
+    stack.
+    """
+    return EphemerisEngine(ephe_path).get_planets_batch(jds)
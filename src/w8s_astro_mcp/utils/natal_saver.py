@@ -1,6 +1,6 @@
 """Helper functions for saving natal chart data to database."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 from ..models import NatalPlanet, NatalHouse, NatalPoint, Profile
 from .position_utils import decimal_to_dms, sign_to_absolute_position
@@ -11,7 +11,7 @@ def save_natal_data_to_db(
     profile: Profile,
     chart_data: Dict[str, Any],
     house_system_id: int,
-) -> None:
+) -> Tuple[List[NatalPlanet], List[NatalHouse], List[NatalPoint]]:
     """
     Save a calculated natal chart to the database.
 
@@ -24,6 +24,10 @@ def save_natal_data_to_db(
         profile:        Profile whose natal chart is being saved.
         chart_data:     Chart dict from EphemerisEngine.get_chart().
         house_system_id: ID of the house system used for calculation.
+
+    Returns:
+        (planets, houses, points) lists of the rows that were added, in
+        insertion order, so callers can format them without re-querying.
     """
     # Clear any stale cached data for this profile
     session.query(NatalPlanet).filter_by(profile_id=profile.id).delete()
@@ -31,12 +35,14 @@ def save_natal_data_to_db(
     session.query(NatalPoint).filter_by(profile_id=profile.id).delete()
     session.flush()
 
+    planets, houses, points = [], [], []
+
     # Planets
     for planet_name, planet_data in chart_data["planets"].items():
         deg, min_, sec = decimal_to_dms(planet_data["degree"])
         abs_pos = sign_to_absolute_position(planet_data["sign"], planet_data["degree"])
 
-        session.add(NatalPlanet(
+        row = NatalPlanet(
             profile_id=profile.id,
             planet=planet_name,
             degree=deg,
@@ -46,14 +52,16 @@ def save_natal_data_to_db(
             absolute_position=abs_pos,
             is_retrograde=planet_data.get("is_retrograde", False),
             calculation_method="pysweph",
-        ))
+        )
+        session.add(row)
+        planets.append(row)
 
     # Houses
     for house_num, house_data in chart_data["houses"].items():
         deg, min_, sec = decimal_to_dms(house_data["degree"])
         abs_pos = sign_to_absolute_position(house_data["sign"], house_data["degree"])
 
-        session.add(NatalHouse(
+        row = NatalHouse(
             profile_id=profile.id,
             house_system_id=house_system_id,
             house_number=int(house_num),
@@ -63,14 +71,16 @@ def save_natal_data_to_db(
             sign=house_data["sign"],
             absolute_position=abs_pos,
             calculation_method="pysweph",
-        ))
+        )
+        session.add(row)
+        houses.append(row)
 
     # Points (Asc, MC, etc.)
     for point_name, point_data in chart_data["points"].items():
         deg, min_, sec = decimal_to_dms(point_data["degree"])
         abs_pos = sign_to_absolute_position(point_data["sign"], point_data["degree"])
 
-        session.add(NatalPoint(
+        row = NatalPoint(
             profile_id=profile.id,
             house_system_id=house_system_id,
             point_type=point_name,
@@ -80,6 +90,9 @@ def save_natal_data_to_db(
             sign=point_data["sign"],
             absolute_position=abs_pos,
             calculation_method="pysweph",
-        ))
+        )
+        session.add(row)
+        points.append(row)
 
     session.flush()
+    return planets, houses, points
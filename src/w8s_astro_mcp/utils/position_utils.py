@@ -1,8 +1,8 @@
 """Shared position conversion utilities.
 
 Low-level math for converting between astrological position formats.
-Used by transit_logger, db_helpers, and any future module that stores
-or compares planetary positions.
+Used by transit_logger, db_helpers, the connection chart models, and any
+future module that stores or compares planetary positions.
 """
 
 
@@ -32,6 +32,15 @@ def decimal_to_dms(decimal_degrees: float) -> tuple[int, int, float]:
     return degrees, minutes, seconds
 
 
+def format_position(degree: int, minutes: int, seconds: float, sign: str) -> str:
+    """Format a stored position as a human-readable string.
+
+    Example:
+        format_position(15, 24, 36.8, "Taurus") -> 15°24'36" Taurus
+    """
+    return f"{degree}°{minutes}'{int(seconds)}\" {sign}"
+
+
 def sign_to_absolute_position(sign: str, degree_in_sign: float) -> float:
     """Convert a sign name + degree-within-sign to absolute ecliptic position (0–360°).
 
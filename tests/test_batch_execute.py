@@ -0,0 +1,144 @@
+"""Tests for handle_batch_execute — ordering, error reporting, and validation.
+
+The first tests patch call_tool with a fake to pin the batching logic; the
+rest run real tool handlers against a temp database.
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import patch
+
+from mcp.types import TextContent
+
+import w8s_astro_mcp.server as srv
+from w8s_astro_mcp.server import handle_batch_execute
+from w8s_astro_mcp.utils.db_helpers import DatabaseHelper
+
+
+async def fake_call_tool(name, arguments):
+    if name == "boom":
+        raise RuntimeError("kaboom")
+    await asyncio.sleep(arguments.get("delay", 0))
+    return [TextContent(type="text", text=f"{name}:{arguments.get('x')}")]
+
+
+def _payload(result):
+    return json.loads(result[0].text)
+
+
+@pytest.mark.asyncio
+async def test_results_in_request_order():
+    calls = [
+        {"name": "slow", "arguments": {"x": 1, "delay": 0.02}},
+        {"name": "fast", "arguments": {"x": 2}},
+    ]
+    with patch.object(srv, "call_tool", side_effect=fake_call_tool):
+        payload = _payload(await handle_batch_execute({"calls": calls}))
+
+    assert [p["text"] for p in payload] == ["slow:1", "fast:2"]
+    assert all(p["ok"] for p in payload)
+
+
+@pytest.mark.asyncio
+async def test_failure_reported_per_call():
+    """By default a raising call is reported without failing the batch."""
+    calls = [{"name": "boom"}, {"name": "ok", "arguments": {"x": 3}}]
+    with patch.object(srv, "call_tool", side_effect=fake_call_tool):
+        payload = _payload(await handle_batch_execute({"calls": calls}))
+
+    assert payload[0] == {"name": "boom", "ok": False, "text": "Error: kaboom"}
+    assert payload[1]["ok"] is True
+
+
+@pytest.mark.asyncio
+async def test_calls_run_one_at_a_time():
+    in_flight = 0
+    peak = 0
+    order = []
+
+    async def tracking_call_tool(name, arguments):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        order.append(name)
+        in_flight -= 1
+        return [TextContent(type="text", text=name)]
+
+    calls = [{"name": f"t{i}"} for i in range(4)]
+    with patch.object(srv, "call_tool", side_effect=tracking_call_tool):
+        await handle_batch_execute({"calls": calls})
+
+    assert peak == 1
+    assert order == ["t0", "t1", "t2", "t3"]
+
+
+@pytest.mark.asyncio
+async def test_empty_calls_rejected():
+    result = await handle_batch_execute({"calls": []})
+    assert "non-empty list" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_nested_batch_rejected():
+    result = await handle_batch_execute({"calls": [{"name": "batch_execute"}]})
+    assert "cannot be nested" in result[0].text
+
+
+# ============================================================================
+# Real tool handlers
+# ============================================================================
+
+@pytest.fixture
+def db(tmp_path):
+    helper = DatabaseHelper(db_path=str(tmp_path / "batch.db"))
+    with patch.object(srv, "init_db", return_value=helper):
+        yield helper
+
+
+@pytest.mark.asyncio
+async def test_ok_reflects_handler_result(db):
+    calls = [
+        {"name": "list_profiles"},
+        {"name": "delete_profile", "arguments": {"profile_id": 1, "confirm": False}},
+        {"name": "no_such_tool"},
+    ]
+    payload = _payload(await handle_batch_execute({"calls": calls}))
+
+    assert payload[0]["ok"] is True
+    assert payload[0]["text"].startswith("No profiles found")
+    assert payload[1]["ok"] is False
+    assert payload[1]["text"].startswith("Error: You must set confirm=true")
+    assert payload[2] == {"name": "no_such_tool", "ok": False, "text": "Unknown tool: no_such_tool"}
+
+
+@pytest.mark.asyncio
+async def test_sub_calls_validated_against_input_schema(db):
+    calls = [
+        {"name": "delete_profile", "arguments": {"profile_id": "one", "confirm": True}},
+        {"name": "delete_profile", "arguments": {"confirm": True}},
+    ]
+    with patch.object(db, "delete_profile") as delete:
+        payload = _payload(await handle_batch_execute({"calls": calls}))
+
+    delete.assert_not_called()
+    assert [p["ok"] for p in payload] == [False, False]
+    assert payload[0]["text"] == "Input validation error: 'one' is not of type 'integer'"
+    assert payload[1]["text"] == "Input validation error: 'profile_id' is a required property"
+
+
+@pytest.mark.asyncio
+async def test_stop_on_error_skips_remaining_calls(db):
+    calls = [
+        {"name": "list_profiles"},
+        {"name": "delete_profile", "arguments": {"profile_id": 1, "confirm": False}},
+        {"name": "list_profiles"},
+    ]
+    with patch.object(db, "list_all_profiles", wraps=db.list_all_profiles) as listed:
+        payload = _payload(await handle_batch_execute({"calls": calls, "stop_on_error": True}))
+
+    assert listed.call_count == 1
+    assert [p["ok"] for p in payload] == [True, False, False]
+    assert payload[2]["text"].startswith("Skipped:")
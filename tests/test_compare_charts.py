@@ -0,0 +1,172 @@
+"""Tests for compare_charts aspect detection.
+
+compare_charts evaluates every body pair in one NumPy pass; these tests pin
+its output to the scalar calculate_aspect_angle + identify_aspect reference.
+"""
+
+import pytest
+
+from w8s_astro_mcp.constants import ZODIAC_SIGNS
+from w8s_astro_mcp.tools.analysis_tools import (
+    AnalysisError,
+    calculate_aspect_angle,
+    compare_charts,
+    format_aspect_report,
+    get_absolute_position,
+    identify_aspect,
+)
+
+
+def _chart(positions: dict) -> dict:
+    """Build a chart dict from {name: absolute longitude}."""
+    planets = {}
+    for name, lon in positions.items():
+        planets[name] = {"degree": lon % 30, "sign": ZODIAC_SIGNS[int(lon // 30)]}
+    return {"planets": planets, "metadata": {"date": "2026-02-07"}}
+
+
+def _reference_aspects(chart1, chart2, orb_multiplier=1.0):
+    """Scalar pairwise loop compare_charts must agree with."""
+    found = []
+    for name1, data1 in chart1["planets"].items():
+        pos1 = get_absolute_position(data1["degree"], data1["sign"])
+        for name2, data2 in chart2["planets"].items():
+            pos2 = get_absolute_position(data2["degree"], data2["sign"])
+            info = identify_aspect(calculate_aspect_angle(pos1, pos2), orb_multiplier)
+            if info:
+                found.append((name1, name2, info["name"], info["orb"], info["orb_used"]))
+    return sorted(found, key=lambda a: a[3])
+
+
+NATAL = _chart({
+    "Sun": 314.66, "Moon": 323.90, "Mercury": 335.12, "Venus": 298.45,
+    "Mars": 12.33, "Jupiter": 95.0, "Saturn": 181.5, "Uranus": 222.2,
+    "Neptune": 267.9, "Pluto": 210.0,
+})
+TRANSIT = _chart({
+    "Sun": 317.80, "Moon": 98.50, "Mercury": 323.90, "Venus": 345.20,
+    "Mars": 14.75, "Jupiter": 105.3, "Saturn": 358.9, "Uranus": 57.4,
+    "Neptune": 359.1, "Pluto": 303.0,
+})
+
+
+@pytest.mark.parametrize("orb_multiplier", [0.5, 1.0, 2.5])
+def test_matches_scalar_reference(orb_multiplier):
+    result = compare_charts(NATAL, TRANSIT, orb_multiplier=orb_multiplier)
+    got = [
+        (a["body1"], a["body2"], a["aspect"], a["orb"], a["orb_used"])
+        for a in result["aspects"]
+    ]
+    assert got == _reference_aspects(NATAL, TRANSIT, orb_multiplier)
+    assert result["metadata"]["total_aspects"] == len(got)
+
+
+def test_aspect_fields_are_plain_python_numbers():
+    aspect = compare_charts(NATAL, TRANSIT)["aspects"][0]
+    assert type(aspect["orb"]) is float
+    assert type(aspect["actual_angle"]) is float
+    assert type(aspect["exact_angle"]) is int
+
+
+def test_wraparound_conjunction():
+    result = compare_charts(_chart({"Sun": 359.0}), _chart({"Moon": 2.0}))
+    [aspect] = result["aspects"]
+    assert aspect["aspect"] == "conjunction"
+    assert aspect["actual_angle"] == pytest.approx(3.0)
+
+
+def test_skips_bodies_without_position():
+    chart1 = {"planets": {"Sun": {"degree": 10.0, "sign": "Aries"}, "Node": {}}}
+    chart2 = {"planets": {"Moon": {"degree": 12.0, "sign": "Aries"}}}
+    result = compare_charts(chart1, chart2)
+    assert [(a["body1"], a["body2"]) for a in result["aspects"]] == [("Sun", "Moon")]
+
+
+def test_empty_side_returns_no_aspects():
+    result = compare_charts({"planets": {}}, TRANSIT)
+    assert result["aspects"] == []
+
+
+def test_unknown_sign_raises():
+    chart = {"planets": {"Sun": {"degree": 1.0, "sign": "Ophiuchus"}}}
+    with pytest.raises(AnalysisError):
+        compare_charts(chart, TRANSIT)
+
+
+def test_match_aspects_kernel():
+    import numpy as np
+    from w8s_astro_mcp.tools.analysis_tools import _ASPECT_NAMES, _match_aspects
+
+    pos1 = np.array([10.0, 200.0])
+    pos2 = np.array([12.0, 130.0, 300.0])
+    angles, pair_i, pair_j, kinds, orbs = _match_aspects(pos1, pos2, 1.0)
+
+    assert angles.shape == (2, 3)
+    found = {(i, j): (_ASPECT_NAMES[k], orb) for i, j, k, orb in zip(pair_i, pair_j, kinds, orbs)}
+    assert found[(0, 0)] == ("conjunction", 2.0)
+    assert found[(0, 1)] == ("trine", 0.0)
+    assert found[(1, 0)] == ("opposition", pytest.approx(8.0))
+    assert (1, 2) not in found  # 100° is 10° off square, outside its 8° orb
+
+
+def test_reuses_precomputed_absolute_position():
+    chart1 = {"planets": {"Sun": {"degree": 10.0, "sign": "Aries", "absolute_position": 10.0}}}
+    chart2 = {"planets": {"Moon": {"degree": 12.0, "sign": "Nonsense", "absolute_position": 12.0}}}
+    [aspect] = compare_charts(chart1, chart2)["aspects"]
+    assert aspect["body2_position"]["absolute"] == 12.0
+    assert aspect["orb"] == 2.0
+
+
+@pytest.mark.parametrize("pos1, pos2, expected", [
+    (15.0, 195.0, 180.0),
+    (359.0, 1.0, 2.0),
+    (1.0, 359.0, 2.0),
+    (10.0, 130.0, 120.0),
+    (42.0, 42.0, 0.0),
+])
+def test_calculate_aspect_angle(pos1, pos2, expected):
+    assert calculate_aspect_angle(pos1, pos2) == pytest.approx(expected)
+
+
+def test_body_position_built_once_per_body():
+    result = compare_charts(_chart({"Sun": 10.0}), _chart({"Moon": 12.0, "Mars": 130.0}))
+    first, second = result["aspects"]
+    assert first["body1_position"] is second["body1_position"]
+    assert first["body1_position"] == {"degree": 10.0, "sign": "Aries", "absolute": 10.0}
+
+
+@pytest.mark.parametrize("orb_multiplier", [0.5, 1.0, 1.49, 1.5, 2.5])
+def test_identify_aspect_matches_linear_scan(orb_multiplier):
+    from w8s_astro_mcp.tools.analysis_tools import ASPECTS
+
+    def linear(angle):
+        for name, spec in ASPECTS.items():
+            if abs(angle - spec["angle"]) <= spec["orb"] * orb_multiplier:
+                return name
+        return None
+
+    for tenth in range(0, 1801):
+        angle = tenth / 10
+        info = identify_aspect(angle, orb_multiplier)
+        assert (info["name"] if info else None) == linear(angle), angle
+
+
+def test_summary_only_counts_without_building_aspects():
+    full = compare_charts(NATAL, TRANSIT)
+    summary = compare_charts(NATAL, TRANSIT, summary_only=True)
+    assert summary["aspects"] == []
+    assert summary["metadata"]["total_aspects"] == len(full["aspects"]) > 0
+    report = format_aspect_report(summary)
+    assert f"Total Aspects Found: {len(full['aspects'])}" in report
+    assert "No aspects found" not in report
+
+
+@pytest.mark.parametrize("orb_multiplier", [0.5, 1.0, 2.5])
+def test_self_comparison_matches_scalar_reference(orb_multiplier):
+    # Same positions on both sides take the upper-triangle path.
+    result = compare_charts(NATAL, NATAL, orb_multiplier=orb_multiplier)
+    got = [(a["body1"], a["body2"], a["aspect"]) for a in result["aspects"]]
+    expected = _reference_aspects(NATAL, NATAL, orb_multiplier)
+    assert got == [a[:3] for a in expected]
+    assert [a["orb"] for a in result["aspects"]] == pytest.approx([a[3] for a in expected])
+    assert ("Jupiter", "Saturn", "square") in got and ("Saturn", "Jupiter", "square") in got
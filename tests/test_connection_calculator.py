@@ -248,6 +248,39 @@ class TestCalculateCompositePositions:
         result = calculate_composite_positions(charts)
         assert "1" in result["houses"] and 1 not in result["houses"]
 
+    def test_houses_in_numeric_order(self):
+        """Formatters list composite houses in dict order, so it must be 1..12."""
+        houses = {str(n): n * 30.0 for n in (12, 3, 10, 1, 2, 11, 4, 9, 5, 8, 6, 7)}
+        charts = [
+            make_chart({"Sun": 0.0}, house_positions=houses),
+            make_chart({"Sun": 0.0}, house_positions=houses),
+        ]
+        result = calculate_composite_positions(charts)
+        assert list(result["houses"]) == [str(n) for n in range(1, 13)]
+
+    def test_matches_circular_mean_per_body(self):
+        """The batched reduction agrees with circular_mean_degrees per body."""
+        planets = [
+            {"Sun": 350.0, "Moon": 12.5, "Mars": 200.0, "Venus": 91.0},
+            {"Sun": 20.0, "Moon": 300.0, "Mars": 215.5, "Venus": 271.0},
+            {"Sun": 5.0, "Moon": 45.0, "Mars": 10.0, "Venus": 180.0},
+        ]
+        houses = [{"1": 100.0 + i * 40.0, "10": 10.0 - i * 15.0} for i in range(3)]
+        charts = [
+            make_chart(p, house_positions=h, point_positions={"ASC": h["1"]})
+            for p, h in zip(planets, houses)
+        ]
+        result = calculate_composite_positions(charts)
+        for name in planets[0]:
+            expected = circular_mean_degrees([p[name] for p in planets])
+            assert near(result["planets"][name]["absolute_position"], expected, 1e-9)
+            assert type(result["planets"][name]["absolute_position"]) is float
+        for key in ("1", "10"):
+            expected = circular_mean_degrees([h[key] for h in houses])
+            assert near(result["houses"][key]["absolute_position"], expected, 1e-9)
+        assert near(result["points"]["ASC"]["absolute_position"],
+                    result["houses"]["1"]["absolute_position"], 1e-9)
+
     def test_absolute_position_in_range(self):
         charts = [make_chart({"Sun": 355.0}), make_chart({"Sun": 5.0})]
         pos = calculate_composite_positions(charts)["planets"]["Sun"]["absolute_position"]
@@ -5,16 +5,20 @@ Tests the full round-trip: Python → SQLAlchemy → SQLite → Python.
 
 Coverage:
 - create_connection
-- list_all_connections
+- list_all_connections / list_connection_summaries
 - get_connection_by_id
+- get_profiles_by_ids / get_birth_locations_bulk
 - get_connection_members
 - add_connection_member
 - remove_connection_member
+- fetch_connection_mutation_context
 - delete_connection
 - get_connection_chart (no chart → None)
+- get_connection_with_cached_chart
 - invalidate_connection_charts
 - save_connection_chart (composite format + swetest format)
 - get_connection_planets / get_connection_houses / get_connection_points
+- get_connection_chart_rows
 - _normalize_position (both input formats)
 """
 
@@ -228,6 +232,33 @@ class TestCreateConnection:
         assert len(members) == 3
 
 
+class TestGetProfilesByIds:
+
+    def test_returns_in_requested_order(self, db, two_profiles):
+        alice, bob = two_profiles
+        profiles = db.get_profiles_by_ids([bob.id, alice.id])
+        assert [p.name for p in profiles] == ["Bob", "Alice"]
+
+    def test_skips_missing_ids(self, db, two_profiles):
+        alice, _ = two_profiles
+        profiles = db.get_profiles_by_ids([9999, alice.id])
+        assert [p.id for p in profiles] == [alice.id]
+
+    def test_birth_locations_bulk(self, db, two_profiles):
+        alice, bob = two_profiles
+        locations = db.get_birth_locations_bulk([alice, bob])
+        assert locations[alice.id].id == alice.birth_location_id
+        assert locations[bob.id].id == bob.birth_location_id
+        assert locations[alice.id].latitude == pytest.approx(38.627)
+
+    def test_chunks_long_id_lists(self, db, two_profiles, monkeypatch):
+        from w8s_astro_mcp.utils import db_helpers
+        monkeypatch.setattr(db_helpers, "_SQLITE_MAX_VARIABLES", 1)
+        alice, bob = two_profiles
+        profiles = db.get_profiles_by_ids([alice.id, 9999, bob.id])
+        assert [p.name for p in profiles] == ["Alice", "Bob"]
+
+
 # =============================================================================
 # list_all_connections / get_connection_by_id
 # =============================================================================
@@ -251,6 +282,30 @@ class TestListAndGet:
     def test_get_nonexistent_returns_none(self, db):
         assert db.get_connection_by_id(99999) is None
 
+    def test_summaries_empty(self, db):
+        assert db.list_connection_summaries() == []
+
+    def test_summaries_concatenate_member_names(self, db, two_profiles):
+        alice, bob = two_profiles
+        db.create_connection(label="B", profile_ids=[bob.id, alice.id])
+        solo = db.create_connection(label="A", profile_ids=[alice.id])
+        db.remove_connection_member(solo.id, alice.id)
+        summaries = db.list_connection_summaries()
+        assert [(c.label, names) for c, names in summaries] == [
+            ("A", ""),
+            ("B", "Bob, Alice"),
+        ]
+
+    def test_summaries_keep_same_label_connections_apart(self, db, two_profiles):
+        alice, bob = two_profiles
+        first = db.create_connection(label="Same", profile_ids=[bob.id])
+        second = db.create_connection(label="Same", profile_ids=[alice.id, bob.id])
+        summaries = db.list_connection_summaries()
+        assert [(c.id, names) for c, names in summaries] == [
+            (first.id, "Bob"),
+            (second.id, "Alice, Bob"),
+        ]
+
 
 # =============================================================================
 # add_connection_member / remove_connection_member
@@ -288,6 +343,50 @@ class TestMemberManagement:
         with pytest.raises(DatabaseError):
             db.add_connection_member(basic_connection.id, alice.id)
 
+    def test_member_changes_invalidate_charts(self, db, basic_connection):
+        carol = db.create_profile_with_location(
+            name="Carol", birth_date="1992-01-01", birth_time="12:00",
+            birth_location_name="NYC", birth_latitude=40.71, birth_longitude=-74.0,
+            birth_timezone="America/New_York",
+        )
+        for change in (db.add_connection_member, db.remove_connection_member):
+            db.save_connection_chart(
+                connection_id=basic_connection.id,
+                chart_type="composite",
+                positions=COMPOSITE_POSITIONS,
+            )
+            change(basic_connection.id, carol.id)
+            chart = db.get_connection_chart(basic_connection.id, "composite")
+            assert chart.is_valid is False
+
+    def test_removing_non_member_keeps_charts_valid(self, db, basic_connection):
+        db.save_connection_chart(
+            connection_id=basic_connection.id,
+            chart_type="composite",
+            positions=COMPOSITE_POSITIONS,
+        )
+        db.remove_connection_member(basic_connection.id, 99999)
+        assert db.get_connection_chart(basic_connection.id, "composite").is_valid is True
+
+    def test_mutation_context_found(self, db, basic_connection, two_profiles):
+        alice, _ = two_profiles
+        connection, profile, count = db.fetch_connection_mutation_context(
+            basic_connection.id, alice.id
+        )
+        assert connection.label == "Alice & Bob"
+        assert profile.name == "Alice"
+        assert count == 2
+
+    def test_mutation_context_missing_rows(self, db, basic_connection):
+        connection, profile, count = db.fetch_connection_mutation_context(99999, 99999)
+        assert connection is None
+        assert profile is None
+        assert count == 0
+
+        connection, profile, _ = db.fetch_connection_mutation_context(basic_connection.id, 99999)
+        assert connection.id == basic_connection.id
+        assert profile is None
+
 
 # =============================================================================
 # delete_connection
@@ -384,6 +483,60 @@ class TestSaveAndGetChart:
             ).count()
         assert count == 1
 
+    def test_save_inserts_each_table_in_one_statement(self, db, basic_connection):
+        from sqlalchemy import event
+        positions = {
+            "planets": {
+                name: {"sign": "Aries", "degree": i, "minutes": 0, "seconds": 0.0,
+                       "absolute_position": float(i)}
+                for i, name in enumerate(["Sun", "Moon", "Mercury", "Venus", "Mars"])
+            },
+            "houses": {
+                str(n): {"sign": "Aries", "degree": n, "minutes": 0, "seconds": 0.0,
+                         "absolute_position": float(n)}
+                for n in range(1, 13)
+            },
+            "points": {},
+        }
+        statements = []
+        listener = lambda conn, cursor, stmt, *args: statements.append(stmt)
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            chart = db.save_connection_chart(
+                connection_id=basic_connection.id,
+                chart_type="composite",
+                positions=positions,
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT INTO CONNECTION_")]
+        assert sum("connection_planets" in s for s in inserts) == 1
+        assert sum("connection_houses" in s for s in inserts) == 1
+        assert not any("connection_points" in s for s in inserts)
+        assert len(db.get_connection_planets(chart.id)) == 5
+        assert [h.house_number for h in db.get_connection_houses(chart.id)] == list(range(1, 13))
+
+    def test_connection_with_cached_chart(self, db, basic_connection):
+        conn, chart = db.get_connection_with_cached_chart(basic_connection.id, "composite")
+        assert conn.id == basic_connection.id and chart is None
+
+        saved = db.save_connection_chart(
+            connection_id=basic_connection.id,
+            chart_type="composite",
+            positions=COMPOSITE_POSITIONS,
+        )
+        conn, chart = db.get_connection_with_cached_chart(basic_connection.id, "composite")
+        assert chart.id == saved.id
+        assert db.get_connection_with_cached_chart(basic_connection.id, "davison")[1] is None
+
+        db.invalidate_connection_charts(basic_connection.id)
+        conn, chart = db.get_connection_with_cached_chart(basic_connection.id, "composite")
+        assert conn.label == "Alice & Bob" and chart is None
+
+    def test_connection_with_cached_chart_missing_connection(self, db):
+        assert db.get_connection_with_cached_chart(99999, "composite") == (None, None)
+
     def test_composite_and_davison_coexist(self, db, basic_connection):
         db.save_connection_chart(
             connection_id=basic_connection.id, chart_type="composite",
@@ -401,6 +554,34 @@ class TestSaveAndGetChart:
 # invalidate_connection_charts
 # =============================================================================
 
+class TestLegacyDatabaseUpgrade:
+    """Databases created before connection_charts.rendered_text existed."""
+
+    def test_missing_column_added_on_open(self, tmp_path, db, basic_connection):
+        db.save_connection_chart(
+            connection_id=basic_connection.id,
+            chart_type="composite",
+            positions=COMPOSITE_POSITIONS,
+        )
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql("ALTER TABLE connection_charts DROP COLUMN rendered_text")
+        db.engine.dispose()
+
+        reopened = DatabaseHelper(db_path=str(tmp_path / "test_connections.db"))
+        connection, chart = reopened.get_connection_with_cached_chart(
+            basic_connection.id, "composite"
+        )
+        assert connection.id == basic_connection.id
+        assert chart is not None and chart.rendered_text is None
+
+    def test_upgrade_is_idempotent(self, db):
+        create_tables(db.engine)
+        create_tables(db.engine)
+        with db.engine.connect() as conn:
+            columns = [row[1] for row in conn.exec_driver_sql("PRAGMA table_info(connection_charts)")]
+        assert columns.count("rendered_text") == 1
+
+
 class TestInvalidateCharts:
 
     def test_invalidate_sets_is_valid_false(self, db, basic_connection):
@@ -483,6 +664,22 @@ class TestGetChartRows:
         points = self.db.get_connection_points(self.chart.id)
         assert points[0].point_type == "ASC"
 
+    def test_chart_rows_match_per_table_getters(self):
+        rows = self.db.get_connection_chart_rows(self.chart.id)
+        assert rows == {
+            "planets": [(p.planet, p.formatted_position)
+                        for p in self.db.get_connection_planets(self.chart.id)],
+            "houses": [(h.house_number, h.formatted_position)
+                       for h in self.db.get_connection_houses(self.chart.id)],
+            "points": [(pt.point_type, pt.formatted_position)
+                       for pt in self.db.get_connection_points(self.chart.id)],
+        }
+
+    def test_chart_rows_unknown_chart_is_empty(self):
+        assert self.db.get_connection_chart_rows(99999) == {
+            "planets": [], "houses": [], "points": [],
+        }
+
     def test_swetest_format_saves_correctly(self, db, basic_connection):
         """Swetest-format positions should produce correct absolute_position in DB."""
         chart = db.save_connection_chart(
@@ -0,0 +1,166 @@
+"""Tests for connection management tool handlers (Phase 7).
+
+Handlers run against a real DatabaseHelper on a temp SQLite file; the
+ephemeris engine is not needed for the paths covered here.
+"""
+
+import pytest
+
+from w8s_astro_mcp.models import HOUSE_SYSTEM_SEED_DATA, HouseSystem
+from w8s_astro_mcp.tools.connection_management import (
+    CONNECTION_TOOL_NAMES,
+    get_connection_tools,
+    handle_connection_tool,
+    handle_create_connection,
+    handle_list_connections,
+    handle_get_connection_chart,
+    _CONNECTION_HANDLERS,
+    _fmt_with_sign,
+)
+from w8s_astro_mcp.utils.db_helpers import DatabaseHelper
+
+
+COMPOSITE_POSITIONS = {
+    "planets": {
+        "Sun": {"degree": 15, "minutes": 24, "seconds": 36.0,
+                "sign": "Gemini", "absolute_position": 75.41},
+    },
+    "houses": {
+        "1": {"degree": 11, "minutes": 45, "seconds": 0.0,
+              "sign": "Scorpio", "absolute_position": 221.75},
+    },
+    "points": {
+        "ASC": {"degree": 11, "minutes": 45, "seconds": 0.0,
+                "sign": "Scorpio", "absolute_position": 221.75},
+    },
+}
+
+
+@pytest.fixture
+def db(tmp_path):
+    """DatabaseHelper with house systems seeded and two profiles."""
+    from w8s_astro_mcp.models import (  # noqa: F401
+        Connection, ConnectionMember, ConnectionChart,
+        ConnectionPlanet, ConnectionHouse, ConnectionPoint,
+    )
+    from w8s_astro_mcp.database import get_session
+
+    helper = DatabaseHelper(db_path=str(tmp_path / "connections.db"))
+    with get_session(helper.engine) as session:
+        for data in HOUSE_SYSTEM_SEED_DATA:
+            session.add(HouseSystem(**data))
+        session.commit()
+    for name in ("Alice", "Bob"):
+        helper.create_profile_with_location(
+            name=name, birth_date="1990-03-15", birth_time="14:30",
+            birth_location_name="St. Louis, MO", birth_latitude=38.627,
+            birth_longitude=-90.198, birth_timezone="America/Chicago",
+        )
+    return helper
+
+
+def _profile_ids(db):
+    return [p.id for p in db.list_all_profiles()]
+
+
+@pytest.mark.asyncio
+async def test_create_connection_reports_members(db):
+    result = await handle_create_connection(
+        db, {"label": "Pair", "profile_ids": _profile_ids(db), "type": "romantic"}
+    )
+    text = result[0].text
+    assert text.startswith("✓ Connection created!\n\n**Pair** (ID: ")
+    assert "Type: romantic\n" in text
+    assert "Members: Alice, Bob\n\n" in text
+
+
+@pytest.mark.asyncio
+async def test_create_connection_missing_profile(db):
+    result = await handle_create_connection(
+        db, {"label": "Pair", "profile_ids": [_profile_ids(db)[0], 9999]}
+    )
+    assert result[0].text == "Error: profile(s) not found: [9999]"
+
+
+@pytest.mark.asyncio
+async def test_list_connections(db):
+    ids = _profile_ids(db)
+    db.create_connection(label="Pair", profile_ids=ids, start_date="2020-06-15")
+    result = await handle_list_connections(db)
+    conn = db.list_all_connections()[0]
+    assert result[0].text == (
+        "# Connections\n\n"
+        f"**Pair** (ID: {conn.id})\n"
+        "  Members: Alice, Bob\n"
+        "  Since: 2020-06-15\n\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_chart_formatting(db):
+    conn = db.create_connection(label="Pair", profile_ids=_profile_ids(db))
+    db.save_connection_chart(
+        connection_id=conn.id, chart_type="composite",
+        positions=COMPOSITE_POSITIONS, calculation_method="circular_mean",
+    )
+    result = await handle_get_connection_chart(
+        db, None, {"connection_id": conn.id, "chart_type": "composite"}
+    )
+    text = result[0].text
+    assert text.startswith("# Composite Chart — Pair (cached)\n\n")
+    assert "## Planets\n- **Sun**: 15°24'36\" Gemini\n\n" in text
+    assert "## Houses\n- House 1: 11°45'0\" Scorpio\n\n" in text
+    assert text.endswith("## Angles\n- **ASC**: 11°45'0\" Scorpio\n")
+
+
+@pytest.mark.asyncio
+async def test_cached_chart_reuses_rendered_text(db):
+    conn = db.create_connection(label="Pair", profile_ids=_profile_ids(db))
+    chart = db.save_connection_chart(
+        connection_id=conn.id, chart_type="composite",
+        positions=COMPOSITE_POSITIONS, calculation_method="circular_mean",
+    )
+    assert chart.rendered_text is None
+    args = {"connection_id": conn.id, "chart_type": "composite"}
+
+    first = (await handle_get_connection_chart(db, None, args))[0].text
+    stored = db.get_connection_chart(conn.id, "composite").rendered_text
+    assert stored.startswith("## Planets\n") and stored in first
+
+    # A cache hit with stored text doesn't read the position rows again
+    db.get_connection_chart_rows = None
+    assert (await handle_get_connection_chart(db, None, args))[0].text == first
+
+    db.invalidate_connection_charts(conn.id)
+    assert db.get_connection_chart(conn.id, "composite").rendered_text is None
+
+
+@pytest.mark.asyncio
+async def test_dispatch_unknown_tool(db):
+    result = await handle_connection_tool("nope", {}, db)
+    assert "nope" in result[0].text
+
+
+@pytest.mark.parametrize("data, expected", [
+    ({"formatted": "9°46'", "sign": "Leo"}, "9°46' Leo"),
+    ({"formatted": "9°46'12\" Leo", "sign": "Leo"}, "9°46'12\" Leo"),
+    ({"formatted": "9°46'"}, "9°46'"),
+    ({"degree": 9, "minutes": 5, "sign": "Leo"}, "9° 05' Leo"),
+    ({"degree": 9, "sign": "Leo"}, "9° 00' Leo"),
+    ({"sign": "Leo", "absolute_position": 129.5}, "129.50°"),
+    ({"absolute_position": 129.5}, "129.50°"),
+    ({"other": 1}, "{'other': 1}"),
+])
+def test_fmt_with_sign(data, expected):
+    assert _fmt_with_sign(data) == expected
+
+
+def test_dispatch_table_covers_tool_names():
+    assert set(_CONNECTION_HANDLERS) == CONNECTION_TOOL_NAMES
+    assert {t.name for t in get_connection_tools()} == CONNECTION_TOOL_NAMES
+
+
+@pytest.mark.asyncio
+async def test_dispatch_routes_to_handler(db):
+    result = await handle_connection_tool("list_connections", {}, db)
+    assert result[0].text.startswith("No connections found.")
@@ -85,3 +85,23 @@ def test_pyproject_entry_point_targets_run():
         f"Entry point is '{our_ep.value}' — should be 'w8s_astro_mcp.server:run'. "
         "Pointing at an async def will produce a coroutine object when invoked by pip."
     )
+
+
+def test_server_import_does_not_load_matplotlib():
+    """Importing the server must not pull in matplotlib.
+
+    visualize_natal_chart imports the plotting module on first use so the
+    MCP handshake is not delayed by matplotlib's import cost. A fresh
+    interpreter is used because other tests may already have imported it.
+    """
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, w8s_astro_mcp.server; "
+        "print('matplotlib' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
@@ -5,6 +5,7 @@ verifying the output structure is backward-compatible with the old swetest parse
 """
 
 import pytest
+import swisseph as swe
 from unittest.mock import patch, MagicMock
 from w8s_astro_mcp.utils.ephemeris import EphemerisEngine, EphemerisError
 
@@ -41,6 +42,31 @@ class TestInit:
         e = EphemerisEngine(ephe_path=str(tmp_path))
         assert e.ephe_path == str(tmp_path)
 
+    def test_same_path_not_reapplied(self, tmp_path, monkeypatch):
+        """set_ephe_path runs only when the configured path changes."""
+        import w8s_astro_mcp.utils.ephemeris as ephemeris_module
+        monkeypatch.setattr(ephemeris_module, "_active_ephe_path", ephemeris_module._UNSET)
+        with patch("w8s_astro_mcp.utils.ephemeris.swe.set_ephe_path") as set_path:
+            EphemerisEngine(ephe_path=str(tmp_path))
+            EphemerisEngine(ephe_path=str(tmp_path))
+            EphemerisEngine()
+            EphemerisEngine()
+        assert [c.args for c in set_path.call_args_list] == [(str(tmp_path),), (None,)]
+
+
+    def test_interleaved_engines_reactivate_their_path(self, tmp_path, monkeypatch):
+        """Each calculation runs against its own engine's path."""
+        import w8s_astro_mcp.utils.ephemeris as ephemeris_module
+        moshier = EphemerisEngine()
+        sweph = EphemerisEngine(ephe_path=str(tmp_path))
+        monkeypatch.setattr(ephemeris_module, "_active_ephe_path", str(tmp_path))
+        with patch("w8s_astro_mcp.utils.ephemeris.swe.set_ephe_path") as set_path:
+            moshier.get_planets_batch([2461000.5])
+            moshier.get_houses_batch([2461000.5], 38.637, -90.263)
+            assert [c.args for c in set_path.call_args_list] == [(None,)]
+            sweph.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        assert [c.args for c in set_path.call_args_list] == [(None,), (str(tmp_path),)]
+        EphemerisEngine()  # leave Moshier active for the other tests
 
 # ---------------------------------------------------------------------------
 # Julian Day conversion
@@ -257,6 +283,16 @@ class TestGetChart:
         with pytest.raises(EphemerisError, match="date"):
             engine.get_chart(38.637, -90.263, date_str="not-a-date")
 
+    def test_unpadded_date_accepted(self, engine):
+        result = engine.get_chart(38.637, -90.263, "2026-2-3", "12:00")
+        expected = engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        assert result["planets"] == expected["planets"]
+
+    @pytest.mark.parametrize("date_str", ["2026-02-03T23:30", "20260203"])
+    def test_non_date_iso_forms_rejected(self, engine, date_str):
+        with pytest.raises(EphemerisError, match="YYYY-MM-DD"):
+            engine.get_chart(38.637, -90.263, date_str=date_str)
+
     def test_degree_values_in_range(self, engine):
         """Degree within sign is always 0–<30."""
         result = engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
@@ -285,6 +321,138 @@ class TestGetTransitsAlias:
         assert "houses" in result
 
 
+# ---------------------------------------------------------------------------
+# Chart memoization
+# ---------------------------------------------------------------------------
+
+class TestChartCache:
+    """Repeated get_chart() calls for the same moment and place are memoized."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        EphemerisEngine.cache_clear()
+        yield
+        EphemerisEngine.cache_clear()
+
+    def test_repeat_call_skips_calculation(self, engine):
+        engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        with patch("w8s_astro_mcp.utils.ephemeris.swe.calc_ut") as calc:
+            engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        calc.assert_not_called()
+
+    def test_cache_shared_across_engines(self, engine):
+        engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        with patch("w8s_astro_mcp.utils.ephemeris.swe.calc_ut") as calc:
+            EphemerisEngine().get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        calc.assert_not_called()
+
+    def test_caller_mutation_does_not_leak(self, engine):
+        first = engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        first["planets"]["Sun"]["sign"] = "Mutated"
+        first["houses"].clear()
+        second = engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        assert second["planets"]["Sun"]["sign"] == "Aquarius"
+        assert len(second["houses"]) == 12
+
+    def test_planet_positions_shared_across_locations(self, engine):
+        engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        with patch("w8s_astro_mcp.utils.ephemeris.swe.calc_ut") as calc:
+            chart = engine.get_chart(13.756, 100.502, "2026-02-03", "12:00")
+        calc.assert_not_called()
+        assert chart["planets"]["Sun"]["sign"] == "Aquarius"
+        assert EphemerisEngine.cache_info().hits == 10
+
+    def test_cache_clear_forces_recalculation(self, engine):
+        engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        EphemerisEngine.cache_clear()
+        with patch("w8s_astro_mcp.utils.ephemeris.swe.calc_ut", wraps=swe.calc_ut) as calc:
+            engine.get_chart(38.637, -90.263, "2026-02-03", "12:00")
+        assert calc.call_count == 10
+
+
+# ---------------------------------------------------------------------------
+# Julian Day charts
+# ---------------------------------------------------------------------------
+
+class TestGetChartJd:
+    """get_chart_jd() matches get_chart() for the same moment."""
+
+    def test_matches_get_chart(self, engine):
+        jd = engine._to_jd(2026, 2, 3, 18.5)
+        by_jd = engine.get_chart_jd(jd, 38.637, -90.263)
+        by_str = engine.get_chart(38.637, -90.263, "2026-02-03", "18:30")
+        assert by_jd == by_str
+        assert by_jd["metadata"]["date"] == "2026-02-03"
+        assert by_jd["metadata"]["time"] == "18:30:00"
+
+    def test_time_rounds_to_nearest_minute(self, engine):
+        jd = engine._to_jd(2026, 2, 3, 23 + 59.9 / 60)
+        meta = engine.get_chart_jd(jd, 38.637, -90.263)["metadata"]
+        assert (meta["date"], meta["time"]) == ("2026-02-04", "00:00:00")
+
+    def test_house_system_code(self, engine):
+        jd = engine._to_jd(2026, 2, 3, 12.0)
+        chart = engine.get_chart_jd(jd, 38.637, -90.263, house_system_code="W")
+        assert chart["metadata"]["house_system"] == "Whole Sign"
+
+
+# ---------------------------------------------------------------------------
+# Batched charts
+# ---------------------------------------------------------------------------
+
+class TestChartBatch:
+    """get_planets_batch() and get_houses_batch() return get_chart() positions column-wise."""
+
+    def test_matches_get_chart(self, engine):
+        from w8s_astro_mcp.constants import PLANET_NAMES
+
+        jds = [engine._to_jd(2026, 2, 3, 12.0), engine._to_jd(2026, 2, 3, 18.5)]
+        batch = engine.get_planets_batch(jds)
+        batch.update(engine.get_houses_batch(jds, 38.637, -90.263))
+        assert batch["longitude"].shape == (2, 10)
+        assert batch["cusps"].shape == (2, 12)
+
+        for row, time_str in enumerate(["12:00", "18:30"]):
+            chart = engine.get_chart(38.637, -90.263, "2026-02-03", time_str)
+            for col, name in enumerate(PLANET_NAMES):
+                planet = chart["planets"][name]
+                assert batch["longitude"][row, col] == pytest.approx(planet["absolute_position"])
+                assert (batch["speed"][row, col] < 0) == planet["is_retrograde"]
+            for i in range(12):
+                assert batch["cusps"][row, i] == pytest.approx(
+                    chart["houses"][str(i + 1)]["absolute_position"]
+                )
+            assert batch["angles"][row, 0] == pytest.approx(
+                chart["points"]["Ascendant"]["absolute_position"]
+            )
+
+    def test_planets_batch_skips_houses(self, engine):
+        jds = [engine._to_jd(2026, 2, 3, 12.0)]
+        with patch("w8s_astro_mcp.utils.ephemeris.swe.houses") as houses:
+            planets = engine.get_planets_batch(jds)
+        houses.assert_not_called()
+        assert set(planets) == {"jd", "longitude", "speed"}
+
+    def test_houses_batch_depends_on_location(self, engine):
+        jds = [engine._to_jd(2026, 2, 3, 12.0)]
+        here = engine.get_houses_batch(jds, 38.637, -90.263)
+        there = engine.get_houses_batch(jds, 13.756, 100.502)
+        assert set(here) == {"cusps", "angles"}
+        assert here["angles"][0, 0] != pytest.approx(there["angles"][0, 0])
+
+    def test_empty_batch(self, engine):
+        assert engine.get_planets_batch([])["longitude"].shape == (0, 10)
+        assert engine.get_houses_batch([], 38.637, -90.263)["cusps"].shape == (0, 12)
+
+    def test_failure_raises_ephemeris_error(self, engine):
+        with patch("w8s_astro_mcp.utils.ephemeris.swe.calc_ut", side_effect=RuntimeError("boom")):
+            with pytest.raises(EphemerisError, match="boom"):
+                engine.get_planets_batch([2461000.5])
+        with patch("w8s_astro_mcp.utils.ephemeris.swe.houses", side_effect=RuntimeError("boom")):
+            with pytest.raises(EphemerisError, match="boom"):
+                engine.get_houses_batch([2461000.5], 38.637, -90.263)
+
+
 # ---------------------------------------------------------------------------
 # Ephemeris path and mode
 # ---------------------------------------------------------------------------
@@ -5,7 +5,7 @@ Covers:
 - handle_cast_event_chart (no save + with save)
 - handle_list_event_charts
 - handle_delete_event_chart
-- score_chart (electional utility)
+- score_chart / score_batch (electional utility)
 - find_electional_windows handler (mocked ephemeris)
 """
 
@@ -16,14 +16,28 @@ from datetime import datetime
 import sys
 import types
 
+import numpy as np
+
+from w8s_astro_mcp.constants import PLANET_NAMES
 from w8s_astro_mcp.utils.db_helpers import DatabaseHelper
-from w8s_astro_mcp.utils.electional import score_chart
+from w8s_astro_mcp.utils.electional import (
+    SIGN_INDEX,
+    chart_at,
+    score_batch,
+    score_chart,
+)
+import w8s_astro_mcp.tools.event_management as em
 from w8s_astro_mcp.tools.event_management import (
+    _EVENT_HANDLERS,
+    _get_engine,
+    _scan_planets,
     handle_cast_event_chart,
     handle_list_event_charts,
     handle_delete_event_chart,
+    handle_event_tool,
     handle_find_electional_windows,
     EVENT_TOOL_NAMES,
+    get_event_tools,
 )
 
 
@@ -31,6 +45,33 @@ from w8s_astro_mcp.tools.event_management import (
 # Fixtures
 # ============================================================================
 
+def _batch_from_chart(chart: dict, jds) -> dict:
+    """Repeat one chart dict as a planets + houses batch for every jd.
+
+    Cusps are equal houses from house 1; the chart's house_number values
+    are not carried over (the batch places planets itself).
+    """
+    n = len(jds)
+    lons, speeds = [], []
+    for name in PLANET_NAMES:
+        p = chart["planets"].get(name, {"degree": 0.0, "sign": "Aries"})
+        lon = p.get("absolute_position")
+        if lon is None:
+            lon = SIGN_INDEX[p["sign"]] * 30.0 + p["degree"]
+        lons.append(lon)
+        speeds.append(-1.0 if p.get("is_retrograde") else 1.0)
+    first = chart["houses"]["1"]
+    cusp1 = SIGN_INDEX[first["sign"]] * 30.0 + first["degree"]
+    asc = chart["points"]["ASC"]
+    return {
+        "jd": np.asarray(jds, dtype=float),
+        "longitude": np.tile(lons, (n, 1)),
+        "speed": np.tile(speeds, (n, 1)),
+        "cusps": np.tile((cusp1 + 30.0 * np.arange(12)) % 360.0, (n, 1)),
+        "angles": np.tile([SIGN_INDEX[asc["sign"]] * 30.0 + asc["degree"], 0.0], (n, 1)),
+    }
+
+
 @pytest.fixture
 def tmp_db(tmp_path):
     """Fresh SQLite database for each test, with all models registered and
@@ -285,6 +326,18 @@ class TestGetEventChartPositions:
         positions = tmp_db.get_event_chart_positions(ev.id)
         assert positions["planets"]["Mercury"]["is_retrograde"] is True
 
+    def test_chart_without_houses_or_points(self, tmp_db):
+        chart = {"planets": SAMPLE_CHART["planets"], "houses": {}, "points": {}}
+        tmp_db.save_event_chart(
+            label="planets-only", event_date="2026-05-01", event_time="12:00",
+            latitude=0.0, longitude=0.0, timezone="UTC",
+            location_name="Test", chart=chart,
+        )
+        ev = tmp_db.get_event_chart_by_label("planets-only")
+        positions = tmp_db.get_event_chart_positions(ev.id)
+        assert set(positions["planets"]) == set(SAMPLE_CHART["planets"])
+        assert positions["houses"] == {} and positions["points"] == {}
+
 
 class TestDeleteEventChart:
     def test_delete_existing(self, tmp_db):
@@ -437,6 +490,16 @@ class TestScoreChart:
         assert "moon_not_void" in met
         assert "no_retrograde_inner" not in met
 
+    def test_min_met_stops_once_unreachable(self):
+        chart = self._make_chart(mercury_retro=True, asc_deg=28.0)
+        criteria = ["no_retrograde_inner", "asc_not_late", "moon_waxing"]
+        met, details = score_chart(chart, criteria, min_met=2)
+        assert met == []
+        assert set(details) == {"no_retrograde_inner", "asc_not_late"}
+        # Without a threshold every criterion is evaluated
+        met, details = score_chart(chart, criteria)
+        assert set(details) == set(criteria)
+
     def test_unknown_criterion_fails_gracefully(self):
         chart = self._make_chart()
         met, details = score_chart(chart, ["nonexistent_criterion"])
@@ -444,6 +507,90 @@ class TestScoreChart:
         assert "Unknown" in details["nonexistent_criterion"]
 
 
+class TestScoreBatch:
+    CRITERIA = [
+        "moon_not_void", "no_retrograde_inner", "no_retrograde_outer",
+        "no_retrograde_all", "moon_waxing", "moon_waning",
+        "benefic_angular", "asc_not_late", "nonexistent_criterion",
+    ]
+
+    def _random_batch(self, n=500, seed=7):
+        rng = np.random.default_rng(seed)
+        return {
+            "jd": 2461000.5 + np.arange(n) / 24.0,
+            "longitude": rng.uniform(0, 360, (n, len(PLANET_NAMES))),
+            "speed": rng.uniform(-1, 1, (n, len(PLANET_NAMES))),
+            "cusps": np.sort(rng.uniform(0, 360, (n, 12)), axis=1),
+            "angles": rng.uniform(0, 360, (n, 2)),
+        }
+
+    def test_masks_match_score_chart(self):
+        batch = self._random_batch()
+        masks = score_batch(batch, self.CRITERIA)
+        for i in range(len(batch["jd"])):
+            met, _ = score_chart(chart_at(batch, i), self.CRITERIA)
+            assert [c for c in self.CRITERIA if masks[c][i]] == met, i
+
+    @pytest.mark.parametrize("min_met", [1, 4, 8])
+    def test_min_met_keeps_qualifying_rows_exact(self, min_met):
+        batch = self._random_batch()
+        full = score_batch(batch, self.CRITERIA)
+        pruned = score_batch(batch, self.CRITERIA, min_met=min_met)
+        full_counts = np.count_nonzero([full[c] for c in self.CRITERIA], axis=0)
+        pruned_counts = np.count_nonzero([pruned[c] for c in self.CRITERIA], axis=0)
+        keep = full_counts >= min_met
+        for c in self.CRITERIA:
+            assert (pruned[c][keep] == full[c][keep]).all(), c
+        assert (pruned_counts[~keep] < min_met).all()
+
+    def test_min_met_skips_expensive_criterion_for_hopeless_rows(self, monkeypatch):
+        import w8s_astro_mcp.utils.electional as electional
+        seen = []
+        original = electional._batch_moon_not_void
+        monkeypatch.setattr(
+            electional, "_batch_moon_not_void",
+            lambda lons: seen.append(len(lons)) or original(lons),
+        )
+        batch = self._random_batch(n=100)
+        batch["speed"][:] = 1.0
+        batch["speed"][:50] = -1.0  # first half fails the retrograde check
+        score_batch(batch, ["moon_not_void", "no_retrograde_all"], min_met=2)
+        assert seen == [50]
+
+    def test_every_criterion_varies(self):
+        masks = score_batch(self._random_batch(), self.CRITERIA)
+        for criterion in self.CRITERIA[:-1]:
+            assert 0 < masks[criterion].sum() < masks[criterion].size, criterion
+        assert not masks["nonexistent_criterion"].any()
+
+    def test_check_tables_cover_same_criteria(self):
+        from w8s_astro_mcp.utils.electional import _BATCH_CHECKS, _CHECKS, _CRITERION_COST
+        assert set(_CHECKS) == set(_BATCH_CHECKS) == set(_CRITERION_COST)
+        assert set(self.CRITERIA[:-1]) == set(_CHECKS)
+
+    def test_chart_at_places_planets_in_houses(self):
+        batch = self._random_batch(n=1)
+        batch["cusps"][0] = (100.0 + 30.0 * np.arange(12)) % 360.0
+        batch["longitude"][0, PLANET_NAMES.index("Venus")] = 95.0
+        batch["longitude"][0, PLANET_NAMES.index("Jupiter")] = 101.0
+        chart = chart_at(batch, 0)
+        assert chart["planets"]["Venus"]["house_number"] == 12
+        assert chart["planets"]["Jupiter"]["house_number"] == 1
+        assert chart["planets"]["Jupiter"]["sign"] == "Cancer"
+        assert chart["houses"]["1"]["absolute_position"] == 100.0
+        assert set(chart["points"]) == {"Ascendant", "MC"}
+
+    def test_chart_at_planets_only_batch(self):
+        full = self._random_batch(n=3)
+        batch = {k: full[k] for k in ("jd", "longitude", "speed")}
+        masks = score_batch(batch, ["moon_not_void", "no_retrograde_all"])
+        chart = chart_at(batch, 2)
+        assert chart["houses"] == {} and chart["points"] == {}
+        assert "house_number" not in chart["planets"]["Venus"]
+        met, _ = score_chart(chart, ["moon_not_void", "no_retrograde_all"])
+        assert met == [c for c in ("moon_not_void", "no_retrograde_all") if masks[c][2]]
+
+
 # ============================================================================
 # Tool handler tests
 # ============================================================================
@@ -476,6 +623,16 @@ class TestHandleCastEventChart:
         assert "not saved" in text.lower()
         assert tmp_db.list_event_charts() == []
 
+    async def test_house_cusps_listed_in_numeric_order(self, tmp_db, mock_ephemeris_engine):
+        houses = {str(n): {"degree": 1.0, "sign": "Aries"} for n in (10, 2, 1, 12)}
+        mock_ephemeris_engine.get_chart = lambda self, **kwargs: {**SAMPLE_CHART, "houses": houses}
+        result = await handle_cast_event_chart(tmp_db, {
+            "date": "2026-02-23", "time": "12:00",
+            "latitude": 32.0, "longitude": -96.0,
+        })
+        listed = [l.split("**")[1] for l in result[0].text.splitlines() if l.startswith("- **House ")]
+        assert listed == ["House 1", "House 2", "House 10", "House 12"]
+
     async def test_saves_when_label_provided(self, tmp_db, mock_ephemeris_engine):
         result = await handle_cast_event_chart(tmp_db, {
             "date": "2026-02-23", "time": "12:00",
@@ -634,7 +791,8 @@ class TestHandleFindElectionalWindows:
         fake_mod = types.ModuleType("w8s_astro_mcp.utils.ephemeris")
         class FakeEphemerisError(Exception): pass
         class FakeEngine:
-            def get_chart(self, **kwargs): return chart
+            def get_planets_batch(self, **kwargs): return _batch_from_chart(chart, kwargs["jds"])
+            def get_houses_batch(self, **kwargs): return _batch_from_chart(chart, kwargs["jds"])
         fake_mod.EphemerisEngine = FakeEngine
         fake_mod.EphemerisError = FakeEphemerisError
         key = "w8s_astro_mcp.utils.ephemeris"
@@ -663,7 +821,8 @@ class TestHandleFindElectionalWindows:
         fake_mod = types.ModuleType("w8s_astro_mcp.utils.ephemeris")
         class FakeEphemerisError(Exception): pass
         class FakeEngine:
-            def get_chart(self, **kwargs): return chart
+            def get_planets_batch(self, **kwargs): return _batch_from_chart(chart, kwargs["jds"])
+            def get_houses_batch(self, **kwargs): return _batch_from_chart(chart, kwargs["jds"])
         fake_mod.EphemerisEngine = FakeEngine
         fake_mod.EphemerisError = FakeEphemerisError
         key = "w8s_astro_mcp.utils.ephemeris"
@@ -683,6 +842,244 @@ class TestHandleFindElectionalWindows:
         assert "no candidates" in result[0].text.lower()
 
 
+    async def test_ranks_by_score_then_time(self, tmp_db):
+        chart = self._make_mock_chart()
+        calls = []
+        fake_mod = types.ModuleType("w8s_astro_mcp.utils.ephemeris")
+        class FakeEphemerisError(Exception): pass
+        class FakeEngine:
+            def get_planets_batch(self, **kwargs):
+                calls.append(("planets", kwargs))
+                return _batch_from_chart(chart, kwargs["jds"])
+            def get_houses_batch(self, **kwargs):
+                calls.append(("houses", kwargs))
+                batch = _batch_from_chart(chart, kwargs["jds"])
+                batch["angles"][:2, 0] = 28.0  # first two steps: late ASC
+                return {"cusps": batch["cusps"], "angles": batch["angles"]}
+        fake_mod.EphemerisEngine = FakeEngine
+        fake_mod.EphemerisError = FakeEphemerisError
+        key = "w8s_astro_mcp.utils.ephemeris"
+        orig = sys.modules.get(key)
+        sys.modules[key] = fake_mod
+        try:
+            result = await handle_find_electional_windows(tmp_db, {
+                "start_date": "2026-03-01", "end_date": "2026-03-02",
+                "latitude": 32.0, "longitude": -96.0,
+                "criteria": ["asc_not_late", "moon_waxing"],
+                "interval_minutes": 360,
+                "max_results": 4,
+            })
+        finally:
+            if orig is None: sys.modules.pop(key, None)
+            else: sys.modules[key] = orig
+
+        # One batched call each covering the whole window, endpoints included
+        assert [kind for kind, _ in calls] == ["planets", "houses"]
+        for _, call in calls:
+            assert call["jds"].tolist() == [2461100.5, 2461100.75, 2461101.0, 2461101.25, 2461101.5]
+        assert (calls[1][1]["latitude"], calls[1][1]["longitude"]) == (32.0, -96.0)
+        headings = [l for l in result[0].text.splitlines() if l.startswith("## ")]
+        assert headings == [
+            "## 1. 2026-03-01 12:00 — 2/2 criteria met",
+            "## 2. 2026-03-01 18:00 — 2/2 criteria met",
+            "## 3. 2026-03-02 00:00 — 2/2 criteria met",
+            "## 4. 2026-03-01 00:00 — 1/2 criteria met",
+        ]
+        assert "✗ asc_not_late (ASC at 28.0° Aries — late degree)" in result[0].text
+
+
+    async def test_planet_only_criteria_skip_houses(self, tmp_db):
+        chart = self._make_mock_chart()
+        fake_mod = types.ModuleType("w8s_astro_mcp.utils.ephemeris")
+        class FakeEphemerisError(Exception): pass
+        class FakeEngine:
+            def get_planets_batch(self, **kwargs):
+                batch = _batch_from_chart(chart, kwargs["jds"])
+                return {k: batch[k] for k in ("jd", "longitude", "speed")}
+            def get_houses_batch(self, **kwargs):
+                raise AssertionError("houses not needed")
+        fake_mod.EphemerisEngine = FakeEngine
+        fake_mod.EphemerisError = FakeEphemerisError
+        key = "w8s_astro_mcp.utils.ephemeris"
+        orig = sys.modules.get(key)
+        sys.modules[key] = fake_mod
+        try:
+            result = await handle_find_electional_windows(tmp_db, {
+                "start_date": "2026-03-01", "end_date": "2026-03-02",
+                "latitude": 32.0, "longitude": -96.0,
+                "criteria": ["moon_not_void", "no_retrograde_all", "moon_waxing"],
+                "interval_minutes": 360,
+                "max_results": 1,
+            })
+        finally:
+            if orig is None: sys.modules.pop(key, None)
+            else: sys.modules[key] = orig
+        assert "## 1. 2026-03-01 00:00 — 3/3 criteria met" in result[0].text
+
+
+    async def test_min_criteria_filters_partial_matches(self, tmp_db):
+        chart = self._make_mock_chart()
+        fake_mod = types.ModuleType("w8s_astro_mcp.utils.ephemeris")
+        class FakeEphemerisError(Exception): pass
+        class FakeEngine:
+            def get_planets_batch(self, **kwargs): return _batch_from_chart(chart, kwargs["jds"])
+            def get_houses_batch(self, **kwargs):
+                batch = _batch_from_chart(chart, kwargs["jds"])
+                batch["angles"][:2, 0] = 28.0  # first two steps: late ASC
+                return {"cusps": batch["cusps"], "angles": batch["angles"]}
+        fake_mod.EphemerisEngine = FakeEngine
+        fake_mod.EphemerisError = FakeEphemerisError
+        key = "w8s_astro_mcp.utils.ephemeris"
+        orig = sys.modules.get(key)
+        sys.modules[key] = fake_mod
+        try:
+            result = await handle_find_electional_windows(tmp_db, {
+                "start_date": "2026-03-01", "end_date": "2026-03-02",
+                "latitude": 32.0, "longitude": -96.0,
+                "criteria": ["asc_not_late", "moon_waxing"],
+                "interval_minutes": 360,
+                "min_criteria": 2,
+            })
+        finally:
+            if orig is None: sys.modules.pop(key, None)
+            else: sys.modules[key] = orig
+        headings = [l for l in result[0].text.splitlines() if l.startswith("## ")]
+        assert len(headings) == 3
+        assert all(h.endswith("2/2 criteria met") for h in headings)
+
+    async def test_repeat_scan_served_from_cache(self, tmp_db):
+        chart = self._make_mock_chart()
+        calls = []
+        fake_mod = types.ModuleType("w8s_astro_mcp.utils.ephemeris")
+        class FakeEphemerisError(Exception): pass
+        class FakeEngine:
+            def get_planets_batch(self, **kwargs):
+                calls.append(len(kwargs["jds"]))
+                return _batch_from_chart(chart, kwargs["jds"])
+        fake_mod.EphemerisEngine = FakeEngine
+        fake_mod.EphemerisError = FakeEphemerisError
+        key = "w8s_astro_mcp.utils.ephemeris"
+        orig = sys.modules.get(key)
+        sys.modules[key] = fake_mod
+        args = {
+            "start_date": "2026-03-01", "end_date": "2026-03-02",
+            "latitude": 32.0, "longitude": -96.0,
+            "criteria": ["moon_waxing", "no_retrograde_inner"],
+            "interval_minutes": 360,
+        }
+        try:
+            first = await handle_find_electional_windows(tmp_db, args)
+            again = await handle_find_electional_windows(tmp_db, dict(args))
+            assert again[0].text == first[0].text
+            assert len(calls) == 1
+            await handle_find_electional_windows(tmp_db, {**args, "min_criteria": 2})
+            assert len(calls) == 2
+        finally:
+            if orig is None: sys.modules.pop(key, None)
+            else: sys.modules[key] = orig
+
+
+class TestGetEngine:
+    def test_engine_built_once_per_class(self):
+        built = []
+        class FakeEngine:
+            def __init__(self): built.append(self)
+        class OtherEngine(FakeEngine):
+            pass
+        first = _get_engine(FakeEngine)
+        assert _get_engine(FakeEngine) is first
+        assert len(built) == 1
+        assert isinstance(_get_engine(OtherEngine), OtherEngine)
+        assert len(built) == 2
+
+
+@pytest.mark.asyncio
+class TestScanPlanets:
+    async def test_small_scan_runs_in_process(self, monkeypatch):
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
+        class FakeEngine:
+            def get_planets_batch(self, **kwargs):
+                return {"jd": kwargs["jds"]}
+        jds = np.arange(10.0)
+        assert (await _scan_planets(FakeEngine(), jds))["jd"] is jds
+
+    async def test_sharded_scan_matches_in_process(self, monkeypatch):
+        pytest.importorskip("swisseph")
+        from w8s_astro_mcp.utils.ephemeris import EphemerisEngine
+
+        monkeypatch.setattr("os.cpu_count", lambda: 2)
+        monkeypatch.setattr(em, "_PARALLEL_SCAN_MIN_STEPS", 3)
+        engine = EphemerisEngine()
+        jds = 2461000.5 + np.arange(7) / 24.0
+        try:
+            sharded = await _scan_planets(engine, jds)
+        finally:
+            em._shutdown_scan_pool()
+        assert em._scan_pool is None
+        direct = engine.get_planets_batch(jds)
+        assert set(sharded) == set(direct)
+        for key in direct:
+            np.testing.assert_array_equal(sharded[key], direct[key])
+
+    async def test_shards_are_capped_and_sized(self, monkeypatch):
+        from concurrent.futures import Future
+        from w8s_astro_mcp.utils.ephemeris import planets_batch_worker
+
+        class RecordingPool:
+            def __init__(self): self.calls = []
+            def submit(self, fn, *args):
+                self.calls.append((fn, args))
+                future = Future()
+                future.set_result({"jd": args[1]})
+                return future
+
+        class FakeEngine:
+            ephe_path = None
+
+        pool = RecordingPool()
+        monkeypatch.setattr("os.cpu_count", lambda: 64)
+        monkeypatch.setattr(em, "_PARALLEL_SCAN_MIN_STEPS", 3)
+        monkeypatch.setattr(em, "_scan_pool", pool)
+
+        jds = np.arange(30.0)
+        result = await _scan_planets(FakeEngine(), jds)
+        np.testing.assert_array_equal(result["jd"], jds)
+        assert len(pool.calls) == em._SCAN_MAX_WORKERS
+        assert all(fn is planets_batch_worker for fn, _ in pool.calls)
+
+        pool.calls.clear()
+        await _scan_planets(FakeEngine(), np.arange(9.0))
+        assert [args[1].size for _, args in pool.calls] == [3, 3, 3]
+
+    async def test_broken_pool_falls_back_and_is_replaced(self, monkeypatch):
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+
+        class BrokenPool:
+            shut_down = False
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_exception(BrokenProcessPool("worker died"))
+                return future
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shut_down = True
+
+        class FakeEngine:
+            ephe_path = None
+            def get_planets_batch(self, **kwargs):
+                return {"jd": kwargs["jds"]}
+
+        broken = BrokenPool()
+        monkeypatch.setattr("os.cpu_count", lambda: 2)
+        monkeypatch.setattr(em, "_PARALLEL_SCAN_MIN_STEPS", 3)
+        monkeypatch.setattr(em, "_scan_pool", broken)
+        jds = np.arange(6.0)
+        result = await _scan_planets(FakeEngine(), jds)
+        assert result["jd"] is jds
+        assert broken.shut_down
+        assert em._scan_pool is None
+
+
 # ============================================================================
 # EVENT_TOOL_NAMES registry
 # ============================================================================
@@ -696,3 +1093,19 @@ class TestEventToolNames:
             "find_electional_windows",
         }
         assert EVENT_TOOL_NAMES == expected
+
+    def test_tool_definitions_built_once(self):
+        first, second = get_event_tools(), get_event_tools()
+        assert first is not second  # callers may extend their own list
+        assert all(a is b for a, b in zip(first, second))
+        assert {t.name for t in first} == EVENT_TOOL_NAMES
+
+    def test_dispatch_table_covers_tool_names(self):
+        assert set(_EVENT_HANDLERS) == EVENT_TOOL_NAMES
+
+    @pytest.mark.asyncio
+    async def test_dispatch_routes_and_rejects_unknown(self, tmp_db):
+        result = await handle_event_tool("list_event_charts", {}, tmp_db)
+        assert result[0].text.startswith("No saved event charts found")
+        result = await handle_event_tool("nope", {}, tmp_db)
+        assert result[0].text == "Unknown event tool: nope"
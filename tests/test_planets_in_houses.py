@@ -0,0 +1,69 @@
+"""Tests for find_planets_in_houses cusp assignment."""
+
+import random
+
+import pytest
+
+from w8s_astro_mcp.constants import ZODIAC_SIGNS
+from w8s_astro_mcp.tools.analysis_tools import AnalysisError, find_planets_in_houses
+
+
+def _body(lon: float) -> dict:
+    return {"degree": lon % 30, "sign": ZODIAC_SIGNS[int(lon // 30)]}
+
+
+def _reference_house(cusps: list, pos: float) -> int:
+    """Scalar circular-interval scan over cusps sorted by position."""
+    ordered = sorted(cusps, key=lambda c: c[1])
+    for i, (num, start) in enumerate(ordered):
+        end = ordered[(i + 1) % len(ordered)][1]
+        if start < end:
+            if start <= pos < end:
+                return num
+        elif pos >= start or pos < end:
+            return num
+    raise AssertionError("unreachable")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_circular_scan(seed):
+    rng = random.Random(seed)
+    asc = rng.uniform(0, 360)
+    offsets = sorted(rng.uniform(0, 360) for _ in range(11))
+    cusp_lons = [asc] + [(asc + o) % 360 for o in offsets]
+    houses = {str(n): _body(lon) for n, lon in enumerate(cusp_lons, start=1)}
+    planets = {f"P{i}": _body(rng.uniform(0, 360)) for i in range(40)}
+    planets["OnCusp"] = dict(houses["5"])
+
+    result = find_planets_in_houses(planets, houses)
+
+    def absolute(body):
+        return 30 * ZODIAC_SIGNS.index(body["sign"]) + body["degree"]
+
+    cusps = [(int(k), absolute(h)) for k, h in houses.items()]
+    for name, data in planets.items():
+        assert result["placements"][name] == _reference_house(cusps, absolute(data)), name
+    assert result["placements"]["OnCusp"] == 5
+    occupied = sum(1 for names in result["houses_populated"].values() if names)
+    assert result["metadata"]["houses_with_planets"] == occupied
+
+
+def test_planet_before_lowest_cusp_wraps():
+    cusp_lons = [(300 + 30 * i) % 360 + 10 for i in range(12)]  # lowest cusp at 10°
+    houses = {str(n): _body(lon) for n, lon in enumerate(cusp_lons, start=1)}
+    result = find_planets_in_houses({"Moon": _body(5.0)}, houses)
+    # 5° sits between the 340° cusp (house 2) and the 10° cusp (house 3)
+    assert result["placements"]["Moon"] == 2
+
+
+def test_no_planets():
+    houses = {str(n): _body(30.0 * (n - 1)) for n in range(1, 13)}
+    result = find_planets_in_houses({}, houses)
+    assert result["placements"] == {}
+    assert result["metadata"]["houses_with_planets"] == 0
+
+
+def test_missing_cusp_raises():
+    houses = {str(n): _body(30.0 * (n - 1)) for n in range(1, 12)}
+    with pytest.raises(AnalysisError, match="house 12"):
+        find_planets_in_houses({"Sun": _body(1.0)}, houses)
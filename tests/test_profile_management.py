@@ -142,6 +142,28 @@ async def test_list_profiles_single_profile(mock_db_helper, sample_profile_1, sa
     assert "owner" in text.lower()
 
 
+@pytest.mark.asyncio
+async def test_list_profiles_exact_layout(mock_db_helper, sample_profile_1, sample_profile_2, sample_location_1):
+    """Blank line after each profile; legend ends with a newline."""
+    mock_db_helper.list_all_profiles.return_value = [sample_profile_1, sample_profile_2]
+    mock_db_helper.get_owner_profile.return_value = sample_profile_1
+    mock_db_helper.get_birth_location.side_effect = (
+        lambda p: sample_location_1 if p.id == 1 else None
+    )
+
+    result = await handle_list_profiles(mock_db_helper)
+
+    assert result[0].text == (
+        "# Astrological Profiles\n\n"
+        "* **Todd Waits** (ID: 1)\n"
+        "  Born: 1981-05-06 at 00:50\n"
+        "  Location: Birth\n\n"
+        "  **Sarah Johnson** (ID: 2)\n"
+        "  Born: 1985-03-15 at 14:30\n\n"
+        "* Owner (you)\n"
+    )
+
+
 @pytest.mark.asyncio
 async def test_list_profiles_multiple_profiles(
     mock_db_helper, 
@@ -602,6 +624,44 @@ async def test_workflow_create_then_list(mock_db_helper, sample_profile_1, sampl
     assert "ID: 2" in text
 
 
+@pytest.mark.asyncio
+async def test_create_profile_accepts_zero_coordinates(mock_db_helper, sample_profile_2):
+    """0.0 is a real latitude/longitude (equator, prime meridian), not missing."""
+    mock_db_helper.create_profile_with_location.return_value = sample_profile_2
+    arguments = {
+        "name": "Sarah Johnson",
+        "birth_date": "1985-03-15",
+        "birth_time": "14:30",
+        "birth_location_name": "Null Island",
+        "birth_latitude": 0.0,
+        "birth_longitude": 0,
+        "birth_timezone": "UTC",
+    }
+
+    result = await handle_create_profile(mock_db_helper, arguments)
+
+    assert result[0].text.startswith("✓ Profile created successfully!")
+    assert mock_db_helper.create_profile_with_location.call_args.kwargs["birth_latitude"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_create_profile_blank_name_is_missing(mock_db_helper):
+    arguments = {
+        "name": "   ",
+        "birth_date": "1985-03-15",
+        "birth_time": "14:30",
+        "birth_location_name": "New York, NY",
+        "birth_latitude": 40.7128,
+        "birth_longitude": -74.0060,
+        "birth_timezone": "America/New_York",
+    }
+
+    result = await handle_create_profile(mock_db_helper, arguments)
+
+    assert "required" in result[0].text.lower()
+    mock_db_helper.create_profile_with_location.assert_not_called()
+
+
 # ============================================================================
 # Tests for add_location
 # ============================================================================
@@ -88,6 +88,46 @@ def test_database_helper_get_owner_profile(db_helper, temp_db):
     assert owner.name == "Primary User"
 
 
+def test_get_owner_profile_single_query(db_helper):
+    """get_owner_profile resolves AppSettings and Profile in one SELECT."""
+    from sqlalchemy import event
+
+    profile = db_helper.create_profile_with_location(
+        name="Owner", birth_date="1990-01-15", birth_time="12:00",
+        birth_location_name="Test City", birth_latitude=40.0,
+        birth_longitude=-95.0, birth_timezone="America/Chicago",
+    )
+    assert db_helper.get_owner_profile() is None
+    db_helper.set_owner_profile(profile.id)
+
+    statements = []
+    listener = lambda conn, cursor, stmt, *args: statements.append(stmt)
+    event.listen(db_helper.engine, "before_cursor_execute", listener)
+    try:
+        owner = db_helper.get_owner_profile()
+    finally:
+        event.remove(db_helper.engine, "before_cursor_execute", listener)
+
+    assert owner.id == profile.id
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+
+
+def test_engine_setup_is_per_engine(tmp_path):
+    """The FK pragma listener and session factory are per engine, not re-added per call."""
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    from w8s_astro_mcp import database
+
+    engines = [database.create_db_engine(tmp_path / f"e{i}.db") for i in range(2)]
+    assert not event.contains(Engine, "connect", database._set_sqlite_pragma)
+    for engine in engines:
+        assert event.contains(engine, "connect", database._set_sqlite_pragma)
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        assert database.get_session_factory(engine) is database.get_session_factory(engine)
+    assert database.get_session_factory(engines[0]) is not database.get_session_factory(engines[1])
+
+
 def test_get_natal_chart_with_cached_data(db_helper, temp_db):
     """Simulate get_natal_chart: store natal data then retrieve it."""
     _db_path, engine = temp_db
@@ -226,6 +266,66 @@ def test_save_natal_chart_and_retrieve(db_helper, temp_db):
     assert result["points"]["ASC"]["sign"] == "Scorpio"
 
 
+def test_save_natal_chart_returns_formatted_chart(db_helper, temp_db):
+    """save_natal_chart() returns the same dict get_natal_chart_data() would."""
+    profile = db_helper.create_profile_with_location(
+        name="Natal Return Test",
+        birth_date="1981-05-06",
+        birth_time="00:50",
+        birth_location_name="Richardson, TX",
+        birth_latitude=32.9483,
+        birth_longitude=-96.7299,
+        birth_timezone="America/Chicago",
+    )
+    fake_chart = {
+        "planets": {"Sun": {"sign": "Taurus", "degree": 15.41, "is_retrograde": False}},
+        "houses": {"1": {"sign": "Scorpio", "degree": 11.75}},
+        "points": {"ASC": {"sign": "Scorpio", "degree": 11.75}},
+    }
+
+    saved = db_helper.save_natal_chart(profile, fake_chart, house_system_id=1)
+
+    assert saved == db_helper.get_natal_chart_data(profile)
+
+
+def test_get_natal_chart_data_bulk_matches_single(db_helper, temp_db):
+    """get_natal_chart_data_bulk() returns what get_natal_chart_data() does, per profile."""
+    from sqlalchemy import event
+
+    profiles = []
+    for name, sun_sign in (("Bulk A", "Taurus"), ("Bulk B", "Leo")):
+        profile = db_helper.create_profile_with_location(
+            name=name,
+            birth_date="1981-05-06",
+            birth_time="00:50",
+            birth_location_name="Richardson, TX",
+            birth_latitude=32.9483,
+            birth_longitude=-96.7299,
+            birth_timezone="America/Chicago",
+        )
+        db_helper.save_natal_chart(profile, {
+            "planets": {"Sun": {"sign": sun_sign, "degree": 15.41, "is_retrograde": False}},
+            "houses": {"1": {"sign": "Scorpio", "degree": 11.75}},
+            "points": {"ASC": {"sign": "Scorpio", "degree": 11.75}},
+        }, house_system_id=1)
+        profiles.append(profile)
+
+    statements = []
+    listener = lambda conn, cursor, stmt, *args: statements.append(stmt)
+    event.listen(db_helper.engine, "before_cursor_execute", listener)
+    try:
+        bulk = db_helper.get_natal_chart_data_bulk(profiles)
+    finally:
+        event.remove(db_helper.engine, "before_cursor_execute", listener)
+
+    assert list(bulk) == [p.id for p in profiles]
+    for profile in profiles:
+        assert bulk[profile.id] == db_helper.get_natal_chart_data(profile)
+    assert bulk[profiles[1].id]["planets"]["Sun"]["sign"] == "Leo"
+    # planets, houses, points, house systems, locations — independent of profile count
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 5
+
+
 def test_save_natal_chart_idempotent(db_helper, temp_db):
     """Calling save_natal_chart() twice replaces old data rather than duplicating it."""
     _db_path, engine = temp_db
@@ -348,6 +448,34 @@ def test_get_transit_history_planet_sign_filter(db_helper, temp_db):
     assert rows[0]["planets"]["Mercury"]["sign"] == "Capricorn"
 
 
+def test_get_transit_history_planet_filter_narrows_planets(db_helper, temp_db):
+    """With a planet filter, each row's planets dict holds only that planet."""
+    from w8s_astro_mcp.models import TransitLookup, TransitPlanet
+
+    _db_path, engine = temp_db
+    profile = _make_profile_with_transits(db_helper, engine)
+
+    with get_session(engine) as session:
+        for lookup in session.query(TransitLookup).all():
+            session.add(TransitPlanet(
+                transit_lookup_id=lookup.id,
+                planet="Venus",
+                degree=1, minutes=0, seconds=0.0,
+                sign="Aries",
+                absolute_position=1.0,
+                is_retrograde=False,
+                calculation_method="pysweph",
+            ))
+        session.commit()
+
+    unfiltered = db_helper.get_transit_history(profile, limit=10)
+    assert all(set(r["planets"]) == {"Mercury", "Venus"} for r in unfiltered)
+
+    filtered = db_helper.get_transit_history(profile, planet="Mercury", limit=10)
+    assert len(filtered) == 2
+    assert all(set(r["planets"]) == {"Mercury"} for r in filtered)
+
+
 def test_get_transit_history_limit(db_helper, temp_db):
     """get_transit_history respects the limit parameter."""
     _db_path, engine = temp_db
@@ -543,6 +671,31 @@ def test_get_ingresses_ingress_fields(db_helper):
         assert "sign" in e
         assert "is_retrograde" in e
 
+def test_get_ingresses_steps_by_noon_julian_day(db_helper):
+    """Each scanned day is requested as noon UT by Julian Day, not by string."""
+    from unittest.mock import MagicMock
+    from datetime import date
+    import swisseph as swe
+
+    profile = db_helper.create_profile_with_location(
+        name="JD Test",
+        birth_date="1981-05-06", birth_time="00:50",
+        birth_location_name="Richardson, TX",
+        birth_latitude=32.9483, birth_longitude=-96.7299,
+        birth_timezone="America/Chicago",
+    )
+    ephem = MagicMock()
+    ephem.get_chart_jd.return_value = {"planets": {}}
+    db_helper.get_ingresses(profile, ephem, days=2, future=True)
+
+    today = date.today()
+    noon = swe.julday(today.year, today.month, today.day, 12.0)
+    jds = [c.args[0] for c in ephem.get_chart_jd.call_args_list]
+    assert jds == [noon, noon + 1, noon + 2]
+    assert ephem.get_chart_jd.call_args.args[1:] == (32.9483, -96.7299)
+    ephem.get_chart.assert_not_called()
+
+
 def test_get_ingresses_offset(db_helper):
     """offset shifts the scan window forward from today."""
     from w8s_astro_mcp.utils.ephemeris import EphemerisEngine
@@ -624,3 +777,200 @@ def test_get_ingresses_normal_excludes_offset_beyond_cap(db_helper):
     # Should not raise — just clamps silently
     events = db_helper.get_ingresses(profile, ephem, days=30, future=True, offset=999999)
     assert isinstance(events, list)
+
+
+@pytest.mark.asyncio
+async def test_get_ingresses_handler_groups_by_month():
+    """handle_get_ingresses emits one header per month and shares day labels."""
+    from unittest.mock import MagicMock, patch
+    import w8s_astro_mcp.server as srv
+
+    events = [
+        {"date": "2026-03-30", "event_type": "ingress", "planet": "Sun",
+         "detail": "enters Aries", "from_sign": "Pisces"},
+        {"date": "2026-03-30", "event_type": "station", "planet": "Mercury",
+         "detail": "stations retrograde", "sign": "Aries", "is_retrograde": True},
+        {"date": "2026-04-02", "event_type": "ingress", "planet": "Venus",
+         "detail": "enters Taurus", "from_sign": "Aries"},
+    ]
+    db = MagicMock()
+    db.get_ingresses.return_value = events
+    with patch.object(srv, "init_db", return_value=db), \
+         patch.object(srv, "init_ephemeris"):
+        result = await srv.handle_get_ingresses({"days": 30})
+
+    text = result[0].text
+    assert text.count("## March 2026") == 1
+    assert text.count("## April 2026") == 1
+    assert text.count("**Mar 30**") == 2
+    assert "**Apr 2** — Venus enters Taurus (from Aries)" in text
+    assert "**Mar 30** — Mercury ℞ stations retrograde in Aries" in text
+    assert text.endswith("_3 event(s) total_\n")
+
+
+@pytest.mark.asyncio
+async def test_get_transits_handler_formats_chart():
+    """handle_get_transits lists planets, all twelve houses, and points."""
+    from unittest.mock import MagicMock, patch
+    import w8s_astro_mcp.server as srv
+    from w8s_astro_mcp.utils.ephemeris import EphemerisEngine
+
+    db = MagicMock()
+    db.get_location_by_label.return_value = None
+    geo = {"latitude": 13.7563, "longitude": 100.5018, "name": "Bangkok, Thailand"}
+    srv._geocode_cache.clear()
+    with patch.object(srv, "init_db", return_value=db), \
+         patch.object(srv, "init_ephemeris", return_value=EphemerisEngine()), \
+         patch.object(srv, "geocode_location", return_value=geo):
+        result = await srv.handle_get_transits(
+            {"date": "2026-02-03", "time": "12:00", "location": "Bangkok"}
+        )
+
+    text = result[0].text
+    assert text.startswith("Transits for 2026-02-03 at 12:00:00\n")
+    assert "Location: Bangkok (13.7563, 100.5018)\n" in text
+    assert "  Sun: " in text and "Aquarius" in text
+    assert [line for line in text.splitlines() if line.startswith("  House ")][-1].startswith("  House 12:")
+    assert "\nSpecial Points:\n  Ascendant: " in text
+
+
+def test_cached_geocode_reuses_normalized_query():
+    """_cached_geocode hits the network once per case/whitespace-folded query."""
+    from unittest.mock import patch
+    import w8s_astro_mcp.server as srv
+
+    geo = {"latitude": 13.7563, "longitude": 100.5018, "name": "Bangkok, Thailand"}
+    srv._geocode_cache.clear()
+    try:
+        with patch.object(srv, "geocode_location", return_value=geo) as m:
+            assert srv._cached_geocode("Bangkok") is geo
+            assert srv._cached_geocode("  bangkok ") is geo
+        m.assert_called_once_with("Bangkok")
+
+        with patch.object(srv, "geocode_location", return_value=None) as m:
+            assert srv._cached_geocode("Nowhere") is None
+            assert srv._cached_geocode("Nowhere") is None
+        assert m.call_count == 2
+    finally:
+        srv._geocode_cache.clear()
+
+
+def test_cached_geocode_evicts_oldest(monkeypatch):
+    """_cached_geocode drops the oldest entry once the cap is reached."""
+    from unittest.mock import patch
+    import w8s_astro_mcp.server as srv
+
+    monkeypatch.setattr(srv, "_GEOCODE_CACHE_MAXSIZE", 2)
+    srv._geocode_cache.clear()
+    try:
+        with patch.object(srv, "geocode_location", side_effect=lambda q: {"name": q}):
+            for q in ("a", "b", "c"):
+                srv._cached_geocode(q)
+        assert list(srv._geocode_cache) == ["b", "c"]
+    finally:
+        srv._geocode_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Ephemeris file download
+# ---------------------------------------------------------------------------
+
+def test_download_file_streams_to_destination(tmp_path):
+    """_download_file copies the full response body to the destination."""
+    from w8s_astro_mcp.server import _download_file
+
+    payload = os.urandom(3 * (1 << 20) + 123)  # spans several 1 MB buffers
+    src = tmp_path / "sepl_18.se1"
+    src.write_bytes(payload)
+    dest = tmp_path / "out.se1"
+
+    _download_file(src.as_uri(), dest)
+
+    assert dest.read_bytes() == payload
+
+
+# ---------------------------------------------------------------------------
+# Home location cache (get_chart_for_date)
+# ---------------------------------------------------------------------------
+
+def test_resolve_home_location_is_cached(monkeypatch):
+    """Repeated lookups for the same profile hit the DB once until cleared."""
+    from unittest.mock import MagicMock
+    import w8s_astro_mcp.server as srv
+
+    mock_db = MagicMock()
+    monkeypatch.setattr(srv, "init_db", lambda: mock_db)
+    srv._home_location_cache.clear()
+
+    first = srv._resolve_home_location(None)
+    second = srv._resolve_home_location(None)
+
+    assert first is second
+    assert mock_db.get_owner_profile.call_count == 1
+    assert mock_db.get_current_home_location.call_count == 1
+
+    srv._home_location_cache.clear()
+    srv._resolve_home_location(None)
+    assert mock_db.get_current_home_location.call_count == 2
+    srv._home_location_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Tool dispatch table
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_every_listed_tool_has_a_handler():
+    """Each tool advertised by list_tools() is routable through TOOL_HANDLERS."""
+    from w8s_astro_mcp.server import list_tools, TOOL_HANDLERS
+
+    listed = {tool.name for tool in await list_tools()}
+    assert listed == set(TOOL_HANDLERS)
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_reported():
+    from w8s_astro_mcp.server import call_tool
+
+    result = await call_tool("no_such_tool", {})
+    assert result[0].text == "Unknown tool: no_such_tool"
+
+
+@pytest.mark.asyncio
+async def test_download_activates_files_without_touching_environ(tmp_path, monkeypatch):
+    import w8s_astro_mcp.server as srv
+
+    monkeypatch.delenv("SE_EPHE_PATH", raising=False)
+    monkeypatch.setattr(srv, "EPHE_DIR", tmp_path)
+    monkeypatch.setattr(srv, "_ephe_path_override", None)
+    monkeypatch.setattr(srv, "_download_file", lambda url, dest: dest.write_bytes(b"se1"))
+    srv.init_ephemeris.cache_clear()
+    try:
+        result = await srv.handle_download_ephemeris_files({"confirm": True})
+        assert "High-precision mode active" in result[0].text
+        assert "SE_EPHE_PATH" not in os.environ
+        assert srv.init_ephemeris().ephe_path == str(tmp_path)
+    finally:
+        srv.init_ephemeris.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# Parsed tool arguments
+# ---------------------------------------------------------------------------
+
+def test_transit_history_args_clamps_limit():
+    from w8s_astro_mcp.server import TransitHistoryArgs
+
+    args = TransitHistoryArgs.from_arguments({"limit": "500", "planet": "Mars"})
+    assert args.limit == 100
+    assert args.planet == "Mars"
+    assert TransitHistoryArgs.from_arguments({}).limit == 20
+
+
+def test_last_transit_args_coerces_house():
+    from w8s_astro_mcp.server import LastTransitArgs
+
+    args = LastTransitArgs.from_arguments({"planet": "Venus", "house": "7"})
+    assert args.house == 7
+    assert args.retrograde is None
+    assert LastTransitArgs.from_arguments({"planet": "Venus"}).house is None
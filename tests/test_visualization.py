@@ -0,0 +1,133 @@
+"""Tests for the natal chart visualization."""
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection, PathCollection
+
+from w8s_astro_mcp.tools.visualization import (
+    absolute_to_chart_angle,
+    chart_offset,
+    create_natal_chart,
+    draw_degree_markers,
+    draw_star_field,
+    sign_to_absolute_degree,
+)
+
+
+PLANETS = {
+    "Sun": {"sign": "Pisces", "degree": 24.5},
+    "Moon": {"sign": "Aries", "degree": 3.2},
+    "Venus": {"sign": "Aquarius", "degree": 11.0},
+}
+HOUSES = {str(n): {"sign": sign, "degree": 14.0} for n, sign in enumerate(
+    ["Leo", "Virgo", "Libra", "Scorpio", "Sagittarius", "Capricorn",
+     "Aquarius", "Pisces", "Aries", "Taurus", "Gemini", "Cancer"], start=1)}
+POINTS = {
+    "Ascendant": {"sign": "Leo", "degree": 14.0},
+    "MC": {"sign": "Taurus", "degree": 2.5},
+}
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+
+
+def test_star_field_is_one_collection(ax):
+    draw_star_field(ax, num_stars=150)
+    assert len(ax.lines) == 0
+    [stars] = ax.collections
+    assert isinstance(stars, PathCollection)
+    assert len(stars.get_offsets()) == 150
+    alphas = stars.get_facecolors()[:, 3]
+    assert ((alphas >= 0.3) & (alphas <= 0.9)).all()
+
+
+def test_star_field_is_reproducible(ax):
+    draw_star_field(ax, num_stars=20)
+    draw_star_field(ax, num_stars=20)
+    first, second = ax.collections
+    assert np.array_equal(first.get_offsets(), second.get_offsets())
+    assert np.array_equal(first.get_sizes(), second.get_sizes())
+
+
+def test_create_natal_chart_writes_png(tmp_path):
+    out = tmp_path / "chart.png"
+    saved = create_natal_chart(PLANETS, HOUSES, POINTS, output_path=str(out))
+    assert saved == str(out.resolve())
+    png = out.read_bytes()
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    # IHDR width: a 14-inch figure at CHART_DPI, trimmed by bbox_inches="tight"
+    width = int.from_bytes(png[16:20], "big")
+    assert 1800 < width <= 14 * 150
+
+
+def test_degree_markers_are_one_collection(ax):
+    draw_degree_markers(ax, chart_offset(0.0))
+    assert len(ax.lines) == 0
+    [ticks] = ax.collections
+    assert isinstance(ticks, LineCollection)
+    segments = ticks.get_segments()
+    assert len(segments) == 72
+    # With ASC at 0° Aries, 0° sits at 9 o'clock: a long tick from r=0.98 to 1.02
+    assert np.allclose(segments[0], [[-0.98, 0.0], [-1.02, 0.0]])
+    # 5° is a minor tick starting at r=0.99
+    assert np.hypot(*segments[1][0]) == pytest.approx(0.99)
+    assert list(ticks.get_linewidths()[:2]) == [1.5, 0.8]
+
+
+@pytest.mark.parametrize("asc", [0.0, 95.5, 359.0])
+def test_ascendant_lands_at_nine_oclock(asc):
+    offset = chart_offset(asc)
+    assert 0 <= offset < 360
+    assert absolute_to_chart_angle(asc, offset) == pytest.approx(180.0)
+    # Zodiac runs counterclockwise: 90° later sits at 6 o'clock
+    assert absolute_to_chart_angle((asc + 90) % 360, offset) == pytest.approx(270.0)
+
+
+@pytest.mark.parametrize("sign, degree, expected", [
+    ("Aries", 0.0, 0.0),
+    ("Leo", 14.0, 134.0),
+    ("Pisces", 29.5, 359.5),
+])
+def test_sign_to_absolute_degree(sign, degree, expected):
+    assert sign_to_absolute_degree(sign, degree) == expected
+
+
+def test_repeat_chart_served_from_render_cache(tmp_path, monkeypatch):
+    import w8s_astro_mcp.tools.visualization as visualization
+    monkeypatch.setattr(visualization, "_render_cache", visualization.OrderedDict())
+    renders = []
+    original = visualization._render_chart
+    monkeypatch.setattr(
+        visualization, "_render_chart",
+        lambda *args: renders.append(args) or original(*args),
+    )
+
+    first = tmp_path / "first.png"
+    second = tmp_path / "second.png"
+    create_natal_chart(PLANETS, HOUSES, POINTS, output_path=str(first))
+    create_natal_chart(PLANETS, HOUSES, POINTS, output_path=str(second))
+    assert len(renders) == 1
+    assert second.read_bytes() == first.read_bytes()
+
+    create_natal_chart(PLANETS, HOUSES, POINTS, chart_title="Other",
+                       output_path=str(second))
+    assert len(renders) == 2
+    assert second.read_bytes() != first.read_bytes()
+
+
+def test_render_cache_is_bounded(tmp_path, monkeypatch):
+    import w8s_astro_mcp.tools.visualization as visualization
+    monkeypatch.setattr(visualization, "_render_cache", visualization.OrderedDict())
+    monkeypatch.setattr(visualization, "RENDER_CACHE_MAXSIZE", 2)
+    monkeypatch.setattr(visualization, "_render_chart", lambda *args: args[3].encode())
+    for title in ("a", "b", "c"):
+        create_natal_chart(PLANETS, HOUSES, POINTS, chart_title=title,
+                           output_path=str(tmp_path / "chart.png"))
+    assert list(visualization._render_cache.values()) == [b"b", b"c"]